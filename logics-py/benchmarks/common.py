@@ -0,0 +1,50 @@
+"""
+Shared helpers for the logics-py benchmarks.
+
+Benchmarks are plain scripts, run them from the logics-py folder, e.g.
+`python -m benchmarks.parse`.
+"""
+import glob
+import os
+import timeit
+
+TESTS = os.path.join(os.path.dirname(__file__), "..", "..", "tests")
+
+
+def corpus() -> list[str]:
+    """
+    Returns all expressions from the shared lgx test cases.
+    """
+    ret = []
+
+    for filename in sorted(glob.glob(os.path.join(TESTS, "**", "*.lgx"), recursive=True)):
+        for line in open(filename, "r").read().splitlines():
+            line = line.strip()
+
+            if not line:
+                continue
+            elif line[0] == "#":
+                cmd = line[1:].split(":", 2)
+                if cmd[0].lower() == "set" and len(cmd) == 3:
+                    ret.append(cmd[2])
+            else:
+                ret.append(line)
+
+    return ret
+
+
+def measure(fn, repeat: int = 5, number: int = 1) -> float:
+    """
+    Returns the best wall time in seconds of `number` calls to fn.
+    """
+    return min(timeit.repeat(fn, repeat=repeat, number=number))
+
+
+def report(name: str, seconds: float, baseline: float | None = None, unit: str = "ms"):
+    scale = {"s": 1, "ms": 1e3, "us": 1e6, "ns": 1e9}[unit]
+    line = f"{name:<40} {seconds * scale:12.3f} {unit}"
+
+    if baseline:
+        line += f"   {baseline / seconds:6.2f}x"
+
+    print(line)
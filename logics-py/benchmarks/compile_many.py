@@ -0,0 +1,34 @@
+"""
+Compiling a rule catalogue serially, and with Logics.compile_many().
+"""
+import os
+from logics import Logics
+from .common import measure, report
+from .diskcache import catalogue
+
+
+def main(size: int = 20_000):
+    sources = catalogue(size // 2) * 2  # every rule twice
+    workers = os.cpu_count() or 1
+    print(f"Compiling {len(sources)} rules, {size // 2} distinct, {workers} CPUs")
+
+    Logics.cache.resize(0)
+    baseline = measure(lambda: [Logics(src) for src in sources], repeat=1)
+    report("serial Logics(src)", baseline, unit="s")
+
+    Logics.cache.resize(size)
+    Logics.cache.clear()
+    report("compile_many()", measure(lambda: Logics.compile_many(sources), repeat=1), baseline, unit="s")
+
+    if workers > 1:
+        Logics.cache.clear()
+        report(
+            f"compile_many(workers={workers})",
+            measure(lambda: Logics.compile_many(sources, workers=workers), repeat=1),
+            baseline,
+            unit="s",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Startup time of compiling a rule catalogue, cold and from a warm DiskCache.
+
+ASTs from the DiskCache are loaded on first use, so the warm startup is also
+measured with every AST loaded.
+"""
+import tempfile
+from logics import Logics
+from logics.diskcache import DiskCache
+from .common import corpus, measure, report
+
+
+def catalogue(size: int) -> list[str]:
+    """
+    Generates distinct rules from the lgx corpus.
+    """
+    sources = [src for src in corpus() if _valid(src)]
+    return [f"{sources[i % len(sources)]} + {i}" for i in range(size)]
+
+
+def _valid(src):
+    try:
+        Logics(src + " + 0")
+        return True
+    except Exception:
+        return False
+
+
+def compile_all(sources, load: bool = False):
+    Logics.cache.clear()
+    for src in sources:
+        logics = Logics(src)
+        if load:
+            logics.ast.emit
+
+
+def main(size: int = 20_000):
+    sources = catalogue(size)
+    print(f"Compiling {len(sources)} rules")
+
+    Logics.cache.resize(0)
+    Logics.disk_cache = None
+    cold = measure(lambda: compile_all(sources), repeat=1)
+    report("parse", cold, unit="s")
+
+    with tempfile.TemporaryDirectory() as path:
+        Logics.disk_cache = DiskCache(path)
+        compile_all(sources)
+        Logics.disk_cache.flush()
+
+        def warm(load=False):
+            Logics.disk_cache = DiskCache(path)
+            compile_all(sources, load)
+
+        report("DiskCache", measure(warm, repeat=3), cold, unit="s")
+        report("DiskCache, loaded", measure(lambda: warm(True), repeat=3), cold, unit="s")
+        Logics.disk_cache.close()
+        Logics.disk_cache = None
+
+
+if __name__ == "__main__":
+    main()
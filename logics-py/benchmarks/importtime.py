@@ -0,0 +1,37 @@
+"""
+Import time of logics, as reported by `python -X importtime -c "import logics"`.
+"""
+import subprocess
+import sys
+
+
+def importtime(code: str = "import logics") -> dict[str, tuple[int, int]]:
+    """
+    Returns self and cumulative import times in microseconds per module.
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+    ret = {}
+
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        own, cumulative, name = line[len("import time:") :].split("|")
+        ret[name.strip()] = (int(own), int(cumulative))
+
+    return ret
+
+
+def main(repeat: int = 10):
+    runs = [importtime() for _ in range(repeat)]
+    best = {name: min(run[name] for run in runs if name in run) for name in runs[0]}
+
+    print(f"{'module':<40} {'self [us]':>12} {'cumulative [us]':>16}")
+    for name, (own, cumulative) in sorted(best.items(), key=lambda item: -item[1][1])[:15]:
+        print(f"{name:<40} {own:12} {cumulative:16}")
+
+    print(f"\nimport logics: {best['logics'][1] / 1000:.3f} ms (best of {repeat})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Retained memory per AST node of LogicsParser and LogicsFastParser, measured with tracemalloc.
+"""
+import tracemalloc
+from logics.parser import LogicsParser, LogicsParseException
+from logics.fastparser import LogicsFastParser
+from .common import corpus
+
+
+def count(node) -> int:
+    stack = [node]
+    ret = 0
+
+    while stack:
+        node = stack.pop()
+        stack.extend(node.children)
+        ret += 1
+
+    return ret
+
+
+def retained(parser, sources, copies: int) -> tuple[int, int]:
+    """
+    Returns the retained bytes and number of nodes of parsing all sources copies times.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    asts = []
+    for _ in range(copies):
+        for src in sources:
+            asts.append(parser.parse(src))
+
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    # Don't count the list holding the ASTs
+    return size - asts.__sizeof__(), sum(count(ast) for ast in asts)
+
+
+def main(copies: int = 10):
+    sources = []
+    for src in corpus():
+        try:
+            LogicsParser().parse(src)
+            sources.append(src)
+        except LogicsParseException:
+            pass
+
+    fast = LogicsFastParser()
+    fast.tables()  # don't count the tables
+
+    for name, parser in (("LogicsParser", LogicsParser()), ("LogicsFastParser", fast)):
+        size, nodes = retained(parser, sources, copies)
+        print(f"{name:<40} {nodes:8} nodes {size / nodes:8.1f} bytes/node")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Micro-benchmarks of the Value operators, comparing their fast paths for ints
+and floats with the generic path, which an operand of another type takes.
+"""
+import operator
+from logics import Value
+from .common import measure, report
+
+# Operators with their generic operand, True for arithmetic and None for comparisons
+OPERATORS = {
+    "+": (operator.add, Value(True)),
+    "-": (operator.sub, Value(True)),
+    "*": (operator.mul, Value(True)),
+    "/": (operator.truediv, Value(True)),
+    "//": (operator.floordiv, Value(True)),
+    "%": (operator.mod, Value(True)),
+    "<": (operator.lt, Value(None)),
+    "<=": (operator.le, Value(None)),
+    ">": (operator.gt, Value(None)),
+    ">=": (operator.ge, Value(None)),
+}
+
+OPERANDS = {
+    "int": (Value(1234), Value(7)),
+    "float": (Value(12.5), Value(2.5)),
+}
+
+
+def main(number: int = 100_000):
+    for name, (op, other) in OPERATORS.items():
+        for kind, (a, b) in OPERANDS.items():
+            if name == "//" and kind == "float":
+                continue  # floors the truncated ints, so there is no fast path
+
+            generic = measure(lambda: op(a, other), number=number) / number
+            fast = measure(lambda: op(a, b), number=number) / number
+
+            report(f"{kind} {name} {other.type()} (generic)", generic, unit="ns")
+            report(f"{kind} {name} {kind}", fast, generic, unit="ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Parse speed of LogicsParser compared to LogicsFastParser on the lgx corpus,
+and on list literals of 1k, 10k and 100k elements.
+"""
+from logics.parser import LogicsParser, LogicsParseException
+from logics.fastparser import LogicsFastParser
+from .common import corpus, measure, report
+
+
+def parse_all(parser, sources):
+    for src in sources:
+        try:
+            parser.parse(src)
+        except LogicsParseException:
+            pass
+
+
+def main():
+    sources = corpus()
+    print(f"Parsing {len(sources)} expressions from tests/*.lgx")
+
+    baseline = measure(lambda: parse_all(LogicsParser(), sources))
+    report("LogicsParser", baseline)
+
+    fast = LogicsFastParser()
+    fast.tables()  # build tables outside of measurement
+    report("LogicsFastParser (dfa lexer)", measure(lambda: parse_all(LogicsFastParser("dfa"), sources)), baseline)
+    report("LogicsFastParser", measure(lambda: parse_all(fast, sources)), baseline)
+
+    for size in (1_000, 10_000, 100_000):
+        src = "[" + ", ".join(str(i) for i in range(size)) + "]"
+        print(f"\nParsing a list literal of {size} elements, {len(src)} bytes")
+
+        # LogicsParser is quadratic on input length, only run it on the smallest input.
+        baseline = measure(lambda: LogicsParser().parse(src), repeat=1) if size <= 1_000 else None
+        if baseline:
+            report("LogicsParser", baseline)
+
+        report("LogicsFastParser", measure(lambda: fast.parse(src), repeat=3), baseline)
+
+
+if __name__ == "__main__":
+    main()
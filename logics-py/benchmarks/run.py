@@ -0,0 +1,75 @@
+"""
+Run speed of the execution backends on the lgx corpus and on a typical rule.
+"""
+from logics import Logics
+from logics.parser import LogicsParseException
+from .common import corpus, measure, report
+
+RULE = "price * quantity * (1 - discount) if customer in ['gold', 'silver'] and quantity > 10 else price * quantity"
+VALUES = {"price": 12.5, "quantity": 20, "discount": 0.1, "customer": "gold"}
+TYPES = {"price": float, "quantity": int, "discount": float, "customer": str}
+CONSTANT = "price * (1 + 19 / 100) * 60 * 60 * 24 > upper('x') * 10000 + len(range(100))"
+
+
+def compile_all(sources, backend):
+    ret = []
+    for src in sources:
+        try:
+            ret.append(Logics(src, backend=backend))
+        except LogicsParseException:
+            pass
+
+    return ret
+
+
+def run_all(compiled):
+    values = dict(VALUES)
+    for logics in compiled:
+        logics.run(values)
+
+
+def main(number: int = 1000):
+    sources = corpus()
+    print(f"Running {len(sources)} expressions from tests/*.lgx")
+
+    baseline = None
+    for backend in Logics.BACKENDS:
+        compiled = compile_all(sources, backend)
+        seconds = measure(lambda: run_all(compiled), repeat=3, number=10)
+        report(backend, seconds / 10, baseline)
+        baseline = baseline or seconds / 10
+
+    print(f"\nRunning {RULE!r}")
+
+    baseline = None
+    for backend in Logics.BACKENDS:
+        logics = Logics(RULE, backend=backend)
+        seconds = measure(lambda: logics.run(VALUES), number=number) / number
+        report(backend, seconds, baseline, unit="us")
+        baseline = baseline or seconds
+
+    print("\nRunning the same rule generic, with type feedback, and with declared types")
+
+    for backend in Logics.BACKENDS[1:]:
+        baseline = None
+        for mode in ("generic", "feedback", "types"):
+            logics = Logics(RULE, backend=backend, types=TYPES if mode == "types" else None)
+            if mode == "generic":
+                logics.PROFILE_RUNS = 0
+
+            seconds = measure(lambda: logics.run(VALUES), number=number) / number
+            report(f"{backend}, {mode}", seconds, baseline, unit="us")
+            baseline = baseline or seconds
+
+    print(f"\nRunning {CONSTANT!r}")
+
+    baseline = None
+    for optimize in (False, True):
+        logics = Logics(CONSTANT, optimize=optimize)
+        seconds = measure(lambda: logics.run(VALUES), number=number) / number
+        report(f"closure, {optimize=}", seconds, baseline, unit="us")
+        baseline = baseline or seconds
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Micro-benchmarks of Value construction, operators and memory per Value.
+"""
+import functools
+import operator
+import tracemalloc
+from logics import Value
+from logics.value import concat
+from .common import measure, report
+
+A = Value(1234)
+B = Value(56.5)
+S = Value("abc")
+N = Value(" 12kg")
+L = Value([1, 2, 3])
+ROWS = [{"id": i, "name": f"row{i}", "tags": ["a", "b"]} for i in range(10_000)]
+R = Value(ROWS)
+ZIPS = Value([f"{i:05}" for i in range(8000)])
+PARTS = [Value("x" * 1000) for _ in range(30)]
+
+CASES = {
+    "Value(None)": lambda: Value(None),
+    "Value(True)": lambda: Value(True),
+    "Value(7)": lambda: Value(7),
+    "Value(1234)": lambda: Value(1234),
+    "Value(56.5)": lambda: Value(56.5),
+    "Value('abc')": lambda: Value("abc"),
+    "Value('12345')": lambda: Value("12345"),
+    "Value('7-Logics')": lambda: Value("7-Logics"),
+    "str - int": lambda: N - A,
+    "Value(Value)": lambda: Value(A),
+    "int + int": lambda: A + A,
+    "int * float": lambda: A * B,
+    "float / int": lambda: B / A,
+    "str + int": lambda: S + A,
+    "int < float": lambda: A < B,
+    "int == int": lambda: A == A,
+    "-int": lambda: -A,
+    "int in list": lambda: A in L,
+    "str in 8k list": lambda: "07999" in ZIPS,
+    "30 x 1k str, pairwise": lambda: functools.reduce(operator.add, PARTS),
+    "30 x 1k str, concat()": lambda: concat(*PARTS),
+    "type()": lambda: B.type(),
+    "Value(10k rows)": lambda: Value(ROWS),
+    "rows[i][key]": lambda: R[5000]["name"],
+}
+
+
+def retained(fn, count: int) -> float:
+    """
+    Returns the retained bytes per Value of count calls to fn.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    values = [fn(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(values) == count
+    return (after - before) / count
+
+
+def main(number: int = 100_000):
+    for name, fn in CASES.items():
+        report(name, measure(fn, number=number) / number, unit="ns")
+
+    print()
+
+    count = 10_000
+    for name, fn in {
+        "int": lambda i: Value(i + 1000),
+        "float": lambda i: Value(i + 0.5),
+        "str": lambda i: Value(f"x{i}"),
+        "small int": lambda i: Value(i % 100),
+    }.items():
+        print(f"{'bytes per ' + name + ' Value':<40} {retained(fn, count):12.1f}")
+
+
+if __name__ == "__main__":
+    main()
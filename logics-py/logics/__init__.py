@@ -1,3 +1,12 @@
 from .logics import Logics
 from .value import Value
-from .parser import LogicsParseException as ParseException
+
+
+def __getattr__(name):
+    # The generated parser module is only loaded on demand.
+    if name == "ParseException":
+        from .parser import LogicsParseException
+
+        return LogicsParseException
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,143 @@
+# This module was generated from parser.py by `python -m logics.tables`.
+# DO NOT EDIT THIS FILE MANUALLY, IT WILL GO AWAY!
+
+SYMBOLS = (
+    ("&eof", "", 3, False, False, True),
+    ("for", "", 2, False, False, True),
+    ("None", "None", 2, False, False, True),
+    ("False", "False", 2, False, False, True),
+    ("True", "True", 2, False, False, True),
+    ("**", "", 2, False, False, True),
+    ("//", "", 2, False, False, True),
+    ("in", "", 2, False, False, True),
+    ("<>", "", 2, False, False, True),
+    ("!=", "", 2, False, False, True),
+    ("<=", "", 2, False, False, True),
+    ("<", "", 2, False, False, True),
+    (">=", "", 2, False, False, True),
+    (">", "", 2, False, False, True),
+    ("==", "", 2, False, False, True),
+    ("not", "", 2, False, False, True),
+    ("and", "", 2, False, False, True),
+    ("or", "", 2, False, False, True),
+    ("else", "", 2, False, False, True),
+    ("if", "", 2, False, False, True),
+    ("String", "String", 2, False, False, False),
+    ("Number", "Number", 2, False, False, True),
+    ("Identifier", "Identifier", 2, False, False, True),
+    ("whitespace", "", 2, False, True, True),
+    (",", "", 1, False, False, True),
+    (".", "", 1, False, False, True),
+    (":", "", 1, False, False, True),
+    ("]", "", 1, False, False, True),
+    ("[", "", 1, False, False, True),
+    (")", "", 1, False, False, True),
+    ("(", "", 1, False, False, True),
+    ("~", "", 1, False, False, True),
+    ("%", "", 1, False, False, True),
+    ("/", "", 1, False, False, True),
+    ("*", "", 1, False, False, True),
+    ("-", "", 1, False, False, True),
+    ("+", "", 1, False, False, True),
+    ("expression'", "", 0, False, False, True),
+    (",?", "", 0, False, False, True),
+    ("internal_list", "", 0, False, False, True),
+    ("&embedded_2?", "", 0, False, False, True),
+    ("&embedded_2", "", 0, False, False, True),
+    ("String+", "", 0, False, False, True),
+    ("opt_expression", "", 0, False, False, True),
+    ("list?", "", 0, False, False, True),
+    ("list", "", 0, False, False, True),
+    ("trailer+", "", 0, False, False, True),
+    ("trailer", "", 0, False, False, True),
+    ("atom", "", 0, False, False, True),
+    ("factor", "", 0, False, False, True),
+    ("pow", "", 0, False, False, True),
+    ("unary", "", 0, False, False, True),
+    ("mul_div", "", 0, False, False, True),
+    ("&embedded_1+", "", 0, False, False, True),
+    ("&embedded_1", "", 0, False, False, True),
+    ("&embedded_0", "", 0, False, False, True),
+    ("add_sub", "", 0, False, False, True),
+    ("cmp", "", 0, False, False, True),
+    ("not", "", 0, False, False, True),
+    ("and", "", 0, False, False, True),
+    ("or", "", 0, False, False, True),
+    ("expression", "", 0, False, False, True),
+)
+PRODUCTIONS = (
+    ("if", 5, 61),
+    ("", 1, 61),
+    ("or", 3, 60),
+    ("", 1, 60),
+    ("and", 3, 59),
+    ("", 1, 59),
+    ("not", 2, 58),
+    ("", 1, 58),
+    ("cmp", 2, 57),
+    ("eq", 2, 54),
+    ("gt", 2, 54),
+    ("gteq", 2, 54),
+    ("lt", 2, 54),
+    ("lteq", 2, 54),
+    ("", 1, 55),
+    ("", 1, 55),
+    ("neq", 2, 54),
+    ("in", 2, 54),
+    ("outer", 3, 54),
+    ("", 2, 53),
+    ("", 1, 53),
+    ("", 1, 57),
+    ("add", 3, 56),
+    ("sub", 3, 56),
+    ("", 1, 56),
+    ("mul", 3, 52),
+    ("div", 3, 52),
+    ("idiv", 3, 52),
+    ("mod", 3, 52),
+    ("", 1, 52),
+    ("pow", 3, 50),
+    ("", 1, 50),
+    ("pos", 2, 51),
+    ("neg", 2, 51),
+    ("invert", 2, 51),
+    ("", 1, 51),
+    ("", 1, 49),
+    ("entity", 2, 49),
+    ("", 2, 46),
+    ("", 1, 46),
+    ("call", 4, 49),
+    ("", 1, 44),
+    ("", 0, 44),
+    ("", 1, 43),
+    ("None", 0, 43),
+    ("index", 3, 47),
+    ("slice", 5, 47),
+    ("attr", 2, 47),
+    ("", 1, 48),
+    ("", 1, 48),
+    ("", 1, 48),
+    ("", 1, 48),
+    ("load", 1, 48),
+    ("", 1, 48),
+    ("", 2, 42),
+    ("", 1, 42),
+    ("strings", 1, 48),
+    ("comprehension", 8, 48),
+    ("", 2, 41),
+    ("", 1, 40),
+    ("", 0, 40),
+    ("", 3, 48),
+    ("list", 4, 48),
+    ("list", 6, 48),
+    ("", 1, 38),
+    ("", 0, 38),
+    ("", 3, 48),
+    ("", 1, 39),
+    ("", 3, 39),
+    ("list", 2, 45),
+    ("", 2, 37),
+)
+ACT = b'\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x01\x00\x1e\x00\x02\x00\x11\x00\x01\x00\x14\x00\x01\x007\x00\x01\x00\x00\x00\x03\x00F\x00\x02\x00\x13\x00\x02\x00\x12\x00\x11\x00\x02\x00\x13\x00\x01\x00\x10\x00\x02\x00\x14\x00\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0b\x00\x0f\x00\x02\x00\x15\x00\x0e\x00\x02\x00\x16\x00\r\x00\x02\x00\x17\x00\x0c\x00\x02\x00\x18\x00\x0b\x00\x02\x00\x19\x00\n\x00\x02\x00\x1a\x00\t\x00\x03\x00\x0e\x00\x08\x00\x03\x00\x0f\x00\x07\x00\x02\x00\x1c\x00$\x00\x02\x00\x1e\x00#\x00\x02\x00\x1f\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x04\x00"\x00\x02\x00 \x00!\x00\x02\x00!\x00\x06\x00\x02\x00"\x00 \x00\x02\x00#\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x01\x00\x05\x00\x02\x00$\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x02\x00\x1c\x00\x02\x00&\x00\x19\x00\x02\x00\'\x00\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x01\x00\x14\x00\x03\x006\x00\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x01\x00\x07\x00\x02\x00/\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\t\x00\x0f\x00\x02\x00\x15\x00\x0e\x00\x02\x00\x16\x00\r\x00\x02\x00\x17\x00\x0c\x00\x02\x00\x18\x00\x0b\x00\x02\x00\x19\x00\n\x00\x02\x00\x1a\x00\t\x00\x03\x00\x0e\x00\x08\x00\x03\x00\x0f\x00\x07\x00\x02\x00\x1c\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x02\x00\x1c\x00\x02\x00&\x00\x19\x00\x02\x00\'\x00\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x01\x00\x16\x00\x03\x00/\x00\x02\x00\x1d\x00\x03\x00B\x00\x18\x00\x02\x00;\x00\x01\x00\x01\x00\x02\x00<\x00\x01\x00\x1b\x00\x03\x00=\x00\x01\x00\x18\x00\x02\x00=\x00\x01\x00\x1d\x00\x03\x00(\x00\x01\x00\x12\x00\x02\x00>\x00\x01\x00\x10\x00\x02\x00\x14\x00\x0b\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x02\x00$\x00\x02\x00\x1e\x00#\x00\x02\x00\x1f\x00\x02\x00$\x00\x02\x00\x1e\x00#\x00\x02\x00\x1f\x00\x02\x00$\x00\x02\x00\x1e\x00#\x00\x02\x00\x1f\x00\x02\x00$\x00\x02\x00\x1e\x00#\x00\x02\x00\x1f\x00\x02\x00$\x00\x02\x00\x1e\x00#\x00\x02\x00\x1f\x00\x02\x00$\x00\x02\x00\x1e\x00#\x00\x02\x00\x1f\x00\x02\x00$\x00\x02\x00\x1e\x00#\x00\x02\x00\x1f\x00\x04\x00"\x00\x02\x00 \x00!\x00\x02\x00!\x00\x06\x00\x02\x00"\x00 \x00\x02\x00#\x00\x04\x00"\x00\x02\x00 \x00!\x00\x02\x00!\x00\x06\x00\x02\x00"\x00 \x00\x02\x00#\x00\x01\x00\x1b\x00\x03\x00-\x00\x01\x00\x1a\x00\x02\x00@\x00\r\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1d\x00\x03\x00>\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x01\x00\x16\x00\x02\x00B\x00\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x02\x00$\x00\x02\x00\x1e\x00#\x00\x02\x00\x1f\x00\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x01\x00\x18\x00\x02\x00=\x00\x01\x00\x07\x00\x02\x00E\x00\x01\x00\x1b\x00\x03\x00.\x00\x01\x00\x1d\x00\x03\x00?\x00\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x02\x00\x13\x00\x02\x00G\x00\x11\x00\x02\x00\x13\x00\x0c\x00\x16\x00\x02\x00\x01\x00\x15\x00\x03\x003\x00\x14\x00\x02\x00\x02\x00\x0f\x00\x02\x00\x06\x00$\x00\x02\x00\x08\x00#\x00\x02\x00\n\x00\x1f\x00\x02\x00\x0c\x00\x1e\x00\x02\x00\x0e\x00\x1c\x00\x02\x00\x0f\x00\x04\x00\x03\x000\x00\x03\x00\x03\x001\x00\x02\x00\x03\x002\x00\x01\x00\x1b\x00\x03\x009\x00'
+GO = b"\x0c\x00=\x00\x02\x00\x03\x00<\x00\x02\x00\x04\x00;\x00\x02\x00\x05\x00:\x00\x03\x00\x05\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\t\x00:\x00\x03\x00\x06\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x03\x007\x00\x02\x00\x1b\x006\x00\x03\x00\x14\x005\x00\x02\x00\x1d\x00\x04\x003\x00\x03\x00 \x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x00\x00\x04\x003\x00\x03\x00!\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x00\x00\x04\x003\x00\x03\x00\"\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x02\x00/\x00\x03\x00'\x00.\x00\x02\x00%\x00\x0c\x00=\x00\x02\x00(\x00<\x00\x02\x00\x04\x00;\x00\x02\x00\x05\x00:\x00\x03\x00\x05\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x0e\x00=\x00\x02\x00)\x00<\x00\x02\x00\x04\x00;\x00\x02\x00\x05\x00:\x00\x03\x00\x05\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00-\x00\x02\x00*\x00*\x00\x02\x00\x10\x00'\x00\x02\x00+\x00\x00\x00\x0f\x00=\x00\x03\x00C\x00<\x00\x02\x00\x04\x00;\x00\x02\x00\x05\x00:\x00\x03\x00\x05\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00-\x00\x03\x00)\x00,\x00\x02\x00,\x00*\x00\x02\x00\x10\x00'\x00\x02\x00+\x00\x0c\x00=\x00\x02\x00-\x00<\x00\x02\x00\x04\x00;\x00\x02\x00\x05\x00:\x00\x03\x00\x05\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\n\x00;\x00\x02\x00.\x00:\x00\x03\x00\x05\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\t\x00:\x00\x03\x00\x04\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x00\x00\x07\x008\x00\x02\x000\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x07\x008\x00\x02\x001\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x07\x008\x00\x02\x002\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x07\x008\x00\x02\x003\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x07\x008\x00\x02\x004\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x07\x008\x00\x02\x005\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x07\x008\x00\x02\x006\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x02\x007\x00\x02\x00\x1b\x006\x00\x03\x00\x13\x00\x06\x004\x00\x02\x007\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x06\x004\x00\x02\x008\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x04\x003\x00\x03\x00\x19\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x04\x003\x00\x03\x00\x1a\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x04\x003\x00\x03\x00\x1b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x04\x003\x00\x03\x00\x1c\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x04\x003\x00\x03\x00\x1e\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x01\x00/\x00\x03\x00&\x00\r\x00=\x00\x02\x009\x00<\x00\x02\x00\x04\x00;\x00\x02\x00\x05\x00:\x00\x03\x00\x05\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00+\x00\x02\x00:\x00*\x00\x02\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00&\x00\x03\x00E\x00\x00\x00\x00\x00\x00\x00\x07\x008\x00\x02\x00?\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\r\x00=\x00\x03\x00C\x00<\x00\x02\x00\x04\x00;\x00\x02\x00\x05\x00:\x00\x03\x00\x05\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00'\x00\x02\x00A\x00\x00\x00\x0c\x00=\x00\x03\x00D\x00<\x00\x02\x00\x04\x00;\x00\x02\x00\x05\x00:\x00\x03\x00\x05\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x0c\x00=\x00\x03\x00\x00\x00<\x00\x02\x00\x04\x00;\x00\x02\x00\x05\x00:\x00\x03\x00\x05\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x00\x00\r\x00=\x00\x03\x00+\x00<\x00\x02\x00\x04\x00;\x00\x02\x00\x05\x00:\x00\x03\x00\x05\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00+\x00\x02\x00C\x00*\x00\x02\x00\x10\x00\x01\x00&\x00\x02\x00D\x00\x00\x00\x00\x00\x00\x00\x0b\x00<\x00\x02\x00F\x00;\x00\x02\x00\x05\x00:\x00\x03\x00\x05\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x02\x00)\x00\x03\x00;\x00(\x00\x02\x00H\x00\x0c\x00=\x00\x03\x00:\x00<\x00\x02\x00\x04\x00;\x00\x02\x00\x05\x00:\x00\x03\x00\x05\x009\x00\x03\x00\x07\x008\x00\x02\x00\x07\x004\x00\x02\x00\t\x003\x00\x03\x00\x1f\x002\x00\x02\x00\x0b\x001\x00\x03\x00#\x000\x00\x02\x00\r\x00*\x00\x02\x00\x10\x00\x00\x00"
+DEF_PROD = b"\xff\xff4\x005\x00\xff\xff\x01\x00\x03\x00\xff\xff\x15\x00\xff\xff\x18\x00\xff\xff\x1d\x00\xff\xff$\x00\xff\xff\xff\xff8\x00*\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x08\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff%\x00,\x00\xff\xff\xff\xffC\x00\xff\xffA\x00\xff\xff\xff\xff\x02\x00\xff\xff\t\x00\n\x00\x0b\x00\x0c\x00\r\x00\x10\x00\x11\x00\x16\x00\x17\x00+\x00\xff\xff\xff\xff\xff\xff@\x00\xff\xff\x12\x00,\x00A\x00\xff\xff\xff\xff\xff\xff\xff\xff<\x00\xff\xff\xff\xff"
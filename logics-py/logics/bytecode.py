@@ -0,0 +1,450 @@
+"""
+Flat bytecode for Logics ASTs, and an iterative VM running it.
+
+compile() translates an AST into a tuple of (opcode, argument) instructions,
+where flow operations become jumps. Neither compiling nor running recurses,
+so the nesting depth of expressions is only limited by memory. The bytecode
+only depends on the AST and is cached in bytecode.cache, disassemble()
+returns a readable listing for debugging.
+"""
+import operator
+from .cache import LRUCache
+from .fastparser import Node
+from .inference import SPECIALIZED, additions
+from .logics import _Stack
+from .value import Value, attribute, concat, parse_float, parse_int, unescape, wrap
+
+# Process-wide cache of compiled bytecode, keyed by the AST.
+cache: LRUCache = LRUCache(maxsize=4096)
+
+# Opcodes
+CONST = 0  # push arg
+LOAD = 1  # push variable arg
+LOAD_VARS = 2  # push all variables
+BINARY = 3  # pop b, a, push arg(a, b)
+UNARY = 4  # pop a, push arg(a)
+NOT = 5  # pop a, push not a
+TEST = 6  # pop b, a, push bool arg(a, b)
+GETITEM = 7  # pop index, value, push value[index]
+SLICE = 8  # pop end, start, value, push end
+BUILD_LIST = 9  # pop arg values, push them as list
+CALL = 10  # pop arg[1] arguments, or one list of arguments if it's -1, call function arg[0]
+COMPARE = 11  # pop b, a, push b if arg[0](a, b), otherwise push False and jump to arg[1]
+JUMP = 12  # jump to arg
+JUMP_IF_FALSE_OR_POP = 13  # jump to arg if top is false, otherwise pop
+JUMP_IF_TRUE_OR_POP = 14  # jump to arg if top is true, otherwise pop
+POP_JUMP_IF_FALSE = 15  # pop, and jump to arg if it was false
+POP = 16  # pop and discard
+FOR_START = 17  # pop iterable, push loop state
+FOR_ITER = 18  # assign next item to variable arg[0], or jump to arg[1] when done
+FOR_APPEND = 19  # pop, and append to result of loop
+FOR_END = 20  # pop loop state, push its result
+FRAME = 21  # allocate arg memo slots for common subexpressions
+MEMO = 22  # push memo slot arg[0] and jump to arg[1] if it is set
+STORE = 23  # store top into memo slot arg
+GETATTR = 24  # pop value, push its attribute arg
+CONCAT = 25  # pop arg values, push their sum
+BOUNDED = 26  # pop b, a, push arg(a, b, limit of int bits)
+
+OPNAMES = (
+    "CONST",
+    "LOAD",
+    "LOAD_VARS",
+    "BINARY",
+    "UNARY",
+    "NOT",
+    "TEST",
+    "GETITEM",
+    "SLICE",
+    "BUILD_LIST",
+    "CALL",
+    "COMPARE",
+    "JUMP",
+    "JUMP_IF_FALSE_OR_POP",
+    "JUMP_IF_TRUE_OR_POP",
+    "POP_JUMP_IF_FALSE",
+    "POP",
+    "FOR_START",
+    "FOR_ITER",
+    "FOR_APPEND",
+    "FOR_END",
+    "FRAME",
+    "MEMO",
+    "STORE",
+    "GETATTR",
+    "CONCAT",
+    "BOUNDED",
+)
+
+_JUMPS = (JUMP, JUMP_IF_FALSE_OR_POP, JUMP_IF_TRUE_OR_POP, POP_JUMP_IF_FALSE)
+
+
+def _in(a, b):
+    return a in b
+
+
+def _not_in(a, b):
+    return a not in b
+
+
+_UNARY = {
+    "invert": operator.invert,
+    "neg": operator.neg,
+    "pos": operator.pos,
+}
+
+_BINARY = {
+    "add": operator.add,
+    "div": operator.truediv,
+    "idiv": operator.floordiv,
+    "mod": operator.mod,
+    "sub": operator.sub,
+}
+
+_BOUNDED = {
+    "mul": Value.multiply,
+    "pow": Value.power,
+}
+
+_COMPARE = {
+    "eq": operator.eq,
+    "neq": operator.ne,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "in": _in,
+    "outer": _not_in,
+}
+
+_FALSE = Value(False)
+_TRUE = Value(True)
+
+
+class _Label:
+    """
+    Only used internally;
+    A jump target, resolved when the code is complete.
+    """
+
+    __slots__ = ("pc",)
+
+
+def _expand(node: Node) -> list:
+    """
+    Returns the nodes, instructions and labels a node compiles into, in order.
+    """
+    children = node.children
+
+    match node.emit:
+        # Flow operations
+        case "and":
+            end = _Label()
+            return [children[0], (JUMP_IF_FALSE_OR_POP, end), children[1], end]
+
+        case "or":
+            end = _Label()
+            return [children[0], (JUMP_IF_TRUE_OR_POP, end), children[1], end]
+
+        case "cmp":
+            end = _Label()
+            ret = [children[0]]
+            for op in children[1:]:
+                ret += [op.children[0], (COMPARE, (SPECIALIZED.get((op.emit, op.match), _COMPARE[op.emit]), end))]
+
+            return ret + [(POP, None), (CONST, _TRUE), end]
+
+        case "call":
+            fname = children[0].match
+            if len(children) == 1:
+                return [(CALL, (fname, 0))]
+            elif children[1].emit == "list":
+                return list(children[1].children) + [(CALL, (fname, len(children[1].children)))]
+
+            return [children[1], (CALL, (fname, -1))]
+
+        case "comprehension":
+            loop = _Label()
+            end = _Label()
+            ret = [children[2], (FOR_START, None), loop, (FOR_ITER, (children[1].match, end))]
+
+            if len(children) > 3:
+                ret += [children[3], (POP_JUMP_IF_FALSE, loop)]
+
+            return ret + [children[0], (FOR_APPEND, None), (JUMP, loop), end, (FOR_END, None)]
+
+        case "if":
+            other = _Label()
+            end = _Label()
+            return [children[1], (POP_JUMP_IF_FALSE, other), children[0], (JUMP, end), other, children[2], end]
+
+        # Values
+        case "False":
+            return [(CONST, _FALSE)]
+        case "Identifier":
+            return [(CONST, Value(node.match))]
+        case "None":
+            return [(CONST, Value(None))]
+        case "Number":
+            return [(CONST, Value(parse_float(node.match) if "." in node.match else parse_int(node.match)))]
+        case "String":
+            return [(CONST, Value(unescape(node.match[1:-1])))]  # cut "..." from string.
+        case "True":
+            return [(CONST, _TRUE)]
+
+        case "const":
+            return [(CONST, node.match)]  # pre-converted by the optimizer
+
+        # Common subexpressions, evaluated once per run
+        case "frame":
+            return [(FRAME, node.match), children[0]]
+        case "cse":
+            end = _Label()
+            return [(MEMO, (node.match, end)), children[0], (STORE, node.match), end]
+
+        case "strings":
+            return [(CONST, Value("".join(unescape(child.match[1:-1]) for child in children)))]
+
+        case "list":
+            return list(children) + [(BUILD_LIST, len(children))]
+
+        case "load":
+            if (name := children[0].match) == "vars":
+                return [(LOAD_VARS, None)]
+
+            return [(LOAD, name)]
+
+        case "entity":
+            return list(children)
+
+        # Trailers, applied to the value of the preceding entity part
+        case "attr":
+            return [(GETATTR, children[0].match)]
+        case "index":
+            return [children[0], (GETITEM, None)]
+        case "slice":
+            # Slices are not implemented by the VM yet, the upper bound becomes the result.
+            return list(children) + [(SLICE, None)]
+
+        # Operations
+        case "not":
+            return [children[0], (NOT, None)]
+        case "in" | "outer":
+            return list(children) + [(TEST, _COMPARE[node.emit])]
+
+        case emit if emit in _UNARY:
+            return [children[0], (UNARY, SPECIALIZED.get((emit, node.match), _UNARY[emit]))]
+        case "add" if len(operands := additions(node)) > 2:
+            return operands + [(CONCAT, len(operands))]
+        case emit if emit in _BINARY:
+            return list(children) + [(BINARY, SPECIALIZED.get((emit, node.match), _BINARY[emit]))]
+        case emit if emit in _BOUNDED:
+            return list(children) + [(BOUNDED, SPECIALIZED.get((emit, node.match), _BOUNDED[emit]))]
+
+        case emit:
+            raise NotImplementedError(f"Logics bytecode: {emit=} is not implemented")
+
+
+def compile(node: Node) -> tuple[tuple[int, object], ...]:
+    """
+    Compiles an AST into bytecode, or returns it from the cache.
+    """
+    if (code := cache.get(node)) is not None:
+        return code
+
+    code = []
+    todo = [node]
+
+    while todo:
+        item = todo.pop()
+
+        if isinstance(item, Node):
+            todo.extend(reversed(_expand(item)))
+        elif isinstance(item, _Label):
+            item.pc = len(code)
+        else:
+            code.append(item)
+
+    # Resolve jump targets
+    for pc, (op, arg) in enumerate(code):
+        if op in _JUMPS:
+            code[pc] = op, arg.pc
+        elif op in (COMPARE, FOR_ITER, MEMO):
+            code[pc] = op, (arg[0], arg[1].pc)
+
+    code = tuple(code)
+    cache.put(node, code)
+    return code
+
+
+def disassemble(code: tuple[tuple[int, object], ...]) -> str:
+    """
+    Returns a listing of bytecode, with jump targets marked by >>.
+    """
+    targets = {arg for op, arg in code if op in _JUMPS}
+    targets |= {arg[1] for op, arg in code if op in (COMPARE, FOR_ITER, MEMO)}
+
+    lines = []
+    for pc, (op, arg) in enumerate(code):
+        if op in _JUMPS:
+            arg = f"to {arg}"
+        elif op in (BINARY, BOUNDED, UNARY, TEST):
+            arg = arg.__name__
+        elif op == COMPARE:
+            arg = f"{arg[0].__name__}, else to {arg[1]}"
+        elif op == FOR_ITER:
+            arg = f"{arg[0]}, done to {arg[1]}"
+        elif op == MEMO:
+            arg = f"{arg[0]}, set to {arg[1]}"
+        elif op == CALL:
+            arg = f"{arg[0]}(), {'list' if arg[1] < 0 else arg[1]} args"
+        else:
+            arg = "" if arg is None else repr(arg)
+
+        lines.append(f"{'>>' if pc in targets else '  '} {pc:4} {OPNAMES[op]:<22} {arg}".rstrip())
+
+    return "\n".join(lines)
+
+
+def run(code: tuple[tuple[int, object], ...], logics, values: dict) -> Value | None:
+    """
+    Runs bytecode on behalf of a Logics object with a given variable set.
+    """
+    stack = _Stack()
+    push = stack.append
+    pop = stack.pop
+    limit = logics.MAX_FOR_ITERATIONS
+    bits = logics.MAX_INT_BITS
+    size = len(code)
+    pc = 0
+
+    while pc < size:
+        op, arg = code[pc]
+        pc += 1
+
+        if op == CONST:
+            push(arg)
+        elif op == LOAD:
+            push(wrap(values.get(arg)))
+        elif op == BINARY:
+            b = pop()
+            push(arg(pop(), b))
+        elif op == BOUNDED:
+            b = pop()
+            push(arg(pop(), b, bits))
+        elif op == GETITEM:
+            index = pop()
+            push(wrap(pop()[index]))
+        elif op == GETATTR:
+            push(attribute(pop(), arg))
+        elif op == CONCAT:
+            operands = stack[-arg:]
+            del stack[-arg:]
+            push(concat(*operands))
+        elif op == COMPARE:
+            b = pop()
+            if arg[0](pop(), b):
+                push(b)
+            else:
+                push(_FALSE)
+                pc = arg[1]
+        elif op == JUMP_IF_FALSE_OR_POP:
+            if stack[-1]:
+                pop()
+            else:
+                pc = arg
+        elif op == JUMP_IF_TRUE_OR_POP:
+            if stack[-1]:
+                pc = arg
+            else:
+                pop()
+        elif op == POP_JUMP_IF_FALSE:
+            if not pop():
+                pc = arg
+        elif op == JUMP:
+            pc = arg
+        elif op == POP:
+            pop()
+        elif op == CALL:
+            fname, count = arg
+            if count < 0:
+                args = pop().list()
+            elif count:
+                args = stack[-count:]
+                del stack[-count:]
+            else:
+                args = ()
+
+            fn = logics.functions.get(fname)
+            if not fn and fname == "vars":
+                fn = lambda name=None: values.get(str(name)) if name is not None else dict(values)
+
+            if fn:
+                try:
+                    push(wrap(fn(*args)))
+                except TypeError:
+                    # TODO: Improve parameter validation
+                    push(Value(f"#ERR:Invalid call to {fname}()"))
+            else:
+                push(Value(f"#ERR:Call to unknown function {fname}()"))
+
+        elif op == UNARY:
+            push(arg(pop()))
+        elif op == NOT:
+            push(_FALSE if pop() else _TRUE)
+        elif op == TEST:
+            b = pop()
+            push(_TRUE if arg(pop(), b) else _FALSE)
+        elif op == BUILD_LIST:
+            if arg:
+                items = stack[-arg:]
+                del stack[-arg:]
+            else:
+                items = []
+
+            push(Value(items))
+        elif op == LOAD_VARS:
+            push(Value(dict(values)))
+        elif op == SLICE:
+            end = pop()
+            del stack[-2:]
+            push(end)
+
+        # Comprehensions, with a loop state of [iterator, count, result] on the stack
+        elif op == FOR_START:
+            push([iter(pop()), 0, []])
+        elif op == FOR_ITER:
+            state = stack[-1]
+            try:
+                item = next(state[0])
+            except StopIteration:
+                pc = arg[1]
+                continue
+
+            # Limit loop to maximum of iterations (#17)
+            if state[1] >= limit:
+                pc = arg[1]
+                continue
+
+            state[1] += 1
+            values[arg[0]] = item
+        elif op == FOR_APPEND:
+            item = pop()
+            stack[-1][2].append(item)
+        elif op == FOR_END:
+            push(Value(pop()[2]))
+
+        # Common subexpressions
+        elif op == MEMO:
+            if (value := memo[arg[0]]) is not None:
+                push(value)
+                pc = arg[1]
+        elif op == STORE:
+            memo[arg] = stack[-1]
+        elif op == FRAME:
+            memo = [None] * arg
+
+        else:
+            raise NotImplementedError(f"Logics bytecode: opcode {op} is not implemented")
+
+    return pop() if stack else None
@@ -0,0 +1,77 @@
+"""
+Bounded, thread-safe caches for compiled Logics expressions.
+"""
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ("hits", "misses", "evictions", "maxsize", "currsize"))
+
+
+class LRUCache:
+    """
+    A thread-safe mapping with a maximum size, evicting the least recently used entry.
+
+    A maxsize of 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        assert maxsize >= 0
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            if not self.maxsize:
+                return
+
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int):
+        """
+        Changes the maximum size, evicting entries when shrinking.
+        """
+        assert maxsize >= 0
+
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        """
+        Drops all entries and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    def _evict(self):
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
@@ -0,0 +1,328 @@
+"""
+Closure compiler for Logics ASTs.
+
+compile() turns an AST once into a tree of nested Python closures, one per
+node, with their children and literals bound at compile time. Every closure
+is called as fn(logics, values) and returns the Value of its node, so running
+an expression is a single call of the root closure, without any dispatch on
+node types. Operations specialized by the type inference call their
+specialized function instead. The semantics are those of the reference VM in
+Logics._run().
+"""
+import operator
+from .fastparser import Node
+from .inference import SPECIALIZED, additions
+from .value import Value, attribute, concat, parse_float, parse_int, unescape, wrap
+
+# Operators that return a Value by themselves
+_UNARY = {
+    "invert": operator.invert,
+    "neg": operator.neg,
+    "pos": operator.pos,
+}
+
+_BINARY = {
+    "add": operator.add,
+    "div": operator.truediv,
+    "idiv": operator.floordiv,
+    "mod": operator.mod,
+    "sub": operator.sub,
+}
+
+# Operators taking the limit of the bits of an int result
+_BOUNDED = {
+    "mul": Value.multiply,
+    "pow": Value.power,
+}
+
+# Comparisons, returning a bool
+_COMPARE = {
+    "eq": operator.eq,
+    "neq": operator.ne,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "in": lambda a, b: a in b,
+    "outer": lambda a, b: a not in b,
+}
+
+
+_FALSE = Value(False)
+_TRUE = Value(True)
+
+
+class Frame:
+    """
+    Per-run state of an expression with common subexpressions, passed on in
+    place of the Logics object, which it delegates any other attribute to.
+    """
+
+    __slots__ = ("logics", "functions", "MAX_FOR_ITERATIONS", "MAX_INT_BITS", "memo")
+
+    def __init__(self, logics, slots: int):
+        self.logics = logics
+        self.functions = logics.functions
+        self.MAX_FOR_ITERATIONS = logics.MAX_FOR_ITERATIONS
+        self.MAX_INT_BITS = logics.MAX_INT_BITS
+        self.memo = [None] * slots
+
+    def __getattr__(self, name):
+        return getattr(self.logics, name)
+
+
+def _constant(value: Value):
+    def const(logics, values):
+        return value
+
+    return const
+
+
+def _trailer(fn, node: Node):
+    """
+    Compiles a trailer of an entity, applied to the result of fn.
+    """
+    match node.emit:
+        case "attr":
+            name = node.children[0].match
+
+            def trailer(logics, values):
+                return attribute(fn(logics, values), name)
+
+        case "index":
+            index = compile(node.children[0])
+
+            def trailer(logics, values):
+                return wrap(fn(logics, values)[index(logics, values)])
+
+        case "slice":
+            # Slices are not implemented by the VM yet, which leaves the
+            # operands on its stack, so the upper bound becomes the result.
+            start, end = compile(node.children[0]), compile(node.children[1])
+
+            def trailer(logics, values):
+                fn(logics, values)
+                start(logics, values)
+                return end(logics, values)
+
+        case emit:
+            raise NotImplementedError(f"Logics compiler: trailer {emit=} is not implemented")
+
+    return trailer
+
+
+def compile(node: Node):
+    """
+    Compiles an AST into a closure fn(logics, values) returning its Value.
+
+    The closure only depends on the AST; functions are looked up in
+    logics.functions at run time, so it can be shared by any Logics object.
+    """
+    match node.emit:
+        # Flow operations
+        case "and" | "or":
+            assert len(node.children) == 2
+            left, right = compile(node.children[0]), compile(node.children[1])
+
+            if node.emit == "and":
+
+                def fn(logics, values):
+                    if check := left(logics, values):
+                        return right(logics, values)
+
+                    return check
+
+            else:
+
+                def fn(logics, values):
+                    if check := left(logics, values):
+                        return check
+
+                    return right(logics, values)
+
+        case "cmp":
+            assert len(node.children) > 1
+            first = compile(node.children[0])
+            ops = []
+            for op in node.children[1:]:
+                ops.append((SPECIALIZED.get((op.emit, op.match), _COMPARE[op.emit]), compile(op.children[0])))
+
+            def fn(logics, values):
+                a = first(logics, values)
+
+                for op, operand in ops:
+                    b = operand(logics, values)
+                    if not op(a, b):
+                        return _FALSE
+
+                    a = b
+
+                return _TRUE
+
+        case "call":
+            fname = node.children[0].match
+            args = node.children[1] if len(node.children) > 1 else None
+            invalid = Value(f"#ERR:Invalid call to {fname}()")
+            unknown = Value(f"#ERR:Call to unknown function {fname}()")
+
+            # Arguments are evaluated in place, without a frame per nesting level
+            items = tuple(map(compile, args.children)) if args is not None and args.emit == "list" else ()
+            spread = compile(args) if args is not None and args.emit != "list" else None
+
+            def fn(logics, values):
+                if spread is None:
+                    argv = []
+                    for item in items:
+                        argv.append(item(logics, values))
+                else:
+                    argv = spread(logics, values).list()
+
+                func = logics.functions.get(fname)
+                if not func and fname == "vars":
+                    func = lambda name=None: values.get(str(name)) if name is not None else dict(values)
+
+                if func:
+                    try:
+                        return wrap(func(*argv))
+                    except TypeError:
+                        # TODO: Improve parameter validation
+                        return invalid
+
+                return unknown
+
+        case "comprehension":
+            assert len(node.children) in (3, 4)
+            each = compile(node.children[0])
+            name = node.children[1].match
+            iterable = compile(node.children[2])
+            test = compile(node.children[3]) if len(node.children) > 3 else None
+
+            def fn(logics, values):
+                limit = logics.MAX_FOR_ITERATIONS
+                ret = []
+
+                for i, item in enumerate(iterable(logics, values)):
+                    # Limit loop to maximum of iterations (#17)
+                    if i >= limit:
+                        break
+
+                    values[name] = item
+
+                    # optional if
+                    if test and not test(logics, values):
+                        continue
+
+                    ret.append(each(logics, values))
+
+                return Value(ret)
+
+        case "if":
+            assert len(node.children) == 3
+            then, test, other = compile(node.children[0]), compile(node.children[1]), compile(node.children[2])
+
+            def fn(logics, values):
+                if test(logics, values):
+                    return then(logics, values)
+
+                return other(logics, values)
+
+        # Values
+        case "False":
+            fn = _constant(_FALSE)
+        case "Identifier":
+            fn = _constant(Value(node.match))
+        case "None":
+            fn = _constant(Value(None))
+        case "Number":
+            fn = _constant(Value(parse_float(node.match) if "." in node.match else parse_int(node.match)))
+        case "String":
+            fn = _constant(Value(unescape(node.match[1:-1])))  # cut "..." from string.
+        case "True":
+            fn = _constant(_TRUE)
+
+        case "const":
+            fn = _constant(node.match)  # pre-converted by the optimizer
+
+        # Common subexpressions, evaluated once per run
+        case "frame":
+            slots = node.match
+            body = compile(node.children[0])
+
+            def fn(logics, values):
+                return body(Frame(logics, slots), values)
+
+        case "cse":
+            slot = node.match
+            body = compile(node.children[0])
+
+            def fn(logics, values):
+                if (value := logics.memo[slot]) is None:
+                    value = logics.memo[slot] = body(logics, values)
+
+                return value
+
+        case "strings":
+            fn = _constant(Value("".join(unescape(child.match[1:-1]) for child in node.children)))
+
+        case "list":
+            items = tuple(map(compile, node.children))
+
+            def fn(logics, values):
+                return Value([item(logics, values) for item in items])
+
+        case "load":
+            if (name := node.children[0].match) == "vars":
+                fn = lambda logics, values: Value(dict(values))
+            else:
+                fn = lambda logics, values: wrap(values.get(name))
+
+        case "entity":
+            fn = compile(node.children[0])
+            for trailer in node.children[1:]:
+                fn = _trailer(fn, trailer)
+
+        # Operations
+        case "not":
+            operand = compile(node.children[0])
+
+            def fn(logics, values):
+                return _FALSE if operand(logics, values) else _TRUE
+
+        case "in" | "outer":
+            test = _COMPARE[node.emit]
+            a, b = compile(node.children[0]), compile(node.children[1])
+
+            def fn(logics, values):
+                return _TRUE if test(a(logics, values), b(logics, values)) else _FALSE
+
+        case emit if emit in _UNARY:
+            op = SPECIALIZED.get((emit, node.match), _UNARY[emit])
+            operand = compile(node.children[0])
+
+            def fn(logics, values):
+                return op(operand(logics, values))
+
+        case "add" if len(operands := additions(node)) > 2:
+            operands = list(map(compile, operands))
+
+            def fn(logics, values):
+                return concat(*[operand(logics, values) for operand in operands])
+
+        case emit if emit in _BINARY:
+            op = SPECIALIZED.get((emit, node.match), _BINARY[emit])
+            a, b = compile(node.children[0]), compile(node.children[1])
+
+            def fn(logics, values):
+                return op(a(logics, values), b(logics, values))
+
+        case emit if emit in _BOUNDED:
+            op = SPECIALIZED.get((emit, node.match), _BOUNDED[emit])
+            a, b = compile(node.children[0]), compile(node.children[1])
+
+            def fn(logics, values):
+                return op(a(logics, values), b(logics, values), logics.MAX_INT_BITS)
+
+        case emit:
+            raise NotImplementedError(f"Logics compiler: {emit=} is not implemented")
+
+    return fn
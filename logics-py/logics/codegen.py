@@ -0,0 +1,389 @@
+"""
+Python code generator for Logics ASTs.
+
+generate() translates an AST into the source of a Python module defining one
+function expression(logics, values), which calls into a small runtime of
+Value helpers. Short-circuiting and/or, chained comparisons, conditions and
+comprehensions become native Python control flow.
+
+The generated code never accesses attributes of host objects and only sees
+the names of the runtime, not the builtins. Identifiers of the expression
+only appear as string literals. Code objects are cached by their source.
+"""
+import builtins
+import functools
+from .cache import LRUCache
+from .closures import Frame
+from .fastparser import Node
+from .inference import SPECIALIZED, additions
+from .value import Value, attribute, concat, integer, parse_float, parse_int, unescape, wrap
+
+# Process-wide cache of compiled code objects, keyed by their generated source.
+cache: LRUCache = LRUCache(maxsize=4096)
+
+# Deeper ASTs exceed the nesting limits of the Python compiler and are run as bytecode instead
+MAX_DEPTH = 100
+
+# Python operator precedences, from lowest to highest
+_TERNARY = 1
+_OR = 2
+_AND = 3
+_NOT = 4
+_COMPARE = 5
+_SUM = 9
+_TERM = 10
+_UNARY = 11
+_ATOM = 13
+
+# Binary operators with their precedence
+_BINARY = {
+    "add": ("+", _SUM),
+    "sub": ("-", _SUM),
+    "div": ("/", _TERM),
+    "idiv": ("//", _TERM),
+    "mod": ("%", _TERM),
+}
+
+# Operators taking the limit of the bits of an int result, as runtime functions
+_BOUNDED = {"mul": "_multiply", "pow": "_power"}
+
+_UNARY_OPS = {"invert": "~", "neg": "-", "pos": "+"}
+
+_COMPARE_OPS = {
+    "eq": "==",
+    "neq": "!=",
+    "lt": "<",
+    "lteq": "<=",
+    "gt": ">",
+    "gteq": ">=",
+    "in": "in",
+    "outer": "not in",
+}
+
+
+def _call(logics, values, fname: str, args) -> Value:
+    func = logics.functions.get(fname)
+    if not func and fname == "vars":
+        func = lambda name=None: values.get(str(name)) if name is not None else dict(values)
+
+    if func:
+        try:
+            return wrap(func(*args))
+        except TypeError:
+            # TODO: Improve parameter validation
+            return Value(f"#ERR:Invalid call to {fname}()")
+
+    return Value(f"#ERR:Call to unknown function {fname}()")
+
+
+def _vars(values: dict) -> Value:
+    # A snapshot, as comprehensions assign their variables into values
+    return Value(dict(values))
+
+
+# Names the generated code can access
+_RUNTIME = {
+    "__builtins__": {},
+    "enumerate": enumerate,
+    "Value": Value,
+    "_wrap": wrap,
+    "_attribute": attribute,
+    "_concat": concat,
+    "_multiply": Value.multiply,
+    "_power": Value.power,
+    "parse_float": parse_float,
+    "parse_int": parse_int,
+    "_call": _call,
+    "_vars": _vars,
+    "_Frame": Frame,
+    "_int": integer,
+    **{f"_{fn.__name__}": fn for fn in SPECIALIZED.values()},
+    "_FALSE": Value(False),
+    "_NONE": Value(None),
+    "_TRUE": Value(True),
+}
+
+
+class _Generator:
+    """
+    Only used internally;
+    Collects the constants and comprehension functions of one module.
+    """
+
+    def __init__(self):
+        self.constants = {}
+        self.functions = []
+        self.values = []  # Values of const nodes, passed as _consts
+        self.slots = None  # number of slots of common subexpressions
+        self.generated = set()  # slots with generated functions
+
+    def constant(self, init: str) -> tuple[str, int]:
+        """
+        Returns the name of a module-level constant, initialized by the expression init.
+        """
+        if (name := self.constants.get(init)) is None:
+            name = self.constants[init] = f"_k{len(self.constants)}"
+
+        return name, _ATOM
+
+    def operand(self, node: Node, prec: int) -> str:
+        """
+        Generates node, parenthesized when it binds weaker than prec.
+        """
+        src, own = self.expr(node)
+        return f"({src})" if own < prec else src
+
+    def expr(self, node: Node) -> tuple[str, int]:
+        """
+        Generates the expression for node, returning its source and precedence.
+        """
+        match node.emit:
+            # Flow operations
+            case "and":
+                return f"{self.operand(node.children[0], _AND)} and {self.operand(node.children[1], _NOT)}", _AND
+            case "or":
+                return f"{self.operand(node.children[0], _OR)} or {self.operand(node.children[1], _AND)}", _OR
+
+            case "cmp":
+                if all(op.match == "value" for op in node.children[1:]):
+                    # Specialized by the type inference, compare the wrapped values
+                    src = f"{self.operand(node.children[0], _ATOM)}.value"
+                    for op in node.children[1:]:
+                        src += f" {_COMPARE_OPS[op.emit]} {self.operand(op.children[0], _ATOM)}.value"
+                else:
+                    src = self.operand(node.children[0], _SUM)
+                    for op in node.children[1:]:
+                        src += f" {_COMPARE_OPS[op.emit]} {self.operand(op.children[0], _SUM)}"
+
+                return f"_TRUE if {src} else _FALSE", _TERNARY
+
+            case "call":
+                fname = node.children[0].match
+                if len(node.children) > 1:
+                    args = node.children[1]
+                    if args.emit == "list":
+                        args = "[" + ", ".join(self.operand(child, _TERNARY) for child in args.children) + "]"
+                    else:
+                        args = f"{self.operand(args, _ATOM)}.list()"
+                else:
+                    args = "()"
+
+                return f"_call(logics, values, {fname!r}, {args})", _ATOM
+
+            case "comprehension":
+                name = f"_c{len(self.functions)}"
+                self.functions.append(None)  # reserve the name before any nested comprehension
+
+                lines = [
+                    f"def {name}(logics, values):",
+                    "    limit = logics.MAX_FOR_ITERATIONS",
+                    "    ret = []",
+                    f"    for i, item in enumerate({self.operand(node.children[2], _TERNARY)}):",
+                    "        # Limit loop to maximum of iterations (#17)",
+                    "        if i >= limit:",
+                    "            break",
+                    f"        values[{node.children[1].match!r}] = item",
+                ]
+
+                if len(node.children) > 3:
+                    lines += [
+                        f"        if not ({self.operand(node.children[3], _TERNARY)}):",
+                        "            continue",
+                    ]
+
+                lines += [
+                    f"        ret.append({self.operand(node.children[0], _TERNARY)})",
+                    "    return Value(ret)",
+                ]
+
+                self.functions[int(name[2:])] = "\n".join(lines)
+                return f"{name}(logics, values)", _ATOM
+
+            case "if":
+                then, test, other = node.children
+                return (
+                    f"{self.operand(then, _OR)} if {self.operand(test, _OR)} else {self.operand(other, _TERNARY)}",
+                    _TERNARY,
+                )
+
+            # Values
+            case "False":
+                return "_FALSE", _ATOM
+            case "Identifier":
+                return self.constant(f"Value({node.match!r})")
+            case "None":
+                return "_NONE", _ATOM
+            case "Number":
+                return self.constant(f"Value({'parse_float' if '.' in node.match else 'parse_int'}({node.match!r}))")
+            case "String":
+                return self.constant(f"Value({unescape(node.match[1:-1])!r})")  # cut "..." from string.
+            case "True":
+                return "_TRUE", _ATOM
+
+            case "const":
+                # Pre-converted by the optimizer, bound when the code is executed
+                self.values.append(node.match)
+                return self.constant(f"_consts[{len(self.values) - 1}]")
+
+            # Common subexpressions, evaluated once per run
+            case "frame":
+                self.slots = node.match
+                return self.expr(node.children[0])
+
+            case "cse":
+                name = f"_s{node.match}"
+                if node.match not in self.generated:
+                    self.generated.add(node.match)
+                    self.functions.append(
+                        "\n".join(
+                            [
+                                f"def {name}(logics, values):",
+                                "    memo = logics.memo",
+                                f"    if (value := memo[{node.match}]) is None:",
+                                f"        value = memo[{node.match}] = {self.operand(node.children[0], _TERNARY)}",
+                                "    return value",
+                            ]
+                        )
+                    )
+
+                return f"{name}(logics, values)", _ATOM
+
+            case "strings":
+                return self.constant(f"Value({''.join(unescape(child.match[1:-1]) for child in node.children)!r})")
+
+            case "list":
+                return "Value([" + ", ".join(self.operand(child, _TERNARY) for child in node.children) + "])", _ATOM
+
+            case "load":
+                if (name := node.children[0].match) == "vars":
+                    return "_vars(values)", _ATOM
+
+                return f"_wrap(values.get({name!r}))", _ATOM
+
+            case "entity":
+                src = self.operand(node.children[0], _ATOM)
+
+                for trailer in node.children[1:]:
+                    match trailer.emit:
+                        case "attr":
+                            src = f"_attribute({src}, {trailer.children[0].match!r})"
+                        case "index":
+                            src = f"_wrap({src}[{self.operand(trailer.children[0], _TERNARY)}])"
+                        case "slice":
+                            # Slices are not implemented by the VM yet, the upper bound becomes the result.
+                            start, end = (self.operand(child, _TERNARY) for child in trailer.children)
+                            src = f"({src}, {start}, {end})[2]"
+                        case emit:
+                            raise NotImplementedError(f"Logics codegen: trailer {emit=} is not implemented")
+
+                return src, _ATOM
+
+            # Operations
+            case emit if (emit, node.match) in SPECIALIZED:
+                return self.specialized(node)
+
+            case "not":
+                return f"_FALSE if {self.operand(node.children[0], _OR)} else _TRUE", _TERNARY
+            case "in" | "outer":
+                a, b = (self.operand(child, _SUM) for child in node.children)
+                return f"_TRUE if {a} {_COMPARE_OPS[node.emit]} {b} else _FALSE", _TERNARY
+            case emit if emit in _BOUNDED:
+                a, b = (self.operand(child, _TERNARY) for child in node.children)
+                return f"{_BOUNDED[emit]}({a}, {b}, logics.MAX_INT_BITS)", _ATOM
+
+            case emit if emit in _UNARY_OPS:
+                return f"{_UNARY_OPS[emit]}{self.operand(node.children[0], _UNARY)}", _UNARY
+
+            case "add" if len(operands := additions(node)) > 2:
+                return "_concat(" + ", ".join(self.operand(child, _TERNARY) for child in operands) + ")", _ATOM
+
+            case emit if emit in _BINARY:
+                op, prec = _BINARY[emit]
+                a, b = node.children
+                return f"{self.operand(a, prec)} {op} {self.operand(b, prec + 1)}", prec
+
+            case emit:
+                raise NotImplementedError(f"Logics codegen: {emit=} is not implemented")
+
+    def specialized(self, node: Node) -> tuple[str, int]:
+        """
+        Generates an operation specialized by the type inference, working on the wrapped values.
+        """
+        emit, kind = node.emit, node.match
+        values = [f"{self.operand(child, _ATOM)}.value" for child in node.children]
+
+        if emit in _UNARY_OPS:
+            src = f"{_UNARY_OPS[emit]}{values[0]}"
+        elif kind in ("int", "number") and emit in ("add", "sub"):
+            src = f" {_BINARY[emit][0]} ".join(values)
+        else:
+            # Operations checking or converting their operands
+            args = [self.operand(child, _TERNARY) for child in node.children]
+            if emit in _BOUNDED:
+                args.append("logics.MAX_INT_BITS")
+
+            return f"_{emit}_{kind}(" + ", ".join(args) + ")", _ATOM
+
+        return f"{'_int' if kind == 'int' else 'Value'}({src})", _ATOM
+
+
+def _generate(node: Node) -> tuple[str, list[Value]]:
+    generator = _Generator()
+    src, _ = generator.expr(node)
+
+    lines = [f"{name} = {init}" for init, name in generator.constants.items()]
+    lines += generator.functions
+    lines.append("def expression(logics, values):")
+    if generator.slots:
+        lines.append(f"    logics = _Frame(logics, {generator.slots})")
+
+    lines += [f"    return {src}", ""]
+
+    return "\n".join(lines), generator.values
+
+
+def generate(node: Node) -> str:
+    """
+    Returns the source of the Python module for an AST.
+
+    The Values of const nodes are not part of the source, it refers to them as _consts.
+    """
+    return _generate(node)[0]
+
+
+def depth(node: Node) -> int:
+    """
+    Returns the depth of an AST, without recursion.
+    """
+    ret = 0
+    todo = [(node, 1)]
+
+    while todo:
+        node, level = todo.pop()
+        ret = max(ret, level)
+        todo.extend((child, level + 1) for child in node.children)
+
+    return ret
+
+
+def compile(node: Node):
+    """
+    Compiles an AST into a function expression(logics, values) returning its Value.
+
+    ASTs deeper than MAX_DEPTH are compiled by the bytecode backend, which runs them without recursion.
+    """
+    if depth(node) > MAX_DEPTH:
+        from . import bytecode
+
+        return functools.partial(bytecode.run, bytecode.compile(node))
+
+    src, values = _generate(node)
+
+    if (code := cache.get(src)) is None:
+        code = builtins.compile(src, "<logics>", "exec")
+        cache.put(src, code)
+
+    namespace = dict(_RUNTIME)
+    namespace["_consts"] = tuple(values)
+    exec(code, namespace)
+    return namespace["expression"]
@@ -0,0 +1,42 @@
+"""
+The interpreted DFA lexer of the generated LogicsParser, as a tokenizer for
+LogicsFastParser(lexer="dfa"). It reads the input by an offset into the
+source, instead of slicing it character by character.
+"""
+from .parser import LogicsParser, _LogicsControlBlock
+
+
+class LogicsDFALexer(LogicsParser):
+    def _get_input(self, pcb, offset):
+        # Character at offset from the current token, without buffering
+        offset += pcb.pos
+        if offset < pcb.end:
+            return ord(pcb.src[offset])
+
+        pcb.is_eof = True
+        return pcb.eof
+
+    def _clear_input(self, pcb):
+        # Advance the cursor behind the current token
+        pcb.pos += pcb.len
+        pcb.len = 0
+        pcb.sym = -1
+
+    def tokenize(self, src: str) -> list[tuple[int, int, int]]:
+        """
+        Tokenizes src into (symbol, start, end) tuples, like _ParseTables.tokenize().
+        """
+        pcb = _LogicsControlBlock(src)
+        pcb.src = src
+        pcb.end = len(src)
+        pcb.pos = 0
+
+        tokens = []
+        while True:
+            self._get_sym(pcb)
+            tokens.append((pcb.sym, pcb.pos, pcb.pos + pcb.len))
+
+            if pcb.sym <= 0:  # end-of-file or lexical error
+                return tokens
+
+            self._clear_input(pcb)
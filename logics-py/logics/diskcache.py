@@ -0,0 +1,282 @@
+"""
+Persistent on-disk cache of parsed Logics expressions.
+
+ASTs are serialized into a compact binary form and stored in one pack file
+per grammar version. Pack files are memory-mapped, so forked workers share
+their pages, and each AST is only deserialized when it is requested.
+
+Pack file layout, all integers are native uint32:
+
+    header   magic, format version, number of entries
+    index    per entry: 16-byte source key, record offset, record length
+    records  per entry: number of strings, number of nodes,
+             string offsets (number of strings + 1), nodes as
+             (emit, match, number of children) in pre-order, followed
+             by the UTF-8 encoded concatenation of all strings
+
+String references are 1-based, 0 means None.
+
+ASTs returned by DiskCache.get() are only deserialized on first access. As
+Logics compiles on first run, this keeps them out of the startup time.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from array import array
+from . import _tables
+from .fastparser import Node
+
+FORMAT_VERSION = 1
+
+_MAGIC = b"LGXC"
+_HEADER = struct.Struct("=4sII")
+_ENTRY = struct.Struct("=16sII")
+
+
+def grammar_version() -> str:
+    """
+    Returns a digest identifying the grammar and the serialization format.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(repr((FORMAT_VERSION, _tables.SYMBOLS, _tables.PRODUCTIONS)).encode())
+    return digest.hexdigest()
+
+
+def dump_ast(node: Node) -> bytes:
+    """
+    Serializes an AST into bytes.
+    """
+    if type(node) is LazyNode and type(data := Node.children.__get__(node)) is bytes:
+        return data  # not loaded yet
+
+    strings = {}
+    nodes = array("I")
+
+    def ref(s):
+        if s is None:
+            return 0
+
+        if (idx := strings.get(s)) is None:
+            idx = strings[s] = len(strings) + 1
+
+        return idx
+
+    # Pre-order traversal, without recursion
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        nodes.extend((ref(node.emit), ref(node.match), len(node.children)))
+        stack.extend(reversed(node.children))
+
+    text = "".join(strings)
+    offsets = array("I", [0])
+    for s in strings:
+        offsets.append(offsets[-1] + len(s))
+
+    head = array("I", (len(strings), len(nodes) // 3))
+    return head.tobytes() + offsets.tobytes() + nodes.tobytes() + text.encode()
+
+
+def load_ast(buf) -> Node:
+    """
+    Deserializes an AST from a bytes-like object created by dump_ast().
+    """
+    buf = memoryview(buf)
+    count, length = buf[:8].cast("I")
+
+    end = 8 + (count + 1 + length * 3) * 4
+    ints = buf[8:end].cast("I").tolist()
+    text = str(buf[end:], "utf-8")
+
+    strings = [None]
+    for i in range(count):
+        strings.append(text[ints[i] : ints[i + 1]])
+
+    # Build the tree bottom-up from the reversed pre-order
+    stack = []
+    pop = stack.pop
+    push = stack.append
+
+    for i in range(len(ints) - 3, count, -3):
+        if children := ints[i + 2]:
+            children = [pop() for _ in range(children)]
+        else:
+            children = None
+
+        push(Node(strings[ints[i]], strings[ints[i + 1]], children))
+
+    return stack[0]
+
+
+_load_lock = threading.Lock()
+
+
+class LazyNode(Node):
+    """
+    Root node of an AST that is deserialized on first access of any attribute,
+    and then turns into a plain Node. Until then, its children slot holds the
+    serialized record.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, data: bytes):
+        Node.children.__set__(self, data)
+
+    def _load(self):
+        with _load_lock:
+            if type(self) is LazyNode:
+                node = load_ast(Node.children.__get__(self))
+                Node.emit.__set__(self, node.emit)
+                Node.match.__set__(self, node.match)
+                Node.children.__set__(self, node.children)
+                self.__class__ = Node
+
+    @property
+    def emit(self):
+        self._load()
+        return self.emit
+
+    @property
+    def match(self):
+        self._load()
+        return self.match
+
+    @property
+    def children(self):
+        self._load()
+        return self.children
+
+
+class DiskCache:
+    """
+    On-disk cache of ASTs, keyed by source and grammar version.
+
+    Entries added by put() are kept in memory until flush() writes a new
+    pack file, which replaces the previous one atomically. Concurrent
+    writers don't corrupt the cache, but the last flush() wins.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.filename = os.path.join(path, f"logics-{grammar_version()}.lgc")
+
+        self._mmap = None
+        self._index = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+        self.load()
+
+    @staticmethod
+    def key(src: str) -> bytes:
+        return hashlib.blake2b(src.encode(), digest_size=16).digest()
+
+    def load(self):
+        """
+        Memory-maps the pack file and reads its index; the ASTs are loaded on demand.
+        """
+        with self._lock:
+            self._close()
+
+            try:
+                with open(self.filename, "rb") as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return  # missing or empty file
+
+            try:
+                magic, version, count = _HEADER.unpack_from(mm, 0)
+                if magic != _MAGIC or version != FORMAT_VERSION:
+                    raise ValueError(f"{self.filename} is not a Logics cache file")
+
+                self._index = {
+                    key: (offset, length)
+                    for key, offset, length in _ENTRY.iter_unpack(mm[_HEADER.size : _HEADER.size + count * _ENTRY.size])
+                }
+            except (struct.error, ValueError):
+                mm.close()
+                self._index = {}
+                return
+
+            self._mmap = mm
+
+    def get(self, src: str) -> Node | None:
+        key = self.key(src)
+
+        with self._lock:
+            if (data := self._pending.get(key)) is None:
+                if (entry := self._index.get(key)) is None:
+                    return None
+
+                offset, length = entry
+                data = self._mmap[offset : offset + length]
+
+        return LazyNode(data)
+
+    def put(self, src: str, ast: Node):
+        key = self.key(src)
+
+        with self._lock:
+            if key not in self._index:
+                self._pending[key] = dump_ast(ast)
+
+    def flush(self):
+        """
+        Writes all entries into a new pack file and maps it.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+
+            records = [(key, self._mmap[offset : offset + length]) for key, (offset, length) in self._index.items()]
+            records.extend(self._pending.items())
+
+            # Sources with the same AST, like a raw and its normalized source, share one record
+            offsets = {}
+
+            import tempfile
+
+            os.makedirs(self.path, exist_ok=True)
+            fd, tmpname = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_HEADER.pack(_MAGIC, FORMAT_VERSION, len(records)))
+
+                    offset = _HEADER.size + len(records) * _ENTRY.size
+                    for key, data in records:
+                        if data not in offsets:
+                            offsets[data] = offset
+                            offset += len(data) + (-len(data) % 4)
+
+                        f.write(_ENTRY.pack(key, offsets[data], len(data)))
+
+                    for data in offsets:
+                        f.write(data)
+                        f.write(b"\0" * (-len(data) % 4))  # keep records aligned
+
+                os.replace(tmpname, self.filename)
+            except BaseException:
+                os.unlink(tmpname)
+                raise
+
+            self._pending.clear()
+
+        self.load()
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def _close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+
+        self._mmap = None
+        self._index = {}
+
+    def __len__(self):
+        return len(self._index) + len(self._pending)
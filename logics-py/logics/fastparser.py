@@ -0,0 +1,312 @@
+"""
+Table-driven fast path for the generated Logics LALR parser.
+
+LogicsFastParser runs the LALR algorithm of the generated LogicsParser on
+hashed action/goto tables and produces the same ASTs. The tables are unpacked
+from the compact tables in _tables.py on first parse, so that importing
+logics doesn't need to load the generated parser module at all.
+
+By default, the whole input is tokenized in one pass by a single precompiled
+regular expression derived from the grammar's terminals; the interpreted DFA
+lexer of LogicsParser can still be selected with `lexer="dfa"`. Tokens are
+offsets into the source, line and column are only computed when a parse
+error is reported.
+"""
+import re
+from .tables import unpack, unpack_states
+
+# Patterns of the regular terminals, transcribed from logics.par.
+# Any other terminal is a literal, its name is its pattern.
+_TERMINALS = {
+    "whitespace": r"(?:[ \r\n\t]+|#[^\n]*\n)+",
+    "String": r"\"(?:\\[\s\S]|[^\\\"])*\"|'(?:\\[\s\S]|[^\\'])*'",
+    "Number": r"[0-9]+\.[0-9]*|[0-9]*\.[0-9]+|[0-9]+",
+    "Identifier": r"[A-Za-z_][A-Za-z0-9_]*",
+}
+
+# Actions, as in LogicsParser
+_ERROR = 0
+_REDUCE = 1
+_SHIFT = 2
+
+
+class Node:
+    """
+    This is an AST node, compatible to LogicsNode of the generated parser.
+
+    Nodes are slotted, and leaf nodes share one empty children tuple.
+    """
+
+    __slots__ = ("emit", "match", "children")
+
+    def __init__(self, emit=None, match=None, children=None):
+        self.emit = emit
+        self.match = match
+        self.children = children or ()
+
+    def dump(self, level=0):
+        if self.emit:
+            txt = "%s%s" % (level * " ", self.emit)
+            if self.match and self.match != self.emit:
+                txt += " (%s)" % self.match
+
+            print(txt)
+            level += 1
+
+        for child in self.children:
+            if child:
+                child.dump(level)
+
+
+def _position(src: str, offset: int) -> tuple[int, int]:
+    """
+    Returns line and column of offset in src, counted as LogicsParser does.
+    """
+    line = src.count("\n", 0, offset) + 1
+    if line == 1:
+        return line, offset + 1
+
+    return line, offset - src.rfind("\n", 0, offset) - 1
+
+
+class _ParseTables:
+    """
+    Only used internally;
+    Hashed representation of the parse tables.
+    """
+
+    def __init__(self):
+        from . import _tables
+
+        self.symbols = _tables.SYMBOLS
+        self.states = unpack_states(_tables.ACT)
+
+        # Action table: one {symbol: (action, index)} dict per state
+        self.act = tuple({sym: (act, idx) for sym, act, idx in state} for state in self.states)
+
+        # Goto table: one {lhs: (action, index)} dict per state
+        self.go = tuple({sym: (act, idx) for sym, act, idx in state} for state in unpack_states(_tables.GO))
+
+        self.def_prod = tuple(unpack(_tables.DEF_PROD))
+
+        # Production properties, split up for direct indexing
+        self.prod_emit = tuple(prod[0] for prod in _tables.PRODUCTIONS)
+        self.prod_len = tuple(prod[1] for prod in _tables.PRODUCTIONS)
+        self.prod_lhs = tuple(prod[2] for prod in _tables.PRODUCTIONS)
+
+        # The goal symbol is the last nonterminal produced by the last production
+        self.goal = self.prod_lhs[-1]
+
+        self._build_lexer()
+
+    def _build_lexer(self):
+        """
+        Builds the master regular expression for the regex lexer.
+
+        Every alternative is one group, tried in the order whitespace, regular
+        terminals and literals. Keywords are recognized as identifiers first
+        and then looked up, which implements the longest match of the DFA.
+        """
+        terminals = {name: sym for sym, (name, _, kind, *_) in enumerate(self.symbols) if kind > 0}
+        identifier = re.compile(_TERMINALS["Identifier"])
+
+        self.eof = terminals.pop("&eof")
+        self.keywords = {}
+        literals = {}
+
+        for name, sym in terminals.items():
+            if name in _TERMINALS:
+                continue
+            elif identifier.fullmatch(name):
+                self.keywords[name] = sym
+            else:
+                literals[name] = sym
+
+        groups = [(name, terminals[name]) for name in _TERMINALS]
+        groups.append(("|".join(re.escape(name) for name in sorted(literals, key=len, reverse=True)), None))
+        groups.append((r"[\s\S]", -1))  # anything else is a lexical error
+
+        self.pattern = re.compile("|".join(f"({_TERMINALS.get(name, name)})" for name, _ in groups))
+        self.group_syms = (None,) + tuple(sym for _, sym in groups)
+        self.whitespace = self.group_syms.index(terminals["whitespace"])
+        self.identifier = self.group_syms.index(terminals["Identifier"])
+        self.literals = literals
+
+    def tokenize(self, src: str) -> list[tuple[int, int, int]]:
+        """
+        Tokenizes src in one pass into (symbol, start, end) tuples.
+
+        The list is terminated by the end-of-file symbol, or by a -1 symbol
+        at the first character no terminal matches.
+        """
+        tokens = []
+        append = tokens.append
+        group_syms = self.group_syms
+        whitespace = self.whitespace
+        identifier = self.identifier
+        keywords = self.keywords
+        literals = self.literals
+
+        for match in self.pattern.finditer(src):
+            group = match.lastindex
+            if group == whitespace:
+                continue
+
+            sym = group_syms[group]
+            if sym is None:
+                sym = literals[match.group()]
+            elif group == identifier:
+                sym = keywords.get(match.group(), sym)
+
+            append((sym, match.start(), match.end()))
+
+            if sym < 0:
+                return tokens
+
+        append((self.eof, len(src), len(src)))
+        return tokens
+
+
+class LogicsFastParser:
+    """
+    LALR-Parser for Logics with O(1) parse table lookups.
+
+    The hashed tables are built on first use and shared by all instances.
+    """
+
+    _tables: _ParseTables | None = None
+
+    def __init__(self, lexer: str = "regex"):
+        assert lexer in ("regex", "dfa"), f"Unknown lexer {lexer!r}"
+        self.lexer = lexer
+
+        if lexer == "dfa":
+            from .dfalexer import LogicsDFALexer
+
+            self._dfa = LogicsDFALexer()
+
+    @staticmethod
+    def tables() -> _ParseTables:
+        if LogicsFastParser._tables is None:
+            LogicsFastParser._tables = _ParseTables()
+
+        return LogicsFastParser._tables
+
+    def tokenize(self, s: str) -> list[tuple[int, int, int]]:
+        if self.lexer == "dfa":
+            return self._dfa.tokenize(s)
+
+        return self.tables().tokenize(s)
+
+    def normalize(self, s: str) -> str:
+        """
+        Returns s with its tokens separated by single blanks, dropping any other
+        whitespace and comments. Sources with the same normalized form parse into
+        the same AST. Sources that cannot be tokenized are returned unchanged.
+        """
+        tokens = self.tables().tokenize(s)
+        if tokens[-1][0] < 0:
+            return s
+
+        return " ".join(s[start:end] for _, start, end in tokens[:-1])
+
+    def parse(self, s: str) -> Node:
+        if not isinstance(s, str):
+            from .parser import LogicsParser
+
+            return LogicsParser().parse(s)
+
+        tables = self.tables()
+        symbols = tables.symbols
+        act_table = tables.act
+        go_table = tables.go
+        def_prod = tables.def_prod
+        prod_emit = tables.prod_emit
+        prod_len = tables.prod_len
+        prod_lhs = tables.prod_lhs
+        goal = tables.goal
+        eof = tables.eof
+
+        tokens = self.tokenize(s)
+        token = 0
+        sym, start, end = tokens[0]
+
+        # The parse stack, as states with their AST nodes or lists of nodes
+        states = [0]
+        nodes = [None]
+
+        while True:
+            # Get action table entry
+            state = states[-1]
+            if (entry := act_table[state].get(sym)) is not None:
+                act, idx = entry
+                if act == _ERROR:  # enforced parse error
+                    raise self._error(s, start, state)
+
+            # Otherwise, apply default production
+            elif (idx := def_prod[state]) > -1:
+                act = _REDUCE
+
+            else:
+                raise self._error(s, start, state)
+
+            # Shift
+            if act & _SHIFT:
+                states.append(-1 if act & _REDUCE else idx)
+                nodes.append(Node(emit, s[start:end]) if (emit := symbols[sym][1]) else None)
+
+                if sym != eof:
+                    token += 1
+                    sym, start, end = tokens[token]
+
+            # Reduce
+            while act & _REDUCE:
+                lhs = prod_lhs[idx]
+
+                # Drop right-hand side
+                cnodes = None
+                if length := prod_len[idx]:
+                    for item in nodes[-length:]:
+                        if item:
+                            if isinstance(item, list):
+                                # Lists on the stack aren't referenced elsewhere, so the
+                                # first one is continued in place. This keeps left-recursive
+                                # productions like internal_list linear in their length.
+                                if cnodes is None:
+                                    cnodes = item
+                                else:
+                                    cnodes.extend(item)
+
+                            elif cnodes is None:
+                                cnodes = [item]
+                            else:
+                                cnodes.append(item)
+
+                    del states[-length:]
+                    del nodes[-length:]
+
+                # Handle AST nodes
+                node = Node(emit, children=cnodes) if (emit := prod_emit[idx]) else None
+
+                # Goal symbol reduced, and stack is empty?
+                if lhs == goal and len(states) == 1:
+                    node = node or cnodes
+
+                    if isinstance(node, list):
+                        return Node(children=node) if len(node) > 1 else node[0]
+
+                    return node
+
+                # Get goto table entry
+                act, idx = go_table[states[-1]][lhs]
+
+                states.append(-1 if act & _REDUCE else idx)
+                nodes.append(node or cnodes)
+
+    def _error(self, src: str, offset: int, state: int):
+        from .parser import LogicsParseException
+
+        tables = self.tables()
+        return LogicsParseException(
+            *_position(src, offset), [tables.symbols[sym] for sym, _, _ in tables.states[state]]
+        )
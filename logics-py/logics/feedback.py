@@ -0,0 +1,133 @@
+"""
+Adaptive type feedback for Logics expressions.
+
+A Feedback object stands in for the compiled code of a Logics object during
+its first runs, and records the Python types of the variables the expression
+reads. After Logics.PROFILE_RUNS runs, the expression is specialized for the
+types seen by the type inference, behind guards checking the types of these
+variables on every run.
+
+When a guard fails, the run falls back to the generic code, and the new type
+is recorded. After Logics.GUARD_FAILURES failures, the specialized code is
+dropped and the expression is profiled again with the widened types; after
+Logics.MAX_DEOPTS such deoptimizations, it stays generic for good.
+
+Expressions typed by declaration are guarded the same way by guard(), so a
+run with values of other types, like a missing variable, gives the results
+of the generic code.
+"""
+from collections import namedtuple
+from .fastparser import Node
+from .inference import ALIGNED, infer
+from .value import Value
+
+FeedbackInfo = namedtuple("FeedbackInfo", ("runs", "specializations", "guard_failures", "deopts"))
+
+
+def variables(node: Node) -> frozenset:
+    """
+    Returns the names of the variables an AST reads, except those assigned by comprehensions.
+    """
+    loaded = set()
+    assigned = set()
+    todo = [node]
+
+    while todo:
+        node = todo.pop()
+        if node.emit == "load" and (name := node.children[0].match) != "vars":
+            loaded.add(name)
+        elif node.emit == "comprehension":
+            assigned.add(node.children[1].match)
+
+        todo.extend(node.children)
+
+    return frozenset(loaded - assigned)
+
+
+def guard(code, generic, types: dict):
+    """
+    Returns code behind guards checking that the variables hold values of their declared types,
+    which runs generic otherwise.
+    """
+    guards = []
+    for name, declared in types.items():
+        declared = declared if isinstance(declared, tuple) else (declared,)
+        if all(t in ALIGNED for t in declared):
+            guards.append((name, frozenset(declared).union(*(ALIGNED[t] for t in declared))))
+
+    def guarded(logics, values):
+        for name, allowed in guards:
+            if (kind := type(value := values.get(name))) not in allowed:
+                if kind is not Value or type(value.value) not in allowed:
+                    return generic(logics, values)
+
+        return code(logics, values)
+
+    return guarded
+
+
+class Feedback:
+    """
+    Type feedback of one Logics object, called as its code while profiling.
+    """
+
+    def __init__(self, ast: Node, generic):
+        self.ast = ast
+        self.generic = generic  # compiled code without specializations
+        self.seen = {name: set() for name in variables(ast)}
+
+        self.runs = 0  # profiled runs
+        self.failures = 0  # guard failures of the current specialization
+        self.specializations = 0
+        self.guard_failures = 0
+        self.deopts = 0
+
+    def info(self) -> FeedbackInfo:
+        return FeedbackInfo(self.runs, self.specializations, self.guard_failures, self.deopts)
+
+    def record(self, values: dict):
+        for name, seen in self.seen.items():
+            seen.add(type(values.get(name)))
+
+    def __call__(self, logics, values: dict):
+        self.record(values)
+
+        self.runs += 1
+        if self.runs % logics.PROFILE_RUNS == 0:
+            logics._code = self.specialize(logics)
+
+        return self.generic(logics, values)
+
+    def specialize(self, logics):
+        """
+        Returns the code specialized for the types seen, or the generic code when nothing could be specialized.
+        """
+        types = {name: tuple(seen) for name, seen in self.seen.items() if seen <= ALIGNED.keys()}
+        if not types or (ast := infer(self.ast, types, logics._pure())) is self.ast:
+            return self.generic
+
+        self.specializations += 1
+        self.failures = 0
+
+        code = logics._translate(ast)
+        guards = tuple((name, frozenset(seen)) for name, seen in types.items())
+
+        def guarded(logics, values):
+            for name, seen in guards:
+                if type(values.get(name)) not in seen:
+                    return self.guard_failed(logics, values)
+
+            return code(logics, values)
+
+        return guarded
+
+    def guard_failed(self, logics, values: dict):
+        self.record(values)
+
+        self.guard_failures += 1
+        self.failures += 1
+        if self.failures >= logics.GUARD_FAILURES:
+            self.deopts += 1
+            logics._code = self if self.deopts < logics.MAX_DEOPTS else self.generic
+
+        return self.generic(logics, values)
@@ -0,0 +1,375 @@
+"""
+Static type inference for Logics ASTs.
+
+infer() returns a copy of an AST where operations whose operand types are
+known are marked with a specialization in their match, like Node("add",
+"int", ...). The backends then run them through the functions in SPECIALIZED,
+which work directly on the wrapped values and skip the generic dispatch of
+the Value operators. Operations with any unknown operand type keep the
+generic path.
+
+Types are derived from literals, from the return types of the stock
+functions and from the types the caller declares for variables. Types are
+tracked as sets of the Python types a Value may hold, after the alignment
+done by Value(); for example, a float variable may hold an int as well, and a
+str may turn into a number. Variables assigned by a comprehension are never
+typed. The specialized code relies on the declared types, so Logics runs it
+behind guards, see feedback.guard().
+
+Inferred ASTs are cached by their source AST, types and functions.
+"""
+from .cache import LRUCache
+from .fastparser import Node
+from .value import DictView, ListView, Value, integer, join, unescape
+
+# Process-wide cache of inferred ASTs, keyed by the AST, the declared types and the stock functions.
+cache: LRUCache = LRUCache(maxsize=4096)
+
+INTEGRAL = frozenset((bool, int))
+NUMERIC = frozenset((bool, int, float))
+STRING = frozenset((str,))
+
+# Types a Value holds for a declared type, after alignment
+ALIGNED = {
+    bool: frozenset((bool,)),
+    int: frozenset((int,)),
+    float: frozenset((int, float)),
+    str: frozenset((str, int, float)),
+    list: frozenset((ListView,)),
+    dict: frozenset((DictView,)),
+    type(None): frozenset((type(None),)),
+}
+
+# Return types of the stock functions, when called with exactly one argument
+RETURNS = {
+    "bool": frozenset((bool,)),
+    "float": ALIGNED[float],
+    "int": ALIGNED[int],
+    "len": ALIGNED[int],
+    "str": STRING,  # not aligned
+}
+
+
+# Specialized operations on Values; "int" requires integral operands, "number" numeric
+# operands, "str" at least one str operand, and "value" comparable operands.
+# Multiplications and powers take the limit of the bits of an int result as well.
+
+
+def add_int(a, b):
+    return integer(a.value + b.value)
+
+
+def add_number(a, b):
+    return Value(a.value + b.value)
+
+
+def add_str(a, b):
+    return Value(join([str(a.value), str(b.value)]))
+
+
+def sub_int(a, b):
+    return integer(a.value - b.value)
+
+
+def sub_number(a, b):
+    return Value(a.value - b.value)
+
+
+def mul_int(a, b, limit):
+    if a.value.bit_length() + b.value.bit_length() > limit:
+        return a.multiply(b, limit)  # checks the size of the result
+
+    return integer(a.value * b.value)
+
+
+def mul_number(a, b, limit):
+    if type(a.value) is float or type(b.value) is float:
+        return Value(a.value * b.value)
+
+    return a.multiply(b, limit)
+
+
+def div_number(a, b):
+    if not b.value:
+        return Value("#ERR:division by zero")
+
+    return Value(a.value / b.value)
+
+
+def idiv_int(a, b):
+    if not b.value:
+        return Value("#ERR:division by zero")
+
+    return integer(a.value // b.value)
+
+
+def mod_number(a, b):
+    if not b.value:
+        return Value("#ERR:modulo by zero")
+
+    return Value(a.value % b.value)
+
+
+def pow_number(a, b, limit):
+    if type(a.value) is float or type(b.value) is float:
+        return Value(a.value**b.value)
+
+    return a.power(b, limit)
+
+
+def neg_int(a):
+    return integer(-a.value)
+
+
+def neg_number(a):
+    return Value(-a.value)
+
+
+def pos_int(a):
+    return integer(+a.value)
+
+
+def pos_number(a):
+    return Value(+a.value)
+
+
+def invert_int(a):
+    return integer(~a.value)
+
+
+def eq_value(a, b):
+    return a.value == b.value
+
+
+def neq_value(a, b):
+    return a.value != b.value
+
+
+def lt_value(a, b):
+    return a.value < b.value
+
+
+def lteq_value(a, b):
+    return a.value <= b.value
+
+
+def gt_value(a, b):
+    return a.value > b.value
+
+
+def gteq_value(a, b):
+    return a.value >= b.value
+
+
+SPECIALIZED = {
+    tuple(fn.__name__.split("_")): fn
+    for fn in (
+        add_int,
+        add_number,
+        add_str,
+        sub_int,
+        sub_number,
+        mul_int,
+        mul_number,
+        div_number,
+        idiv_int,
+        mod_number,
+        pow_number,
+        neg_int,
+        neg_number,
+        pos_int,
+        pos_number,
+        invert_int,
+        eq_value,
+        neq_value,
+        lt_value,
+        lteq_value,
+        gt_value,
+        gteq_value,
+    )
+}
+
+_OPERATORS = frozenset(emit for emit, _ in SPECIALIZED)
+
+# Result types of the specialized operations
+_RESULTS = {
+    "int": ALIGNED[int],
+    "number": ALIGNED[float],
+    "str": ALIGNED[str],
+}
+
+_ERRORS = ("div", "idiv", "mod", "mul", "pow")  # may return an error string instead
+
+
+def additions(node: Node) -> list[Node]:
+    """
+    Returns the operands of a chain of additions which are not specialized, like a + b + c.
+    """
+    ret = []
+
+    while node.emit == "add" and (node.emit, node.match) not in SPECIALIZED:
+        ret.append(node.children[1])
+        node = node.children[0]
+
+    ret.append(node)
+    ret.reverse()
+    return ret
+
+
+def specialize(emit: str, *operands) -> str | None:
+    """
+    Returns the specialization of an operation for the types of its operands, if any.
+    """
+    if any(types is None for types in operands):
+        return None
+
+    if emit in ("eq", "neq"):
+        return "value"
+    elif emit in ("lt", "lteq", "gt", "gteq"):
+        if all(types <= NUMERIC for types in operands) or all(types <= STRING for types in operands):
+            return "value"
+
+        return None
+
+    if all(types <= INTEGRAL for types in operands) and (emit, "int") in SPECIALIZED:
+        return "int"
+    elif all(types <= NUMERIC for types in operands) and (emit, "number") in SPECIALIZED:
+        return "number"
+    elif emit == "add" and any(types <= STRING for types in operands):
+        return "str"
+
+    return None
+
+
+class _Inferrer:
+    """
+    Only used internally;
+    Infers the types of an AST bottom-up, without recursion.
+    """
+
+    def __init__(self, types: dict, functions):
+        self.functions = functions
+        self.types = types
+        self.done = {}  # id of node to its inferred node and types, for shared subtrees
+
+    def infer(self, root: Node) -> Node:
+        # Variables assigned by a comprehension may hold anything
+        assigned = set()
+        todo = [root]
+        while todo:
+            node = todo.pop()
+            if node.emit == "comprehension":
+                assigned.add(node.children[1].match)
+
+            todo.extend(node.children)
+
+        self.types = {name: types for name, types in self.types.items() if name not in assigned}
+
+        todo = [(root, False)]
+        done = []
+
+        while todo:
+            node, visited = todo.pop()
+
+            if visited:
+                if count := len(node.children):
+                    children = done[-count:]
+                    del done[-count:]
+                else:
+                    children = ()
+
+                self.done[id(node)] = ret = self.visit(node, children)
+                done.append(ret)
+
+            elif (ret := self.done.get(id(node))) is not None:
+                done.append(ret)
+            else:
+                todo.append((node, True))
+                todo.extend((child, False) for child in reversed(node.children))
+
+        return done[0][0]
+
+    def visit(self, node: Node, children) -> tuple[Node, frozenset | None]:
+        """
+        Returns the inferred node and its types, for node with its already inferred children and their types.
+        """
+        types = [child[1] for child in children]
+        kind = node.match
+        ret = None
+
+        match node.emit:
+            # Literals
+            case "False" | "True":
+                ret = ALIGNED[bool]
+            case "None":
+                ret = ALIGNED[type(None)]
+            case "Number":
+                ret = ALIGNED[float if "." in node.match else int]
+            case "String":
+                ret = frozenset((type(Value(unescape(node.match[1:-1])).value),))
+            case "strings":
+                ret = frozenset((type(Value("".join(unescape(child.match[1:-1]) for child in node.children)).value),))
+            case "const":
+                ret = frozenset((type(node.match.value),))
+
+            case "load":
+                if (name := node.children[0].match) in self.types and name != "vars":
+                    declared = self.types[name]
+                    declared = declared if isinstance(declared, tuple) else (declared,)
+
+                    if all(t in ALIGNED for t in declared):
+                        ret = frozenset().union(*(ALIGNED[t] for t in declared))
+
+            case "call":
+                fname = node.children[0].match
+                if fname in self.functions and len(children) > 1 and len(node.children[1].children) == 1:
+                    ret = RETURNS.get(fname)
+
+            # Results of one of the operands
+            case "and" | "or" | "if":
+                if all(types[i] is not None for i in ((0, 2) if node.emit == "if" else (0, 1))):
+                    ret = types[0] | types[-1]
+            case "cse" | "frame":
+                ret = types[0]
+
+            case "cmp":
+                ret = ALIGNED[bool]
+                children = [children[0]] + [
+                    (Node(op.emit, specialize(op.emit, left[1], operand), op.children), operand)
+                    for left, (op, operand) in zip(children, children[1:])
+                ]
+
+            case "not":
+                ret = ALIGNED[bool]
+            case "list" | "comprehension":
+                ret = ALIGNED[list]
+
+            # Operators of a comparison chain take the types of their operand, and are specialized by it
+            case "eq" | "neq" | "lt" | "lteq" | "gt" | "gteq" | "in" | "outer":
+                ret = types[0]
+
+            case emit if emit in _OPERATORS:
+                if (kind := specialize(emit, *types)) is not None:
+                    ret = None if emit in _ERRORS else _RESULTS[kind]
+
+        children = [child[0] for child in children]
+        if kind == node.match and all(new is old for new, old in zip(children, node.children)):
+            return node, ret
+
+        return Node(node.emit, kind, children), ret
+
+
+def infer(node: Node, types: dict, functions=()) -> Node:
+    """
+    Returns the AST for node with operations specialized by the types of their operands.
+
+    types maps variable names to their declared Python type, or a tuple of
+    types, functions names the stock functions whose return types are known.
+    """
+    key = (node, frozenset(types.items()), frozenset(functions))
+
+    if (ret := cache.get(key)) is None:
+        ret = _Inferrer(types, frozenset(functions)).infer(node)
+        cache.put(key, ret)
+
+    return ret
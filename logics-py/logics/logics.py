@@ -2,17 +2,87 @@
 logics is a domain-specific expression language with a Python-style syntax,
 that can be compiled and executed in any of ViUR's runtime contexts.
 """
-import typing as t
-from .parser import LogicsParser, LogicsNode
-from .value import Value, parse_float, parse_int, unescape
+import functools
+import operator
+from . import closures, codegen
+from .cache import LRUCache
+from .fastparser import LogicsFastParser, Node
+from .value import MAX_INT_BITS, Value, join, parse_float, parse_int, unescape, wrap
 
 
-_parser = LogicsParser()
+_parser = LogicsFastParser()
+
+
+def _lookup(key: str) -> Node | None:
+    """
+    Returns the AST for a raw or normalized source from Logics.cache or Logics.disk_cache.
+    """
+    if (ast := Logics.cache.get(key)) is None and Logics.disk_cache is not None:
+        if (ast := Logics.disk_cache.get(key)) is not None:
+            Logics.cache.put(key, ast)
+
+    return ast
+
+
+def _store(key: str, ast: Node):
+    Logics.cache.put(key, ast)
+
+    if Logics.disk_cache is not None:
+        Logics.disk_cache.put(key, ast)
+
+
+def _parse(src: str) -> Node:
+    """
+    Parses src, or returns the AST of an equivalent source from the caches.
+    """
+    if not isinstance(src, str):
+        return _parser.parse(src)
+
+    # Look up the raw source first, which spares tokenizing it on a hit
+    if (ast := _lookup(src)) is None:
+        key = _parser.normalize(src)
+        if key == src or (ast := _lookup(key)) is None:
+            ast = _parser.parse(src)
+            _store(key, ast)
+
+        if key != src:
+            _store(src, ast)
+
+    return ast
+
+
+def _parse_chunk(sources: list[str], serialize: bool = True) -> list:
+    """
+    Parses a chunk of sources for Logics.compile_many(), also in a worker process.
+
+    Returns per source either its AST, serialized by default, or a (row, col, expecting)
+    tuple when it raised a LogicsParseException, which can't be pickled.
+    """
+    from .diskcache import dump_ast
+    from .parser import LogicsParseException
+
+    ret = []
+    for src in sources:
+        try:
+            ast = _parser.parse(src)
+            ret.append(dump_ast(ast) if serialize else ast)
+        except LogicsParseException as e:
+            ret.append((e.row, e.col, e.expecting))
+
+    return ret
+
+
+def _in(a, b):
+    return a in b
+
+
+def _not_in(a, b):
+    return a not in b
 
 
 class _Stack(list):
     def op0(self, value):
-        super().append(Value(value))
+        super().append(wrap(value))
 
     def op1(self, fn):
         self.op0(fn(self.pop()))
@@ -30,45 +100,138 @@ class _Stack(list):
 class Logics:
     MAX_FOR_ITERATIONS: int = 4 * 1024
 
-    def __init__(self, src: str, debug: bool = False):
+    # Limit of the bits of ints built by multiplications and powers, which return an error beyond it.
+    # Set it on an instance to change it for one expression.
+    MAX_INT_BITS: int = MAX_INT_BITS
+
+    # Process-wide cache of parsed expressions, keyed by their normalized source.
+    # Use Logics.cache.resize() to configure its size, 0 disables it.
+    cache: LRUCache = LRUCache(maxsize=4096)
+
+    # Optional persistent cache of parsed expressions, shared between processes.
+    disk_cache: "DiskCache | None" = None
+
+    # Execution backends; "vm" is the reference implementation in Logics._run().
+    BACKENDS = ("vm", "closure", "python", "bytecode")
+
+    # Type feedback: Runs profiled before specializing for the types of variables seen (0 disables it),
+    # guard failures after which the expression is profiled again, and deoptimizations until it stays generic.
+    PROFILE_RUNS: int = 16
+    GUARD_FAILURES: int = 4
+    MAX_DEOPTS: int = 4
+
+    def __init__(
+        self,
+        src: str,
+        debug: bool = False,
+        backend: str = "closure",
+        optimize: bool = True,
+        types: dict[str, type] | None = None,
+    ):
         super().__init__()
-        self.ast = _parser.parse(src)
-
-        self.functions = {
-            "bool": bool,
-            # "currency": Logics.lgx_currency,
-            "endswith": lambda value, suffix: str(value).endswith(str(suffix)),
-            "float": parse_float,
-            "int": parse_int,
-            "join": lambda value, delimiter=", ": str(delimiter).join(str(item) for item in value.list()),
-            "keys": lambda obj: list(obj.dict().keys()),
-            "len": len,
-            "lfill": lambda value, length, fill=" ": str(value).rjust(int(length), str(fill)),
-            "lower": lambda value: str(value).lower(),
-            "lstrip": lambda value, chars=" \t\r\n": str(value).lstrip(str(chars)),
-            "max": lambda value: max(value),
-            "min": lambda value: min(value),
-            "range": Logics.lgx_range,
-            "replace": Logics.lgx_replace,
-            "rfill": lambda value, length, fill=" ": str(value).ljust(int(length), str(fill)),
-            "round": lambda value, digits=0: round(float(value), int(digits)),
-            "rstrip": lambda value, chars=" \t\r\n": str(value).rstrip(str(chars)),
-            "split": lambda value, delimiter=",": str(value).split(str(delimiter)),
-            "startswith": lambda value, prefix: str(value).startswith(str(prefix)),
-            "str": lambda val: Value(str(val), optimize=False),
-            "strip": lambda s, c=" \t\r\n": str(s).strip(str(c)),
-            "sum": lambda value: sum(
-                [Value.align(item, allow=(bool, int, float), default=parse_int) for item in value]
-            ),
-            "upper": lambda value: str(value).upper(),
-            "values": lambda obj: list(obj.dict().values()),
-            # "vars": ... is a special case handled inline!
-        }
+        self._setup(_parse(src), debug, backend, optimize, types)
+
+    def _setup(self, ast: Node, debug: bool, backend: str, optimize: bool, types: dict[str, type] | None):
+        assert backend in self.BACKENDS, f"Unknown backend {backend!r}"
+        self.ast = ast
+        self.backend = backend
+        self.optimize = optimize
+        self.types = dict(types or {})  # declared types of variables, for the type inference
+        self.feedback = None  # type feedback, when the expression is not typed by declaration
+        self._code = None  # compiled on first run, after self.functions may have been changed
+
+        self.functions = dict(self.FUNCTIONS)
 
         self.debug = debug
         if self.debug:
             self.ast.dump()
 
+    @classmethod
+    def compile_many(
+        cls,
+        sources,
+        workers: int = 0,
+        chunksize: int = 256,
+        debug: bool = False,
+        backend: str = "closure",
+        optimize: bool = True,
+        types: dict[str, type] | None = None,
+    ) -> list:
+        """
+        Compiles many sources at once.
+
+        Sources with the same normalized form are only parsed once, and sources
+        already in the caches are not parsed at all. With workers > 1, parsing
+        is spread over a pool of worker processes in chunks of chunksize sources.
+
+        Returns a list in the order of sources, holding a Logics object for
+        every source, or the LogicsParseException when it failed to parse.
+        """
+        from .parser import LogicsParseException
+
+        sources = list(sources)
+
+        # Look up every distinct source once, and normalize those not found
+        asts = {}
+        keys = {}
+        for src in sources:
+            if src not in asts and src not in keys:
+                if (ast := _lookup(src)) is not None:
+                    asts[src] = ast
+                else:
+                    keys[src] = _parser.normalize(src)
+
+        # Look up every distinct normalized source once
+        found = {}
+        missing = {}
+        for src, key in keys.items():
+            if key not in found and key not in missing:
+                if key != src and (ast := _lookup(key)) is not None:
+                    found[key] = ast
+                else:
+                    missing[key] = src
+
+        # Parse the remaining ones, either in-process or in a pool
+        chunks = list(missing.values())
+        chunks = [chunks[i : i + chunksize] for i in range(0, len(chunks), chunksize)]
+
+        if workers > 1 and len(chunks) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            from .diskcache import load_ast
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = [
+                    load_ast(res) if isinstance(res, bytes) else res
+                    for chunk in pool.map(_parse_chunk, chunks)
+                    for res in chunk
+                ]
+        else:
+            results = [res for chunk in chunks for res in _parse_chunk(chunk, serialize=False)]
+
+        for key, res in zip(missing, results):
+            if isinstance(res, tuple):
+                found[key] = LogicsParseException(*res)
+            else:
+                found[key] = res
+                _store(key, res)
+
+        for src, key in keys.items():
+            asts[src] = ast = found[key]
+            if key != src and not isinstance(ast, LogicsParseException):
+                _store(src, ast)
+
+        # Construct the Logics objects
+        ret = []
+        for src in sources:
+            if isinstance(ast := asts[src], LogicsParseException):
+                ret.append(ast)
+            else:
+                logics = cls.__new__(cls)
+                logics._setup(ast, debug, backend, optimize, types)
+                ret.append(logics)
+
+        return ret
+
     @staticmethod
     def lgx_range(start: int, end: int | None = None, step: int | None = None) -> range:
         if step is not None:
@@ -115,28 +278,118 @@ class Logics:
 
         return str(value).replace(str(find), str(replace))
 
+    # Built-in functions, copied into the functions of every Logics object.
+    FUNCTIONS = {
+        "bool": bool,
+        # "currency": Logics.lgx_currency,
+        "endswith": lambda value, suffix: str(value).endswith(str(suffix)),
+        "float": parse_float,
+        "int": parse_int,
+        "join": lambda value, delimiter=", ": join([str(item) for item in value.list()], str(delimiter)),
+        "keys": lambda obj: list(obj.dict().keys()),
+        "len": len,
+        "lfill": lambda value, length, fill=" ": str(value).rjust(int(length), str(fill)),
+        "lower": lambda value: str(value).lower(),
+        "lstrip": lambda value, chars=" \t\r\n": str(value).lstrip(str(chars)),
+        "max": lambda value: max(value),
+        "min": lambda value: min(value),
+        "range": lgx_range,
+        "replace": lgx_replace,
+        "rfill": lambda value, length, fill=" ": str(value).ljust(int(length), str(fill)),
+        "round": lambda value, digits=0: round(float(value), int(digits)),
+        "rstrip": lambda value, chars=" \t\r\n": str(value).rstrip(str(chars)),
+        "split": lambda value, delimiter=",": str(value).split(str(delimiter)),
+        "startswith": lambda value, prefix: str(value).startswith(str(prefix)),
+        "str": lambda val: Value(str(val), optimize=False),
+        "strip": lambda s, c=" \t\r\n": str(s).strip(str(c)),
+        "sum": lambda value: sum([Value.align(item, allow=(bool, int, float), default=parse_int) for item in value]),
+        "upper": lambda value: str(value).upper(),
+        "values": lambda obj: list(obj.dict().values()),
+        # "vars": ... is a special case handled inline!
+    }
+
+    # Functions without side effects, calls with constant arguments are folded by the optimizer.
+    PURE_FUNCTIONS = frozenset(FUNCTIONS)
+
     def run(self, values: dict = {}) -> Value | None:
         """
         Runs the compiled Logics expression with a given variable set.
         """
-        stack = _Stack()
-        self._run(self.ast, stack, values)
+        if not (code := self._code):
+            code = self._code = self._compile()
 
-        try:
-            return stack.pop()
-        except IndexError:
-            return None
+        return code(self, values)
 
-    def _run(self, node: LogicsNode, stack: _Stack, values: dict):
+    def _compile(self):
+        """
+        Compiles the AST for the backend, into a function fn(logics, values).
+        """
+        ast = self.ast
+        pure = self._pure()
+
+        if self.optimize:
+            from .optimizer import optimize
+
+            ast = optimize(ast, pure)
+
+        # The vm always runs the generic operations, which give the same results
+        if self.types and self.backend != "vm":
+            from .feedback import guard
+            from .inference import infer
+
+            if (typed := infer(ast, self.types, pure)) is not ast:
+                return guard(self._translate(typed), self._translate(ast), self.types)
+
+        code = self._translate(ast)
+
+        if self.PROFILE_RUNS and self.backend != "vm" and not self.types:
+            from .feedback import Feedback
+
+            code = self.feedback = Feedback(ast, code)
+
+        return code
+
+    def _pure(self) -> dict:
+        """
+        Returns the functions which are pure and not replaced, which may be folded and inferred.
+        """
+        return {
+            name: self.functions[name]
+            for name in self.PURE_FUNCTIONS
+            if self.functions.get(name) is self.FUNCTIONS.get(name) is not None
+        }
+
+    def _translate(self, ast: Node):
+        """
+        Translates an AST for the backend, into a function fn(logics, values).
+        """
+        match self.backend:
+            case "closure":
+                return closures.compile(ast)
+            case "python":
+                return codegen.compile(ast)
+            case "bytecode":
+                from . import bytecode
+
+                return functools.partial(bytecode.run, bytecode.compile(ast))
+
+        def run(logics, values):
+            stack = _Stack()
+            logics._run(ast, stack, values)
+
+            try:
+                return stack.pop()
+            except IndexError:
+                return None
+
+        return run
+
+    def _run(self, node: Node, stack: _Stack, values: dict):
         """
         Internal virtual machine working on the recursive
         LogicsNodes, a stack and the values.
         """
 
-        # Use this function to access values
-        def _vars(name: t.Optional[str] = None):
-            return values.get(str(name)) if name is not None else values
-
         # Flow operations are being evaluated on demand
         match node.emit:
             case "and" | "or":
@@ -192,6 +445,7 @@ class Logics:
 
                     stack.op0(b)
 
+                stack.pop()  # the last operand
                 stack.op0(True)
                 return
 
@@ -206,7 +460,7 @@ class Logics:
 
                 fn = self.functions.get(fname)
                 if not fn and fname == "vars":
-                    fn = _vars
+                    fn = lambda name=None: values.get(str(name)) if name is not None else dict(values)
 
                 if fn:
                     try:
@@ -252,6 +506,25 @@ class Logics:
                 stack.op0(ret)
                 return
 
+            case "strings":
+                stack.op0("".join(unescape(child.match[1:-1]) for child in node.children))
+                return
+
+            # Common subexpressions, evaluated once per run
+            case "frame":
+                stack.memo = [None] * node.match
+                self._run(node.children[0], stack, values)
+                return
+
+            case "cse":
+                if (value := stack.memo[node.match]) is None:
+                    self._run(node.children[0], stack, values)
+                    stack.memo[node.match] = stack[-1]
+                else:
+                    stack.append(value)
+
+                return
+
             case "if":
                 assert len(node.children) == 3
                 # Evaluate condition
@@ -282,53 +555,53 @@ class Logics:
 
             case "String":
                 stack.op0(unescape(node.match[1:-1]))  # cut "..." from string.
+            case "const":
+                stack.append(node.match)  # pre-converted by the optimizer
             case "True":
                 stack.op0(True)
 
             # Operations
             case "add":
-                stack.op2(lambda a, b: a + b)
+                stack.op2(operator.add)
             case "attr":
-                stack.op2(lambda value, attr: value[attr])
+                stack.op2(operator.getitem)
             case "div":
-                stack.op2(lambda a, b: a / b)
+                stack.op2(operator.truediv)
             case "entity":
                 ...  # nothing to do
             case "idiv":
-                stack.op2(lambda a, b: a // b)
+                stack.op2(operator.floordiv)
             case "in":
-                stack.op2(lambda a, b: a in b)
+                stack.op2(_in)
             case "invert":
-                stack.op1(lambda a: ~a)
+                stack.op1(operator.invert)
             case "list":
                 stack.op0(list(reversed([stack.pop() for _ in range(len(node.children))])))
             case "mod":
-                stack.op2(lambda a, b: a % b)
+                stack.op2(operator.mod)
             case "mul":
-                stack.op2(lambda a, b: a * b)
+                stack.op2(lambda a, b: a.multiply(b, self.MAX_INT_BITS))
             case "neg":
-                stack.op1(lambda a: -a)
+                stack.op1(operator.neg)
             case "not":
-                stack.op1(lambda a: not a)
+                stack.op1(operator.not_)
             case "outer":
-                stack.op2(lambda a, b: a not in b)
+                stack.op2(_not_in)
             case "pos":
-                stack.op1(lambda a: +a)
+                stack.op1(operator.pos)
             case "pow":
-                stack.op2(lambda a, b: a**b)
+                stack.op2(lambda a, b: a.power(b, self.MAX_INT_BITS))
             case "index":
-                stack.op2(lambda value, idx: value[idx])
+                stack.op2(operator.getitem)
             case "load":
-                stack.op1(lambda name: _vars() if name == "vars" else _vars(name))
+                name = stack.pop()
+                stack.op0(dict(values) if name == "vars" else values.get(str(name)))
             case "slice":
                 # TODO
                 # stack.op3(lambda value, from, to: value.__getitem__(from, to))
                 pass
-            case "strings":
-                stack.op0("".join([stack.pop() for _ in range(node.children.length)]))
-
             case "sub":
-                stack.op2(lambda a, b: a - b)
+                stack.op2(operator.sub)
 
             case node:
                 raise NotImplementedError(f"Logics VM: {node=} is not implemented")
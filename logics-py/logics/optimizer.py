@@ -0,0 +1,337 @@
+"""
+Optimizer pass over Logics ASTs.
+
+optimize() returns a copy of an AST where all literals are pre-converted into
+"const" nodes holding their Value, and constant subtrees are folded into
+such nodes. Folding evaluates subtrees with the closure compiler, so they run
+through the same Value operators as at run time and give identical results.
+Calls are only folded for the pure functions passed in, and conditions and
+and/or with a constant left operand are reduced to the taken branch.
+
+Subtrees are not folded when their evaluation raises, or when their result is
+a list or dict, which could be changed by the caller and must not be shared
+between runs. Multiplications and powers are only folded up to _FOLD_INT_BITS,
+larger results are left to the limit of the Logics object at run time.
+
+Afterwards, structurally identical subtrees which occur more than once are
+wrapped into "cse" nodes, which evaluate them once per run into a slot of a
+memo, and the root is wrapped into a "frame" node with the number of slots.
+Only subtrees without side effects qualify: They must not call other than
+pure functions or use vars, and must not read any variable that is assigned
+by a comprehension, as its value depends on the time of evaluation. Their
+own comprehensions may only assign variables no other comprehension assigns,
+so that skipping their assignments is not noticeable.
+
+Optimized ASTs are cached by their source AST and functions.
+"""
+from types import SimpleNamespace
+from . import closures
+from .cache import LRUCache
+from .fastparser import Node
+from .value import _ERR_MAX_INT_BITS, DictView, ListView, Value, parse_float, parse_int, unescape
+
+# Process-wide cache of optimized ASTs, keyed by the AST and the pure functions.
+cache: LRUCache = LRUCache(maxsize=4096)
+
+# Nodes that are never evaluated on their own, but as part of their parent
+_PARTS = frozenset(("Identifier", "attr", "index", "slice", "eq", "neq", "lt", "lteq", "gt", "gteq", "in", "outer"))
+
+# Limit of the bits of int results of folded multiplications and powers
+_FOLD_INT_BITS = 64
+
+
+def const(value: Value) -> Node:
+    return Node("const", value)
+
+
+class _Folder:
+    """
+    Only used internally;
+    Folds an AST bottom-up, without recursion.
+    """
+
+    def __init__(self, functions: dict):
+        self.functions = functions
+        self.logics = SimpleNamespace(functions=functions, MAX_FOR_ITERATIONS=0, MAX_INT_BITS=_FOLD_INT_BITS)
+
+        # Nodes which are not folded but constant, by their id, with their Value if already known
+        self.constant = {}
+
+    def is_constant(self, node: Node) -> bool:
+        return node.emit == "const" or id(node) in self.constant
+
+    def optimize(self, node: Node) -> Node:
+        todo = [(node, False)]
+        done = []
+
+        while todo:
+            node, visited = todo.pop()
+
+            if visited:
+                if count := len(node.children):
+                    children = done[-count:]
+                    del done[-count:]
+                else:
+                    children = ()
+
+                done.append(self.fold(node, children))
+            else:
+                todo.append((node, True))
+                todo.extend((child, False) for child in reversed(node.children))
+
+        return done[0]
+
+    def fold(self, node: Node, children) -> Node:
+        """
+        Returns the folded node for node with its already folded children.
+        """
+        match node.emit:
+            # Literals
+            case "False":
+                return const(Value(False))
+            case "None":
+                return const(Value(None))
+            case "Number":
+                return const(Value(parse_float(node.match) if "." in node.match else parse_int(node.match)))
+            case "String":
+                return const(Value(unescape(node.match[1:-1])))  # cut "..." from string.
+            case "True":
+                return const(Value(True))
+            case "strings":
+                return const(Value("".join(unescape(child.match[1:-1]) for child in node.children)))
+
+            # Short-circuits on constant conditions
+            case "and" | "or":
+                if children[0].emit == "const":
+                    if bool(children[0].match) == (node.emit == "and"):
+                        return children[1]
+
+                    return children[0]
+
+            case "if":
+                if children[1].emit == "const":
+                    return children[0] if children[1].match else children[2]
+
+            # Nodes depending on values are never constant
+            case "comprehension" | "load":
+                pass
+
+            case "call":
+                if children[0].match in self.functions and all(self.is_constant(child) for child in children[1:]):
+                    return self.evaluate(node, children)
+
+            case _:
+                if all(self.is_constant(child) for child in children):
+                    if node.emit in _PARTS:
+                        node = self.copy(node, children)
+                        self.constant[id(node)] = node, None
+                        return node
+
+                    return self.evaluate(node, children)
+
+        return self.copy(node, children)
+
+    def evaluate(self, node: Node, children) -> Node:
+        """
+        Evaluates a constant node, or returns it when it can't be folded.
+        """
+        node = self.copy(node, children)
+
+        try:
+            value = closures.compile(self.resolve(node))(self.logics, {})
+        except Exception:
+            return node  # raise at run time
+
+        if value.value == _ERR_MAX_INT_BITS:
+            return node  # checked against the limit at run time
+
+        if isinstance(value.value, (list, dict, ListView, DictView)):
+            self.constant[id(node)] = node, value
+            return node
+
+        return const(value)
+
+    def resolve(self, node: Node) -> Node:
+        """
+        Returns node with constant children replaced by their known Values, for evaluation.
+        """
+        children = []
+        for child in node.children:
+            if (entry := self.constant.get(id(child))) is not None:
+                child = const(entry[1]) if entry[1] is not None else self.resolve(child)
+
+            children.append(child)
+
+        return Node(node.emit, node.match, children)
+
+    @staticmethod
+    def copy(node: Node, children) -> Node:
+        if all(new is old for new, old in zip(children, node.children)):
+            return node
+
+        return Node(node.emit, node.match, list(children))
+
+
+class _Eliminator:
+    """
+    Only used internally;
+    Eliminates common subexpressions of an AST, without recursion.
+    """
+
+    def __init__(self, functions: dict):
+        self.functions = functions
+
+        self.keys = {}  # structural signatures to keys
+        self.info = []  # per key: emit, occurrences, read variables, assigned variables, impure
+        self.assigners = {}  # per variable: keys of the comprehensions assigning it
+        self.arguments = set()  # keys of argument lists of calls
+        self.node_keys = {}  # id of node to its key
+
+    def signature(self, node: Node, children: tuple) -> tuple:
+        if node.emit == "const":
+            return node.emit, type(node.match.value), repr(node.match), children
+
+        return node.emit, node.match, children
+
+    def analyze(self, node: Node, children: tuple) -> int:
+        """
+        Returns the key of node, with the keys of its children.
+        """
+        signature = self.signature(node, children)
+        if (key := self.keys.get(signature)) is not None:
+            self.info[key][1] += 1
+            return key
+
+        reads = frozenset().union(*(self.info[child][2] for child in children))
+        assigns = frozenset().union(*(self.info[child][3] for child in children))
+        impure = any(self.info[child][4] for child in children)
+
+        match node.emit:
+            case "load":
+                if (name := node.children[0].match) == "vars":
+                    impure = True
+                else:
+                    reads = frozenset((name,))
+
+            case "call":
+                impure = impure or node.children[0].match not in self.functions
+                self.arguments.update(children[1:])
+
+            case "comprehension":
+                name = node.children[1].match
+                inner = frozenset().union(*(self.info[child][2] for child in children[:1] + children[3:]))
+                reads = self.info[children[2]][2] | (inner - {name})
+                assigns |= {name}
+
+        key = self.keys[signature] = len(self.info)
+        self.info.append([node.emit, 1, reads, assigns, impure])
+
+        if node.emit == "comprehension":
+            self.assigners.setdefault(name, set()).add(key)
+
+        return key
+
+    def is_pure(self, key: int) -> bool:
+        """
+        Returns whether the subtrees of a key can be evaluated once per run.
+        """
+        emit, _, reads, assigns, impure = self.info[key]
+
+        return (
+            not impure
+            and emit not in ("const", "load")
+            and emit not in _PARTS
+            and key not in self.arguments
+            and not reads & self.assigners.keys()
+            and all(len(self.assigners[name]) == 1 for name in assigns)
+        )
+
+    def optimize(self, root: Node) -> Node:
+        # Compute the keys of all nodes bottom-up
+        todo = [(root, False)]
+        done = []
+
+        while todo:
+            node, visited = todo.pop()
+
+            if visited:
+                if count := len(node.children):
+                    children = tuple(done[-count:])
+                    del done[-count:]
+                else:
+                    children = ()
+
+                done.append(key := self.analyze(node, children))
+                self.node_keys[id(node)] = key
+            else:
+                todo.append((node, True))
+                todo.extend((child, False) for child in reversed(node.children))
+
+        # Count the occurrences that are evaluated, which excludes those inside
+        # of repeated occurrences of another common subexpression
+        pure = {key for key in range(len(self.info)) if self.info[key][1] > 1 and self.is_pure(key)}
+        reached = dict.fromkeys(pure, 0)
+        todo = [root]
+
+        while todo:
+            node = todo.pop()
+            if (key := self.node_keys[id(node)]) in pure:
+                reached[key] += 1
+                if reached[key] > 1:
+                    continue
+
+            todo.extend(reversed(node.children))
+
+        common = {key for key, count in reached.items() if count > 1}
+
+        # Rebuild, sharing identical subtrees, and wrap common ones into slots
+        slots = {}
+        built = {}
+        todo = [(root, False)]
+        done = []
+
+        while todo:
+            node, visited = todo.pop()
+            key = self.node_keys[id(node)]
+
+            if visited:
+                if count := len(node.children):
+                    children = done[-count:]
+                    del done[-count:]
+                else:
+                    children = ()
+
+                node = _Folder.copy(node, children)
+                if key in common:
+                    node = Node("cse", slots.setdefault(key, len(slots)), [node])
+
+                built[key] = node
+                done.append(node)
+
+            elif key in built:
+                done.append(built[key])
+            else:
+                todo.append((node, True))
+                todo.extend((child, False) for child in reversed(node.children))
+
+        if slots:
+            return Node("frame", len(slots), done)
+
+        return done[0]
+
+
+def optimize(node: Node, functions: dict | None = None) -> Node:
+    """
+    Returns the optimized AST for node.
+
+    functions maps the names of pure functions which may be folded to their
+    implementation.
+    """
+    functions = functions or {}
+    key = (node, frozenset(functions.items()))
+
+    if (ret := cache.get(key)) is None:
+        ret = _Eliminator(functions).optimize(_Folder(functions).optimize(node))
+        cache.put(key, ret)
+
+    return ret
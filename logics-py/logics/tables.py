@@ -0,0 +1,90 @@
+"""
+Compact parse tables for LogicsFastParser.
+
+The tables of the generated LogicsParser are stored in _tables.py as flat
+little-endian int16 arrays packed into bytes literals, which are cheap to
+import and only unpacked on first parse. Whenever parser.py is regenerated,
+run `python -m logics.tables` to regenerate _tables.py from it.
+
+Packed layout of the action and goto tables, per state:
+
+    number of entries, followed by (symbol, action, index) per entry
+"""
+import sys
+from array import array
+
+
+def unpack(data: bytes) -> list[int]:
+    values = array("h")
+    values.frombytes(data)
+
+    if sys.byteorder != "little":
+        values.byteswap()
+
+    return values.tolist()
+
+
+def pack(values) -> bytes:
+    values = array("h", values)
+
+    if sys.byteorder != "little":
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def unpack_states(data: bytes) -> tuple[tuple[tuple[int, int, int], ...], ...]:
+    """
+    Unpacks an action or goto table into the nested tuple form of LogicsParser.
+    """
+    values = unpack(data)
+    states = []
+    i = 0
+
+    while i < len(values):
+        count = values[i]
+        states.append(tuple(tuple(values[j : j + 3]) for j in range(i + 1, i + 1 + count * 3, 3)))
+        i += 1 + count * 3
+
+    return tuple(states)
+
+
+def pack_states(states) -> bytes:
+    values = []
+    for state in states:
+        values.append(len(state))
+        for entry in state:
+            values.extend(entry)
+
+    return pack(values)
+
+
+def generate() -> str:
+    """
+    Returns the source of _tables.py, generated from the tables of LogicsParser.
+    """
+    from .parser import LogicsParser
+
+    # Semantic actions are methods of the generated parser, and can't be packed.
+    assert not [name for name in dir(LogicsParser) if name.startswith(("_reduce_action_", "_scan_action_"))]
+
+    lines = [
+        "# This module was generated from parser.py by `python -m logics.tables`.",
+        "# DO NOT EDIT THIS FILE MANUALLY, IT WILL GO AWAY!",
+        "",
+        f"SYMBOLS = {LogicsParser._symbols!r}",
+        f"PRODUCTIONS = {tuple(prod[1:] for prod in LogicsParser._productions)!r}",
+        f"ACT = {pack_states(LogicsParser._act)!r}",
+        f"GO = {pack_states(LogicsParser._go)!r}",
+        f"DEF_PROD = {pack(LogicsParser._def_prod)!r}",
+        "",
+    ]
+
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import os
+
+    with open(os.path.join(os.path.dirname(__file__), "_tables.py"), "w") as f:
+        f.write(generate())
@@ -1,8 +1,50 @@
+import functools
+import math
+import operator
 import re
+from collections.abc import Mapping, Sequence
 
 MAX_STRING_LENGTH: int = 32 * 1024
 _ERR_MAX_STRING_LENGTH: str = f"#ERR limit of {MAX_STRING_LENGTH} reached"
 
+# Default limit of the bits of integers built by a multiplication or power, see Value.multiply()
+MAX_INT_BITS: int = 4 * 1024
+_ERR_MAX_INT_BITS: str = "#ERR:integer too large"
+
+
+# Prefixes of strings parsed as numbers, matched after leading whitespace
+_INT_PREFIX = re.compile(r"[+\-0-9]*")
+_FLOAT_PREFIX = re.compile(r"[+\-0-9]*(?:\.[+\-0-9]*)?")
+
+# Strings which are aligned into numbers must look like a number's str()
+_NUMBER = re.compile(r"-?[0-9]+(?:\.[0-9]+)?")
+
+# Strings which may still become a number when something is appended
+_NUMBER_CHARS = re.compile(r"[\-0-9.]*")
+
+_NUMERIC = frozenset("-0123456789")  # first characters of strings aligned into numbers
+
+# Only strings up to this length are memoized when parsed, like form inputs
+_MEMO_LENGTH = 64
+
+
+def _int_prefix(value: str) -> int | None:
+    try:
+        return int(_INT_PREFIX.match(value.lstrip()).group())
+    except ValueError:
+        return None
+
+
+def _float_prefix(value: str) -> float | None:
+    try:
+        return float(_FLOAT_PREFIX.match(value.lstrip()).group())
+    except ValueError:
+        return None
+
+
+_memo_int_prefix = functools.lru_cache(maxsize=4096)(_int_prefix)
+_memo_float_prefix = functools.lru_cache(maxsize=4096)(_float_prefix)
+
 
 def parse_int(value, ret=0):
     """
@@ -22,20 +64,11 @@ def parse_int(value, ret=0):
     if not isinstance(value, str):
         value = str(value)
 
-    conv = ""
-    value = value.lstrip()
-
-    for ch in value:
-        if ch not in "+-0123456789":
-            break
-
-        conv += ch
-
-    try:
-        return int(conv)
-    except ValueError:
+    if (number := (_memo_int_prefix if len(value) <= _MEMO_LENGTH else _int_prefix)(value)) is None:
         return ret
 
+    return number
+
 
 def parse_float(value, ret=0.0):
     """
@@ -55,27 +88,11 @@ def parse_float(value, ret=0.0):
     if not isinstance(value, str):
         value = str(value)
 
-    conv = ""
-    value = value.lstrip()
-    dot = False
-
-    for ch in value:
-        if ch not in "+-0123456789.":
-            break
-
-        if ch == ".":
-            if dot:
-                break
-
-            dot = True
-
-        conv += ch
-
-    try:
-        return float(conv)
-    except ValueError:
+    if (number := (_memo_float_prefix if len(value) <= _MEMO_LENGTH else _float_prefix)(value)) is None:
         return ret
 
+    return number
+
 
 def unescape(s: str) -> str:
     """
@@ -105,31 +122,333 @@ def unescape(s: str) -> str:
     return re.sub(r"\\(\\|\'|\"|a|b|f|n|r|t|v|x[0-9A-Fa-f]{2}|u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8})", replace_escape, s)
 
 
+def wrap(value) -> "Value":
+    """
+    Returns value wrapped into a Value, or value itself when it already is one.
+
+    Values are never changed after their construction, so they can be shared.
+    """
+    if isinstance(value, Value):
+        return value
+
+    return Value(value)
+
+
+# Cache the Values of container items once they were accessed, see ListView and DictView
+CACHE_WRAPPERS: bool = False
+
+# Lists of at least this length are indexed by membership tests, see ListView
+_INDEX_LENGTH = 16
+
+_MISSING = object()
+
+
+class ListView(Sequence):
+    """
+    The items of a list Value, over a host list without copying it.
+
+    Items are wrapped into Values on access; with CACHE_WRAPPERS, the Value
+    of an item is kept for further accesses. Comparisons and repr() behave
+    like a list of the wrapped items.
+
+    Membership tests on lists of at least _INDEX_LENGTH items build a set of
+    the aligned items once, so further tests on the same Value are hashed.
+    Only unhashable items, like lists, are still scanned.
+    """
+
+    __slots__ = ("host", "cache", "members", "unhashable")
+
+    def __init__(self, host: list):
+        self.host = host
+        self.cache = {} if CACHE_WRAPPERS else None
+        self.members = None  # set of the hashable aligned items, built on demand
+        self.unhashable = None  # list of the other aligned items
+
+    def __len__(self):
+        return len(self.host)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [wrap(item) for item in self.host[index]]
+
+        if self.cache is None:
+            return wrap(self.host[index])
+
+        if index < 0:
+            index += len(self.host)
+
+        if (ret := self.cache.get(index)) is None:
+            ret = self.cache[index] = wrap(self.host[index])
+
+        return ret
+
+    def __iter__(self):
+        if self.cache is None:
+            return map(wrap, self.host)
+
+        return (self[i] for i in range(len(self.host)))
+
+    def __contains__(self, item):
+        if isinstance(item, Value):
+            item = item.value
+
+        if len(self.host) < _INDEX_LENGTH:
+            for value in self.host:
+                if value is item or wrap(value).value == item:
+                    return True
+
+            return False
+
+        if (members := self.members) is None:
+            # Built aside and published at once, as the Value may be shared between threads
+            members = set()
+            unhashable = []
+
+            for value in self.host:
+                value = wrap(value).value
+                try:
+                    members.add(value)
+                except TypeError:
+                    unhashable.append(value)
+
+            self.unhashable = unhashable
+            self.members = members
+
+        try:
+            return item in members
+        except TypeError:
+            # An unhashable item can only be equal to an unhashable one
+            return any(value == item for value in self.unhashable)
+
+    def __eq__(self, other):
+        if not isinstance(other, (ListView, list)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a is b or a == b for a, b in zip(self, other))
+
+    def __lt__(self, other):
+        return list(self) < (list(other) if isinstance(other, ListView) else other)
+
+    def __le__(self, other):
+        return list(self) <= (list(other) if isinstance(other, ListView) else other)
+
+    def __gt__(self, other):
+        return list(self) > (list(other) if isinstance(other, ListView) else other)
+
+    def __ge__(self, other):
+        return list(self) >= (list(other) if isinstance(other, ListView) else other)
+
+    def __repr__(self):
+        return "[" + ", ".join(repr(item) for item in self) + "]"
+
+
+class DictView(Mapping):
+    """
+    The items of a dict Value, over a host dict without copying it.
+
+    Keys and values are wrapped into Values on access; with CACHE_WRAPPERS,
+    the Values of accessed values are kept. Keys are aligned like the keys of
+    a dict of Values, so a key "1" is found as 1, but they are looked up as
+    native values. Non-numeric str keys, like attribute names, are looked up
+    in the host dict directly, other keys in an index of the aligned keys.
+    """
+
+    __slots__ = ("host", "index", "cache")
+
+    def __init__(self, host: dict):
+        self.host = host
+        self.index = None  # aligned keys to host keys, built on demand
+        self.cache = {} if CACHE_WRAPPERS else None
+
+    def lookup(self, key):
+        """
+        Returns the host key for a key, or _MISSING.
+        """
+        if isinstance(key, Value):
+            key = key.value
+
+        # A str which is not aligned into a number is looked up as is
+        if type(key) is str and key[:1] not in _NUMERIC:
+            return key if key in self.host else _MISSING
+
+        if (index := self.index) is None:
+            # Built aside and published at once, as the Value may be shared between threads
+            index = {}
+            for host in self.host:
+                index[wrap(host).value] = host
+
+            self.index = index
+
+        try:
+            return index.get(key, _MISSING)
+        except TypeError:  # unhashable
+            return _MISSING
+
+    def wrapped(self, key):
+        if self.cache is None:
+            return wrap(self.host[key])
+
+        if (ret := self.cache.get(key)) is None:
+            ret = self.cache[key] = wrap(self.host[key])
+
+        return ret
+
+    def __getitem__(self, key):
+        if (host := self.lookup(key)) is _MISSING:
+            raise KeyError(key)
+
+        return self.wrapped(host)
+
+    def get(self, key, default=None):
+        # Fast path for attribute names
+        if type(key) is str and self.cache is None and key[:1] not in _NUMERIC:
+            if (item := self.host.get(key, _MISSING)) is _MISSING:
+                return default
+
+            return wrap(item)
+
+        if (host := self.lookup(key)) is _MISSING:
+            return default
+
+        return self.wrapped(host)
+
+    def __contains__(self, key):
+        return self.lookup(key) is not _MISSING
+
+    def __iter__(self):
+        self.lookup(None)  # builds the index
+        return map(wrap, self.index)
+
+    def __len__(self):
+        self.lookup(None)
+        return len(self.index)
+
+    def __bool__(self):
+        return bool(self.host)
+
+    def __repr__(self):
+        return "{" + ", ".join(f"{key!r}: {value!r}" for key, value in self.items()) + "}"
+
+
+# Type tags of Values, in Value.tag
+NONE = 0
+BOOL = 1
+INT = 2
+FLOAT = 3
+STR = 4
+LIST = 5  # also tuple
+DICT = 6
+OTHER = 7
+
+_TAGS = {
+    type(None): NONE,
+    bool: BOOL,
+    int: INT,
+    float: FLOAT,
+    str: STR,
+    list: LIST,
+    tuple: LIST,
+    ListView: LIST,
+    dict: DICT,
+    DictView: DICT,
+}
+_VIEWS = {ListView: LIST, DictView: DICT}
+_NAMES = ("NoneType", "bool", "int", "float", "str", "list", "dict")
+
+_ALLOW = (int, bool, float, list, tuple, dict, str)
+
+# Small ints are shared, like in CPython
+_SMALL_MIN = -5
+_SMALL_MAX = 256
+
+
 class Value:
-    def __init__(self, value=None, allow=(int, bool, float, list, tuple, dict, str), default=None, optimize=True):
+    """
+    An immutable value of a Logics expression.
+
+    Values are aligned on construction, and carry a type tag. None, True,
+    False, "" and small ints are shared singletons, and constructing a Value
+    from a Value returns it as it is.
+    """
+
+    __slots__ = ("value", "tag")
+
+    def __new__(cls, value=None, allow=_ALLOW, default=None, optimize=True):
         if value is None:
-            self.value = None
+            return _NONE
         elif isinstance(value, Value):
-            self.value = value.value
-        else:
-            self.value = Value.align(value, allow, default, optimize)
+            return value
 
-            # Ensure that container values are wrapped by Value objects as well
-            if isinstance(self.value, list):
-                self.value = [Value(item) for item in self.value]
-            elif isinstance(self.value, dict):
-                self.value = {Value(k): Value(v) for k, v in self.value.items()}
+        tag = None
+
+        # Fast path for numbers, non-numeric strings and containers, which need no or only a cheap alignment
+        if allow is _ALLOW and default is None:
+            if (vtype := type(value)) is int:
+                return integer(value)
+            elif vtype is bool:
+                return _TRUE if value else _FALSE
+            elif vtype is float:
+                if optimize and (value.is_integer() or not math.isfinite(value)):
+                    return integer(int(value))  # raises on inf and nan
+
+                tag = FLOAT
+            elif vtype is str:
+                if optimize and value[:1] in _NUMERIC:
+                    value = _align_str(value) if len(value) <= _MEMO_LENGTH else Value.align(value)
+                    if (vtype := type(value)) is int:
+                        return integer(value)
+                    elif vtype is float:
+                        return _new(value, FLOAT)
+
+                if not value:
+                    return _EMPTY
+                elif len(value) > MAX_STRING_LENGTH:
+                    value = _ERR_MAX_STRING_LENGTH
+
+                tag = STR
+            elif vtype is dict:
+                value = DictView(value)
+                tag = DICT
+            elif vtype is list:
+                value = ListView(value)
+                tag = LIST
+
+        if tag is None and (tag := _VIEWS.get(type(value))) is None:
+            value = Value.align(value, allow, default, optimize)
+
+            # Container values are wrapped by Value objects on access
+            if isinstance(value, list):
+                value = ListView(value)
+            elif isinstance(value, dict):
+                value = DictView(value)
+            elif isinstance(value, str) and len(value) > MAX_STRING_LENGTH:
+                value = _ERR_MAX_STRING_LENGTH
+
+            if (tag := _TAGS.get(type(value), OTHER)) == INT:
+                return integer(value)
+            elif tag == BOOL:
+                return _TRUE if value else _FALSE
+            elif tag == NONE:
+                return _NONE
+            elif tag == STR and not value:
+                return _EMPTY
+
+        ret = object.__new__(cls)
+        ret.value = value
+        ret.tag = tag
+        return ret
 
-        if isinstance(self.value, str) and len(self.value) > MAX_STRING_LENGTH:
-            self.value = _ERR_MAX_STRING_LENGTH
+    def __reduce__(self):
+        # Values are restored without __new__(), which would return a singleton
+        return _new, (self.value, self.tag)
 
     @staticmethod
-    def align(value, allow=(int, bool, float, list, tuple, dict, str), default=None, optimize=True):
+    def align(value, allow=_ALLOW, default=None, optimize=True):
         assert allow  # allow must not be empty!
 
         if optimize:
             # Perform string conversion into float or int, whatever fits best.
-            if isinstance(value, str):
+            if isinstance(value, str) and _NUMBER.fullmatch(value):
                 ival = parse_int(value, None) if int in allow else None
                 fval = parse_float(value, None) if float in allow else None
 
@@ -140,9 +459,8 @@ class Value:
 
             # When a float fits into an int, store it as int
             if isinstance(value, float) and float in allow and int in allow:
-                ival = int(value)
-                if float(ival) == value:
-                    value = ival
+                if value.is_integer() or not math.isfinite(value):
+                    value = int(value)  # raises on inf and nan
 
         if default is None:
             default = allow[-1]  # use last type of allow as default!
@@ -157,17 +475,16 @@ class Value:
         return default
 
     def type(self):
-        name = type(self.value).__name__
-        if name == "tuple":
-            name = "list"
+        if self.tag == OTHER:
+            return type(self.value).__name__
 
-        return name
+        return _NAMES[self.tag]
 
     def __hash__(self):
         return hash(self.value)
 
     def __repr__(self):
-        if self.type() == "str":
+        if self.tag == STR:
             return '"' + re.sub(r"([\"\\])", r"\\\1", self.value) + '"'
 
         return repr(self.value)
@@ -179,43 +496,42 @@ class Value:
         return bool(self.value)
 
     def __int__(self):
-        if self.type() == "str":
+        if self.tag == STR:
             return parse_int(self.value)
-        elif self.value is None:
+        elif self.tag == NONE:
             return 0
 
         return int(self.value)
 
     def __float__(self):
-        if self.type() == "str":
+        if self.tag == STR:
             return parse_float(self.value)
-        elif self.value is None:
+        elif self.tag == NONE:
             return 0.0
 
         return float(self.value)
 
     def list(self) -> list:
-        if self.type() == "list":
+        if self.tag == LIST:
             return self.value
 
         return [self.value]
 
     def dict(self) -> dict:
-        if self.type() == "dict":
+        if self.tag == DICT:
             return self.value
 
         return {i: i for i in self.list()}
 
     def __len__(self):
-        if self.type() in ("dict", "list", "str"):
+        if self.tag in (DICT, LIST, STR):
             return len(self.value)
 
         return len(str(self))
 
     def __contains__(self, item):
-        if self.type() in ("dict", "list"):
-            value = Value(item)
-            return value.value in self.value
+        if self.tag in (DICT, LIST):
+            return wrap(item).value in self.value
 
         return str(item) in str(self)
 
@@ -223,13 +539,13 @@ class Value:
         if isinstance(item, Value):
             item = item.value
 
-        if self.type() == "dict":
+        if self.tag == DICT:
             if isinstance(item, slice):
                 return Value(None)
 
             return self.value.get(item)
 
-        value = self.value if self.type() == "list" else str(self)
+        value = self.value if self.tag == LIST else str(self)
 
         try:
             return value[item]
@@ -237,18 +553,18 @@ class Value:
             return None
 
     def __iter__(self):
-        value = self.value if self.type() in ("dict", "list") else [self]
+        value = self.value if self.tag in (DICT, LIST) else [self]
         return iter(value)
 
     def __eq__(self, other):
-        return self.value == Value(other).value
+        return self.value == wrap(other).value
 
     def __ne__(self, other):
-        return self.value != Value(other).value
+        return self.value != wrap(other).value
 
     def __compare(self, op, other):
         value = self.value
-        other = Value(other).value
+        other = other.value
 
         if value is None:
             value = -1
@@ -256,128 +572,287 @@ class Value:
             other = -1
 
         try:
-            match op:
-                case "lt":
-                    return value < other
-                case "gt":
-                    return value > other
-                case "le":
-                    return value <= other
-                case "ge":
-                    return value >= other
-                case _:
-                    raise NotImplemented(f"Operator {op!r} not implemented")
-
+            return op(value, other)
         except TypeError:
             return False
 
+    # Comparisons of numbers, and arithmetic of two ints or two floats, take a
+    # fast path without any alignment. BOOL, INT and FLOAT are the numeric tags.
+
     def __lt__(self, other):
-        return self.__compare("lt", other)
+        other = wrap(other)
+        if BOOL <= self.tag <= FLOAT and BOOL <= other.tag <= FLOAT:
+            return self.value < other.value
+
+        return self.__compare(operator.lt, other)
 
     def __gt__(self, other):
-        return self.__compare("gt", other)
+        other = wrap(other)
+        if BOOL <= self.tag <= FLOAT and BOOL <= other.tag <= FLOAT:
+            return self.value > other.value
+
+        return self.__compare(operator.gt, other)
 
     def __le__(self, other):
-        return self.__compare("le", other)
+        other = wrap(other)
+        if BOOL <= self.tag <= FLOAT and BOOL <= other.tag <= FLOAT:
+            return self.value <= other.value
+
+        return self.__compare(operator.le, other)
 
     def __ge__(self, other):
-        return self.__compare("ge", other)
+        other = wrap(other)
+        if BOOL <= self.tag <= FLOAT and BOOL <= other.tag <= FLOAT:
+            return self.value >= other.value
+
+        return self.__compare(operator.ge, other)
 
     def __add__(self, other):
-        other = Value(other)
-        match self.type(), other.type():
-            case ("str", _) | (_, "str"):
-                return Value(str(self) + str(other))
-            case ("float", _) | (_, "float"):
-                return Value(float(self) + float(other))
-            case _:
-                return Value(int(self) + int(other))
+        other = wrap(other)
+        if (tag := self.tag) == other.tag:
+            if tag == INT:
+                return integer(self.value + other.value)
+            elif tag == FLOAT:
+                return Value(self.value + other.value)
 
-    def __sub__(self, other):
-        other = Value(other)
-        match self.type(), other.type():
-            case ("float", _) | (_, "float"):
-                return Value(float(self) - float(other))
-            case _:
-                return Value(int(self) - int(other))
+        if self.tag == STR or other.tag == STR:
+            left, right = str(self), str(other)
 
-    def __mul__(self, other):
-        other = Value(other)
-        match self.type(), other.type():
-            case ("str", _) | (_, "str"):
-                if self.type() == "str":
-                    repeat = str(self)
-                    count = int(other)
-                else:
-                    repeat = str(other)
-                    count = int(self)
+            # Check the limit before the string is built
+            if len(left) + len(right) > MAX_STRING_LENGTH:
+                return Value(_ERR_MAX_STRING_LENGTH)
 
-                # Limit to maximum length of generated string (#18)
-                if count * len(repeat) > MAX_STRING_LENGTH:
-                    return Value(_ERR_MAX_STRING_LENGTH)
+            return Value(left + right)
+        elif self.tag == FLOAT or other.tag == FLOAT:
+            return Value(float(self) + float(other))
 
-                return Value(count * repeat)
+        return Value(int(self) + int(other))
 
-            case ("float", _) | (_, "float"):
-                return Value(float(self) * float(other))
+    def __sub__(self, other):
+        other = wrap(other)
+        if (tag := self.tag) == other.tag:
+            if tag == INT:
+                return integer(self.value - other.value)
+            elif tag == FLOAT:
+                return Value(self.value - other.value)
+
+        if self.tag == FLOAT or other.tag == FLOAT:
+            return Value(float(self) - float(other))
+
+        return Value(int(self) - int(other))
 
-            case _:
-                return Value(int(self) * int(other))
+    def __mul__(self, other):
+        return self.multiply(other, MAX_INT_BITS)
+
+    def multiply(self, other, limit: int) -> "Value":
+        """
+        Returns self * other, or an error when an int result would exceed limit bits.
+
+        The size of the result is estimated from the bit lengths of the operands,
+        so larger results are never computed.
+        """
+        other = wrap(other)
+        if (tag := self.tag) == other.tag:
+            if tag == INT:
+                if self.value.bit_length() + other.value.bit_length() <= limit:
+                    return integer(self.value * other.value)
+            elif tag == FLOAT:
+                return Value(self.value * other.value)
+
+        if self.tag == STR or other.tag == STR:
+            if self.tag == STR:
+                repeat = str(self)
+                count = int(other)
+            else:
+                repeat = str(other)
+                count = int(self)
+
+            # Limit to maximum length of generated string (#18)
+            if count * len(repeat) > MAX_STRING_LENGTH:
+                return Value(_ERR_MAX_STRING_LENGTH)
+
+            return Value(count * repeat)
+
+        elif self.tag == FLOAT or other.tag == FLOAT:
+            return Value(float(self) * float(other))
+
+        # A product has as many bits as its operands together, or one less
+        a, b = int(self), int(other)
+        if a.bit_length() + b.bit_length() > limit + 1 or (ret := a * b).bit_length() > limit:
+            return Value(_ERR_MAX_INT_BITS)
+
+        return Value(ret)
 
     def __truediv__(self, other):
-        other = Value(other)
-        match self.type(), other.type():
-            case ("float", _) | (_, "float"):
-                if not (other := float(other)):
-                    return Value("#ERR:division by zero")
+        other = wrap(other)
+        if ((tag := self.tag) == INT or tag == FLOAT) and tag == other.tag and other.value:
+            return Value(self.value / other.value)
 
-                return Value(float(self) / other)
-            case _:
-                if not (other := int(other)):
-                    return Value("#ERR:division by zero")
+        if self.tag == FLOAT or other.tag == FLOAT:
+            if not (other := float(other)):
+                return Value("#ERR:division by zero")
 
-                return Value(int(self) / other)
+            return Value(float(self) / other)
+
+        if not (other := int(other)):
+            return Value("#ERR:division by zero")
+
+        return Value(int(self) / other)
 
     def __floordiv__(self, other):
-        other = Value(other)
+        other = wrap(other)
+        if self.tag == INT and other.tag == INT and other.value:
+            return integer(self.value // other.value)
+
         if not (other := int(other)):
             return Value("#ERR:division by zero")
 
         return Value(int(self) // other)
 
     def __mod__(self, other):
-        other = Value(other)
-        match self.type(), other.type():
-            case ("float", _) | (_, "float"):
-                if not (other := float(other)):
-                    return Value("#ERR:modulo by zero")
+        other = wrap(other)
+        if ((tag := self.tag) == INT or tag == FLOAT) and tag == other.tag and other.value:
+            return Value(self.value % other.value)
 
-                return Value(float(self) % other)
-            case _:
-                if not (other := int(other)):
-                    return Value("#ERR:modulo by zero")
+        if self.tag == FLOAT or other.tag == FLOAT:
+            if not (other := float(other)):
+                return Value("#ERR:modulo by zero")
+
+            return Value(float(self) % other)
+
+        if not (other := int(other)):
+            return Value("#ERR:modulo by zero")
 
-                return Value(int(self) % other)
+        return Value(int(self) % other)
 
     def __pow__(self, other):
-        other = Value(other)
-        match self.type(), other.type():
-            case ("float", _) | (_, "float"):
-                return Value(float(self) ** float(other))
-            case _:
-                return Value(int(self) ** int(other))
+        return self.power(other, MAX_INT_BITS)
+
+    def power(self, other, limit: int) -> "Value":
+        """
+        Returns self ** other, or an error when an int result would exceed limit bits.
+
+        The size of the result is estimated from the logarithm of the base and
+        the exponent, so larger results are never computed.
+        """
+        other = wrap(other)
+        if self.tag == FLOAT or other.tag == FLOAT:
+            return Value(float(self) ** float(other))
+
+        a, b = int(self), int(other)
+        if b > 1 and not -1 <= a <= 1:
+            # A power has about b * log2(|a|) bits, up to rounding
+            if b > limit or b * math.log2(abs(a)) > limit + 1 or (ret := a**b).bit_length() > limit:
+                return Value(_ERR_MAX_INT_BITS)
+
+            return Value(ret)
+
+        return Value(a**b)
 
     def __pos__(self):
-        if self.type() == "float":
+        if self.tag == FLOAT:
             return Value(+float(self))
 
         return Value(+int(self))
 
     def __neg__(self):
-        if self.type() == "float":
+        if self.tag == INT:
+            return integer(-self.value)
+        elif self.tag == FLOAT:
             return Value(-float(self))
 
         return Value(-int(self))
 
     def __invert__(self):
         return Value(~int(self))
+
+
+def attribute(value: Value, name: str) -> Value:
+    """
+    Returns the Value of the attribute name of value, which is value[name].
+
+    name must be an identifier, so it is never aligned into a number, and is
+    looked up in a dict without any further Value.
+    """
+    if value.tag == DICT and (view := value.value).cache is None:
+        if (item := view.host.get(name, _MISSING)) is _MISSING:
+            return _NONE
+
+        return wrap(item)
+
+    return wrap(value[name])
+
+
+def join(strings: list[str], delimiter: str = "") -> str:
+    """
+    Returns delimiter.join(strings), or the error of MAX_STRING_LENGTH when the
+    result would exceed it, which is checked before it is built.
+    """
+    length = sum(map(len, strings)) + len(delimiter) * (len(strings) - 1)
+    if length > MAX_STRING_LENGTH:
+        return _ERR_MAX_STRING_LENGTH
+
+    return delimiter.join(strings)
+
+
+def concat(*values: Value) -> Value:
+    """
+    Returns the sum of values, added from left to right like a + b + c.
+
+    Once the sum is a str which can't become a number anymore, the remaining
+    values are collected with their total length, and joined once. So chains
+    of concatenations take linear time, and MAX_STRING_LENGTH is checked
+    before a longer string is built.
+    """
+    ret = values[0]
+
+    for i in range(1, len(values)):
+        if ret.tag == STR and not _NUMBER_CHARS.fullmatch(ret.value):
+            break
+
+        ret = ret + values[i]
+    else:
+        return ret
+
+    parts = [ret.value]
+    length = len(ret.value)
+
+    for value in values[i:]:
+        part = str(value)
+        length += len(part)
+
+        # Like Value(), the error replaces the sum when it exceeds the limit
+        if length > MAX_STRING_LENGTH:
+            parts = [_ERR_MAX_STRING_LENGTH]
+            length = len(_ERR_MAX_STRING_LENGTH)
+        else:
+            parts.append(part)
+
+    return Value("".join(parts))
+
+
+def _new(value, tag: int) -> Value:
+    ret = object.__new__(Value)
+    ret.value = value
+    ret.tag = tag
+    return ret
+
+
+def integer(value: int) -> Value:
+    """
+    Returns the Value of an int, which needs no alignment.
+    """
+    if _SMALL_MIN <= value <= _SMALL_MAX:
+        return _SMALL[value - _SMALL_MIN]
+
+    return _new(value, INT)
+
+
+# Memoized alignment of short strings, which may look like numbers
+_align_str = functools.lru_cache(maxsize=4096)(Value.align)
+
+_NONE = _new(None, NONE)
+_FALSE = _new(False, BOOL)
+_TRUE = _new(True, BOOL)
+_EMPTY = _new("", STR)
+_SMALL = tuple(_new(i, INT) for i in range(_SMALL_MIN, _SMALL_MAX + 1))
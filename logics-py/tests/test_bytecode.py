@@ -0,0 +1,52 @@
+import sys
+import pytest
+from logics import Logics, bytecode
+from logics.fastparser import LogicsFastParser
+
+
+@pytest.mark.parametrize(
+    "src,expect",
+    [
+        (" or ".join(["0"] * 5000) + " or 42", 42),
+        (" and ".join(["1"] * 5000) + " and 0", 0),
+        ("1 if 0 else " * 5000 + "2", 2),
+        ("-" * 5000 + "1", 1),
+        (" + ".join(["1"] * 5000), 5000),
+        ("[" * 2000 + "1" + "]" * 2000 + "[0]" * 2000, 1),
+    ],
+)
+def test_bytecode_deep(src, expect):
+    assert len(src) > sys.getrecursionlimit()
+    assert Logics(src, backend="bytecode").run() == expect
+
+
+def test_bytecode_cache():
+    bytecode.cache.clear()
+    ast = LogicsFastParser().parse("a + 1")
+
+    code = bytecode.compile(ast)
+    assert bytecode.compile(ast) is code
+    assert bytecode.cache.info().hits == 1
+
+
+def test_bytecode_disassemble():
+    code = bytecode.compile(LogicsFastParser().parse("[x for x in l if x] or a < 1 < b"))
+    assert bytecode.disassemble(code).splitlines() == [
+        "      0 LOAD                   'l'",
+        "      1 FOR_START",
+        ">>    2 FOR_ITER               x, done to 8",
+        "      3 LOAD                   'x'",
+        "      4 POP_JUMP_IF_FALSE      to 2",
+        "      5 LOAD                   'x'",
+        "      6 FOR_APPEND",
+        "      7 JUMP                   to 2",
+        ">>    8 FOR_END",
+        "      9 JUMP_IF_TRUE_OR_POP    to 17",
+        "     10 LOAD                   'a'",
+        "     11 CONST                  1",
+        "     12 COMPARE                lt, else to 17",
+        "     13 LOAD                   'b'",
+        "     14 COMPARE                lt, else to 17",
+        "     15 POP",
+        "     16 CONST                  True",
+    ]
@@ -0,0 +1,71 @@
+import threading
+from logics import Logics
+from logics.cache import LRUCache
+
+
+def test_lru_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.info() == (3, 1, 1, 2, 2)
+
+    cache.resize(1)
+    assert cache.info() == (3, 1, 2, 1, 1)
+    assert "c" in cache
+
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 1, 0)
+
+
+def test_lru_disabled():
+    cache = LRUCache(maxsize=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_threads():
+    cache = LRUCache(maxsize=64)
+
+    def worker(n):
+        for i in range(1000):
+            key = (n * 7 + i) % 100
+            if cache.get(key) is None:
+                cache.put(key, key)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = cache.info()
+    assert info.hits + info.misses == 8000
+    assert info.currsize == 64
+
+
+def test_logics_cache():
+    Logics.cache.clear()
+
+    first = Logics("a  +  1 # comment\n")
+    second = Logics("a + 1")
+    third = Logics("a+1")
+    assert first.ast is second.ast is third.ast
+
+    # Sources are looked up as they are before they are normalized
+    assert Logics.cache.info()[:2] == (2, 3)
+    assert Logics("a+1").ast is first.ast
+    assert Logics.cache.info()[:2] == (3, 3)
+
+    # String contents are not normalized
+    assert Logics("'a  b'").ast is not Logics("'a b'").ast
+    assert Logics("'a  b'").run() == "a  b"
+
+    assert third.run({"a": 41}) == 42
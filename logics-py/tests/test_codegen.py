@@ -0,0 +1,56 @@
+import pytest
+from logics import Logics, codegen
+from logics.fastparser import LogicsFastParser
+
+
+@pytest.mark.parametrize(
+    "src",
+    [
+        "-(2 ** 3) ** -1",
+        "2 ** 3 ** 2",
+        "-2 ** 2",
+        "(1 < 2) + 1",
+        "1 - (2 - 3) - 4",
+        "8 / (4 / 2) // 3 % 2",
+        "not 1 in [1] and (2 or 0)",
+        "(1 if a else 2) if (b if a else a) else 3 if b else 4",
+        "[x * 2 for x in [y for y in l if y] if x > (1 if a else 0)]",
+        "(1, 2, 3)[1] + d['k'][0] + d.k[1]",
+        "'\\'\\x41\\n' 'b' + str(a)",
+    ],
+)
+def test_codegen_precedence(src):
+    values = {"a": 1, "b": 0, "l": [0, 1, 2], "d": {"k": [1, 2]}}
+    assert repr(Logics(src, backend="python").run(dict(values))) == repr(Logics(src, backend="vm").run(values))
+
+
+def test_codegen_cache():
+    codegen.cache.clear()
+    ast = LogicsFastParser().parse("a * 2 + 1")
+
+    first = codegen.compile(ast)
+    second = codegen.compile(LogicsFastParser().parse("a  *  2 + 1"))
+    assert first is not second
+    assert first.__code__ is second.__code__
+    assert codegen.cache.info().hits == 1
+
+
+def test_codegen_sandbox():
+    src = codegen.generate(LogicsFastParser().parse("__import__('os') + a.__class__.__globals__"))
+    assert "__import__(" not in src and ".__class__" not in src
+
+    fn = codegen.compile(LogicsFastParser().parse("a"))
+    assert fn.__globals__["__builtins__"] == {}
+
+    assert Logics("__import__('os')", backend="python").run() == "#ERR:Call to unknown function __import__()"
+    assert Logics("a.__class__.__globals__", backend="python").run({"a": {"x": 1}}).value is None
+
+
+def test_codegen_depth():
+    shallow = LogicsFastParser().parse(" or ".join(["a"] * (codegen.MAX_DEPTH - 2)) + " or 1")
+    assert codegen.depth(shallow) == codegen.MAX_DEPTH and hasattr(codegen.compile(shallow), "__code__")
+
+    # Deeper expressions run as bytecode, beyond the nesting limits of Python
+    for src in (" or ".join(["a"] * 2000) + " or 1", "-(" * 1000 + "1" + ")" * 1000):
+        assert not hasattr(codegen.compile(LogicsFastParser().parse(src)), "__code__")
+        assert Logics(src, backend="python").run() == 1
@@ -0,0 +1,102 @@
+import os
+import pytest
+from logics import Logics
+from logics.diskcache import DiskCache, LazyNode, dump_ast, load_ast
+from logics.fastparser import LogicsFastParser, Node
+from test_parser import corpus, tree
+
+_parser = LogicsFastParser()
+
+
+@pytest.mark.parametrize("src", list(corpus()))
+def test_serialization(src):
+    ast = _parser.parse(src)
+    assert tree(load_ast(dump_ast(ast))) == tree(ast)
+
+
+def test_serialization_unicode():
+    ast = _parser.parse("'äöü €' + \"😀\" + x")
+    assert tree(load_ast(dump_ast(ast))) == tree(ast)
+
+
+def test_lazy_node():
+    ast = _parser.parse("[a, 'b'] + f(1)")
+    data = dump_ast(ast)
+
+    lazy = LazyNode(data)
+    assert dump_ast(lazy) is data  # not loaded to serialize it again
+    assert type(lazy) is LazyNode
+
+    assert lazy.emit == "add"
+    assert type(lazy) is Node
+    assert tree(lazy) == tree(ast)
+
+
+def test_diskcache(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    ast = _parser.parse("a + 1")
+
+    cache.put("a + 1", ast)
+    assert len(cache) == 1
+    assert tree(cache.get("a + 1")) == tree(ast)
+    assert cache.get("a + 2") is None
+
+    cache.flush()
+    cache.close()
+    assert os.listdir(tmp_path) == [os.path.basename(cache.filename)]
+
+    cache = DiskCache(str(tmp_path))
+    assert len(cache) == 1
+    assert tree(cache.get("a + 1")) == tree(ast)
+
+    # Extend an existing pack file
+    cache.put("b * 2", _parser.parse("b * 2"))
+    cache.flush()
+
+    cache = DiskCache(str(tmp_path))
+    assert len(cache) == 2
+    assert tree(cache.get("a + 1")) == tree(ast)
+    assert cache.get("b * 2").emit == "mul"
+
+
+def test_diskcache_invalid(tmp_path):
+    cache = DiskCache(str(tmp_path))
+
+    with open(cache.filename, "wb") as f:
+        f.write(b"this is no cache file")
+
+    cache.load()
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+
+def test_logics_diskcache(tmp_path):
+    Logics.cache.clear()
+    Logics.disk_cache = DiskCache(str(tmp_path))
+
+    try:
+        assert Logics("x * 2").run({"x": 21}) == 42
+        Logics.disk_cache.flush()
+
+        # A fresh process would start with an empty memory cache
+        Logics.cache.clear()
+        Logics.disk_cache = DiskCache(str(tmp_path))
+        assert Logics("x  *  2").run({"x": 21}) == 42
+        assert Logics.cache.info().misses == 2  # the raw and the normalized source
+        assert len(Logics.disk_cache) == 2
+        Logics.disk_cache.flush()
+
+        # The raw source is now found without normalizing it, and its AST loaded on first use
+        Logics.cache.clear()
+        Logics.disk_cache = DiskCache(str(tmp_path))
+        logics = Logics("x  *  2")
+        assert Logics.cache.info().misses == 1
+        assert type(logics.ast) is LazyNode
+        assert logics.run({"x": 21}) == 42
+        assert type(logics.ast) is Node
+        assert Logics("x * 2").ast is not logics.ast
+
+        # Both sources share one record
+        assert len(set(Logics.disk_cache._index.values())) == 1
+    finally:
+        Logics.disk_cache = None
@@ -0,0 +1,110 @@
+import pytest
+from logics import Logics
+from logics.feedback import variables
+from logics.fastparser import LogicsFastParser
+
+
+def test_variables():
+    ast = LogicsFastParser().parse("a + b.c + vars('d') + len([x for x in e]) + x")
+    assert variables(ast) == {"a", "b", "e"}
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS[1:])
+def test_feedback(backend, monkeypatch):
+    monkeypatch.setattr(Logics, "PROFILE_RUNS", 4)
+    monkeypatch.setattr(Logics, "GUARD_FAILURES", 2)
+    monkeypatch.setattr(Logics, "MAX_DEOPTS", 2)
+
+    logics = Logics("a * b + 1", backend=backend)
+
+    for i in range(4):
+        assert logics.run({"a": i, "b": 2}) == i * 2 + 1
+
+    assert logics.feedback.info() == (4, 1, 0, 0)
+    assert logics._code is not logics.feedback  # specialized
+
+    assert logics.run({"a": 3, "b": 2}) == 7
+    assert logics.run({"a": 1.5, "b": 2}) == 4  # guard failure, but no deopt yet
+    assert logics.feedback.info() == (4, 1, 1, 0)
+
+    assert logics.run({"a": 1, "b": 2.5}) == 3.5
+    assert logics.feedback.info() == (4, 1, 2, 1)
+    assert logics._code is logics.feedback  # profiling again
+
+    for i in range(4):
+        assert logics.run({"a": i / 2, "b": 2}) == i + 1
+
+    assert logics.feedback.info() == (8, 2, 2, 1)
+
+    assert logics.run({"a": "x", "b": 2}) == "xx1"
+    assert logics.run({"a": None, "b": 2}) == 1
+    assert logics.feedback.info() == (8, 2, 4, 2)
+    assert logics._code is logics.feedback.generic  # stays generic
+
+    assert logics.run({"a": 3, "b": 2}) == 7
+
+
+def test_feedback_generic(monkeypatch):
+    monkeypatch.setattr(Logics, "PROFILE_RUNS", 2)
+
+    # Nothing to specialize
+    logics = Logics("join(a)")
+    for _ in range(2):
+        assert logics.run({"a": [1, 2]}) == "1, 2"
+
+    assert logics.feedback.info() == (2, 0, 0, 0)
+    assert logics._code is logics.feedback.generic
+
+    # Not used by the reference VM, or with declared types
+    assert Logics("a + 1", backend="vm").feedback is None
+
+    logics = Logics("a + 1", types={"a": int})
+    assert logics.run({"a": 1}) == 2
+    assert logics.feedback is None
+
+    monkeypatch.setattr(Logics, "PROFILE_RUNS", 0)
+    logics = Logics("a + 1")
+    assert logics.run({"a": 1}) == 2
+    assert logics.feedback is None
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS[1:])
+def test_feedback_semantics(backend, monkeypatch):
+    monkeypatch.setattr(Logics, "PROFILE_RUNS", 3)
+    monkeypatch.setattr(Logics, "GUARD_FAILURES", 1)
+
+    values = [1, 2, 3, 0, -4, 2.5, 1.0, True, "7", "x", None, 5, 6, 7, 8, 9.5]
+
+    for src in ("a + b * 2", "a / b - a // b", "a < b <= 5", "-a % b", "a if a > b else b ** 2"):
+        generic = Logics(src, backend="vm")
+        adaptive = Logics(src, backend=backend)
+
+        for a in values:
+            for b in values[:6]:
+                expect = generic.run({"a": a, "b": b})
+                ret = adaptive.run({"a": a, "b": b})
+                assert type(ret.value) is type(expect.value) and ret == expect, (src, a, b)
+
+        assert adaptive.feedback.specializations > 0
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS[1:])
+def test_feedback_chains(backend):
+    # Results stay the same across the specialization, also with in and not in as links of a chain
+    for src, values in (
+        ("x in [1, 2] < 3", {"x": 1}),
+        ("x not in [1, 2] < 3", {"x": 5}),
+        ("a in 'abc' < 1", {"a": "a"}),
+        ("x < y in [y] <= 2", {"x": 1, "y": 2}),
+        ("x not in y > x", {"x": 1.5, "y": 2}),
+        ("i < f <= 3 == s", {"i": 1, "f": 2.5, "s": "3"}),
+        ("i < f <= 3 == s", {"i": 1, "f": 2.5, "s": "x"}),
+    ):
+        expect = Logics(src, backend="vm").run(dict(values))
+        logics = Logics(src, backend=backend)
+
+        for _ in range(2 * Logics.PROFILE_RUNS + 1):
+            ret = logics.run(dict(values))
+            assert type(ret.value) is type(expect.value) and ret == expect, (src, values)
+
+        assert logics.feedback.specializations == 1
@@ -0,0 +1,137 @@
+import itertools
+import pytest
+from logics import Logics, Value
+from logics.fastparser import LogicsFastParser
+from logics.inference import infer
+
+TYPES = {"i": int, "j": int, "f": float, "g": float, "b": bool, "s": str}
+
+
+def specialized(src, types=TYPES, functions=Logics.FUNCTIONS):
+    """
+    Returns the emits of all specialized operations of src, with their specialization.
+    """
+    stack = [infer(LogicsFastParser().parse(src), types, functions)]
+    ret = []
+
+    while stack:
+        node = stack.pop()
+        stack.extend(reversed(node.children))
+        if node.emit not in ("Identifier", "Number", "String") and node.match:
+            ret.append(f"{node.emit}:{node.match}")
+
+    return ret
+
+
+@pytest.mark.parametrize(
+    "src,expect",
+    [
+        ("i + j * 2", ["mul:int"]),  # may return an error string, when too large
+        ("i + j - 2", ["sub:int", "add:int"]),
+        ("i + f", ["add:number"]),
+        ("f * 2 - b", ["mul:number"]),
+        ("f - 2 + b", ["add:number", "sub:number"]),
+        ("i // j + f / g", ["idiv:int", "div:number"]),  # both may return an error string
+        ("'x' + i", ["add:str"]),
+        ("s + i", []),  # a str may be aligned to a number
+        ("str(s) + i", ["add:str"]),
+        ("len(s) * i", ["mul:int"]),
+        ("len(s, 1) * i", []),
+        ("-i + ~b", ["add:int", "neg:int", "invert:int"]),
+        ("-f", ["neg:number"]),
+        ("i < f <= 3 == s", ["lt:value", "lteq:value", "eq:value"]),
+        ("s < i", []),
+        ("i in s < 1", []),  # links of a chain pass on their operand, not a bool
+        ("s in f < 3", ["lt:value"]),
+        ("i < f not in s", ["lt:value"]),
+        ("(i if b else j) + (f or 1)", ["add:number"]),
+        ("(i if b else x) + 1", []),
+        ("x + 1", []),
+        ("[i for i in s] + i", []),  # assigned by a comprehension
+        ("i * 2 if b and i > 0 else 0", ["mul:int", "gt:value"]),
+    ],
+)
+def test_infer(src, expect):
+    assert specialized(src) == expect
+
+
+def test_infer_fallback():
+    assert specialized("i + j", types={}) == []
+    assert specialized("len(s) * i", functions=()) == []
+
+    logics = Logics("i + j", types={"i": int, "j": int})
+    assert logics.run({"i": 1, "j": 2}) == 3
+
+    # A replaced function has no known return type
+    logics = Logics("len(s) + 1", types=TYPES)
+    logics.functions["len"] = lambda value: "x"
+    assert logics.run({"s": "abc"}) == "x1"
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
+def test_infer_guards(backend):
+    # Values of other types than declared, like missing variables, run the generic code
+    types = {"price": float, "a": int, "b": int, "l": list}
+    for src in ("price + 1", "price - 1", "-price", "price < 3", "a / b", "a * b + 1", "len(l) + a"):
+        expect = Logics(src, backend="vm").run({})
+        logics = Logics(src, backend=backend, types=types)
+
+        assert logics.run({}) == expect, src
+        assert logics.run({"price": None, "a": None, "b": None, "l": None}) == expect, src
+        assert logics.run({"price": "x", "a": True, "b": "2", "l": "abc"}) == Logics(src, backend="vm").run(
+            {"price": "x", "a": True, "b": "2", "l": "abc"}
+        ), src
+
+    # Values of the declared types, also wrapped, run the specialized code
+    logics = Logics("price * a + len(l)", backend=backend, types=types)
+    assert logics.run({"price": 1.5, "a": 2, "l": [1]}) == 4.0
+    assert logics.run({"price": Value(2), "a": Value(3), "l": Value([1, 2])}) == 8
+
+
+SOURCES = [
+    "i + j",
+    "i - j * 3",
+    "i * f + g",
+    "f - g - 0.5",
+    "i / j",
+    "f / g",
+    "i // j",
+    "i % j",
+    "f % g",
+    "i ** 2 + f ** 2",
+    "(j + 1) ** -1",
+    "-i + +f - ~b",
+    "b + b * i",
+    "'x' + i + 'y' + f",
+    "str(s) + i",
+    "len(s) * i + 1",
+    "i < j <= f > g",
+    "i == f != s",
+    "s < 'zzz'",
+    "i in [1, 2] < 3",
+    "f not in [i] <= g",
+    "s in 'abc12' == i",
+    "i < f in [f, g] > g",
+    "i * 2 if b and i > 0 else f / 2",
+    "(i or f) * 2 - (b and j)",
+]
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
+@pytest.mark.parametrize("optimize", (False, True))
+def test_inference_semantics(backend, optimize):
+    values = [
+        {"i": i, "j": j, "f": f, "g": g, "b": b, "s": s}
+        for i, j, f, g, b, s in itertools.product(
+            (0, 3, -7), (0, 2), (0.0, 2.5, -1.5), (0.0, 4.0, 0.75), (False, True), ("", "abc", "12")
+        )
+    ]
+
+    for src in SOURCES:
+        generic = Logics(src, backend="vm", optimize=False)
+        typed = Logics(src, backend=backend, optimize=optimize, types=TYPES)
+
+        for vals in values:
+            expect = generic.run(dict(vals))
+            ret = typed.run(dict(vals))
+            assert type(ret.value) is type(expect.value) and ret == expect, (src, vals)
@@ -1,10 +1,11 @@
-import glob, os
+import glob, os, sys
 import pytest
-from logics import Logics
+from logics import Logics, Value
 
 
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
 @pytest.mark.parametrize("input", glob.glob("../tests/*.lgx"))
-def test_testcase(input):
+def test_testcase(input, backend):
     input = open(input, "r").read()
     variables = {}
     last_line = last_result = None
@@ -31,9 +32,237 @@ def test_testcase(input):
             elif action == "set":
                 var = cmd[1]
                 value = cmd[2]
-                variables[var] = Logics(value).run(variables)
+                variables[var] = Logics(value, backend=backend).run(variables)
         else:
-            last_result = Logics(line).run(variables)
+            last_result = Logics(line, backend=backend).run(variables)
             last_line = line
 
     assert last_result is None, f"{last_result=} unverified"
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_compile_many(workers):
+    from logics.parser import LogicsParseException
+
+    Logics.cache.clear()
+
+    sources = ["a + 1", "a  +  1", "1 +", "a * 2", "'x' * 3", "[1,\n 2 3]", "a + 1"] * 3
+    compiled = Logics.compile_many(sources, workers=workers, chunksize=2)
+
+    assert len(compiled) == len(sources)
+    assert compiled[0].ast is compiled[1].ast is compiled[6].ast
+    assert compiled[0] is not compiled[1]
+    assert [logics.run({"a": 3}) for logics in compiled[:2]] == [4, 4]
+    assert compiled[3].run({"a": 3}) == 6
+    assert compiled[4].run() == "xxx"
+
+    assert isinstance(compiled[2], LogicsParseException)
+    assert (compiled[2].row, compiled[2].col) == (1, 4)
+    assert isinstance(compiled[5], LogicsParseException)
+    assert (compiled[5].row, compiled[5].col) == (2, 3)
+
+
+def run_all(backend, optimize=True):
+    """
+    Runs the whole corpus with one set of values, as reprs or exception types.
+    """
+    from logics.parser import LogicsParseException
+    from test_parser import corpus
+
+    values = {"a": 3, "b": "x", "l": [1, "2", 3.5], "d": {"k": [1, 2]}}
+    ret = []
+
+    for src in corpus():
+        try:
+            logics = Logics(src, backend=backend, optimize=optimize)
+        except LogicsParseException:
+            continue
+
+        try:
+            ret.append(repr(logics.run(values)))
+        except Exception as e:
+            ret.append(type(e))
+
+    return ret
+
+
+@pytest.mark.parametrize("optimize", [False, True])
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
+def test_backend_corpus(backend, optimize):
+    assert run_all(backend, optimize) == run_all("vm", optimize=False)
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
+def test_backend_semantics(backend, monkeypatch):
+    assert Logics("'a' 'b' \"1\" '2'", backend=backend).run() == "ab12"
+    assert Logics("[1, 2, 3][:2] + 1", backend=backend).run() == 3
+    assert Logics("x if a < b < c else y", backend=backend).run({"a": 1, "b": 2, "c": 3, "x": "x"}) == "x"
+    assert Logics("vars()", backend=backend).run({"a": 1}) == {"a": 1}
+    assert Logics("vars('a') + foo()", backend=backend).run({"a": 1}) == "1#ERR:Call to unknown function foo()"
+
+    monkeypatch.setattr(Logics, "MAX_FOR_ITERATIONS", 5)
+    values = {}
+    assert Logics("[x * 2 for x in range(10) if x % 2]", backend=backend).run(values) == [2, 6]
+    assert values == {"x": 4}
+
+
+def constructed(fn, *args) -> tuple[int, object]:
+    """
+    Returns the number of objects constructed by object.__new__(), like all Values, during a call, and its result.
+    """
+    count = 0
+    new = object.__new__
+
+    def profile(frame, event, arg):
+        nonlocal count
+        if event == "c_call" and arg is new:
+            count += 1
+
+    sys.setprofile(profile)
+    try:
+        ret = fn(*args)
+    finally:
+        sys.setprofile(None)
+
+    return count, ret
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
+def test_allocations(backend):
+    size = 100
+    assert constructed(lambda: [Value(i) for i in range(1000, 1000 + size)])[0] == size
+
+    values = {"l": Value(list(range(1000, 1000 + size)))}
+    for src, operators in (
+        ("[x * 2 + 1 for x in l]", 2),
+        ("[x * 2 + 1 - 3 * x for x in l]", 4),
+        ("[-x + x * x // 7 for x in l if x > 0]", 4),
+    ):
+        logics = Logics(src, backend=backend)
+        expect = logics.run(dict(values))
+
+        # Every run wraps the item once and constructs one Value per operation, plus the result list;
+        # the vm converts its literals on every evaluation as well
+        count, ret = constructed(logics.run, dict(values))
+        assert ret == expect
+        assert count <= size * (operators + 1) * (3 if backend == "vm" else 1) + 1, (src, count)
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
+def test_wrappers_reused(backend):
+    item = Value(5)
+    values = {"x": item, "l": Value([item]), "d": {"k": item}}
+
+    for src in ("x", "l[0]", "d.k", "(x or 1)", "[x for x in l][0]"):
+        assert Logics(src, backend=backend).run(dict(values)) is item, src
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
+def test_containers_shared(backend):
+    rows = [{"id": i, "name": f"row{i}"} for i in range(1000)]
+
+    logics = Logics("rows", backend=backend)
+    assert logics.run({"rows": rows}).value.host is rows
+
+    logics = Logics("rows[500].name + len(rows)", backend=backend)
+    assert logics.run({"rows": rows}) == "row5001000"
+
+    # vars() is a snapshot, although comprehensions assign into the variables
+    assert repr(Logics("[vars() for x in [1, 2]]", backend=backend).run()) == '[{"x": 1}, {"x": 2}]'
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
+def test_membership(backend):
+    zips = Value([f"{i:05}" for i in range(0, 10000, 3)])
+    values = {"zips": zips}
+
+    for src, expect in (
+        ("zip in zips", [True, False, False]),
+        ("zip not in zips", [False, True, True]),
+        ("'00000' < zip in zips", [True, False, False]),
+        ("[z for z in [zip, '00001'] if z in zips]", [["00003"], [], []]),
+    ):
+        logics = Logics(src, backend=backend)
+        for code, expect in zip(("00003", "00004", None), expect):
+            assert logics.run(dict(values, zip=code)) == expect, (src, code)
+
+    assert zips.value.members is not None  # kept by the Value, across runs
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
+@pytest.mark.parametrize("optimize", (False, True))
+def test_concatenation(backend, optimize):
+    values = {"a": 1, "b": "2", "c": "x", "d": 1.5, "e": None, "l": ["a", "b"], "s": "y" * 20000}
+
+    for src in (
+        "a + b + c + d + e",
+        "b + a + a + 'x'",
+        "'1.' + a + 1",
+        "c + s + s + c",
+        "s + s + 'x' + s + a",
+        "join([c + s for _ in range(3)], '') + '!'",
+        "join([c + a + b for a in l], '-')",
+    ):
+        expect = Logics(src, backend="vm", optimize=False).run(dict(values))
+        assert Logics(src, backend=backend, optimize=optimize).run(dict(values)) == expect, src
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
+@pytest.mark.parametrize("optimize", (False, True))
+def test_int_bits(backend, optimize):
+    error = "#ERR:integer too large"
+    assert Logics("7 ** 99999999999", backend=backend, optimize=optimize).run() == error
+    assert Logics("(9 ** 9 ** 9) ** 99", backend=backend, optimize=optimize).run() == error
+    assert Logics("(2 ** 4000) * (2 ** 4000)", backend=backend, optimize=optimize).run() == error
+
+    for types in (None, {"x": int}):
+        logics = Logics("[x ** 3, x * x * x]", backend=backend, optimize=optimize, types=types)
+        assert logics.run({"x": 2**1000}) == [2**3000, 2**3000]
+
+        logics.MAX_INT_BITS = 2500  # per instance
+        assert logics.run({"x": 2**1000}) == [error, error]
+        assert logics.run({"x": 2**800}) == [2**2400, 2**2400]
+
+        logics.MAX_INT_BITS = 2401  # exactly the bits of the results
+        assert logics.run({"x": 2**800}) == [2**2400, 2**2400]
+        logics.MAX_INT_BITS = 2400
+        assert logics.run({"x": 2**800}) == [error, error]
+        assert Logics("x ** 3", backend=backend, optimize=optimize, types=types).run({"x": 2**1000}) == 2**3000
+
+    # Within a frame of common subexpressions
+    logics = Logics("[x * x, x * x]", backend=backend, optimize=optimize)
+    logics.MAX_INT_BITS = 64
+    assert logics.run({"x": 2**40}) == [error, error]
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
+@pytest.mark.parametrize("optimize", (False, True))
+def test_depth(backend, optimize):
+    # Nesting levels the original vm runs within the default recursion limit
+    for src, expect in (
+        (" or ".join(["a"] * 900) + " or 1", 1),
+        (" - ".join(["1"] * 900), -898),
+        ("-" * 900 + "a", 0),
+        ("a if a else " * 900 + "2", 2),
+        ("(" * 900 + "a" + " < 1)" * 900, False),
+        ("str(" * 450 + "a" + ")" * 450, "None"),
+        ("l[" * 450 + "0" + "]" * 450, 0),
+    ):
+        assert Logics(src, backend=backend, optimize=optimize).run({"l": [0]}) == expect, src[:20]
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
+@pytest.mark.parametrize("optimize", (False, True))
+def test_comparison_items(backend, optimize):
+    # A comparison chain leaves only its result, also within lists and call arguments
+    for src, expect in (
+        ("[5, 1 < a]", [5, True]),
+        ("[5, 1 < a < 3, 4]", [5, True, 4]),
+        ("[5, a in [2], a not in [3], 'x']", [5, True, True, "x"]),
+        ("[5, 3 < a]", [5, False]),
+        ("join([5, 1 < a], '-')", "5-True"),
+        ("len([1, 1 < a <= 2, [2 < a, a == 2]])", 3),
+        ("[x < a for x in [1, 2, 3]]", [True, False, False]),
+        ("[5, 1 < a] == [5, True]", True),
+    ):
+        assert Logics(src, backend=backend, optimize=optimize).run({"a": 2}) == expect, src
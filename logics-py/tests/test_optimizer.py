@@ -0,0 +1,153 @@
+import pytest
+from logics import Logics
+from logics.fastparser import LogicsFastParser
+from logics.optimizer import optimize
+
+
+def folded(src, functions=Logics.FUNCTIONS):
+    return optimize(LogicsFastParser().parse(src), functions)
+
+
+def emits(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        stack.extend(node.children)
+        yield node.emit
+
+
+@pytest.mark.parametrize(
+    "src,expect",
+    [
+        ("60 * 60 * 24", 86400),
+        ("'a' + 'b'", "ab"),
+        ("'1' '2' * 2", 24),
+        ("1 < 2 <= 2 in [2]", True),
+        ("-(2 ** 3) % 5", 2),
+        ("not 1.5", False),
+        ("len([1, 2, 3]) + [4, 5][1]", 8),
+        ("[[1, 2], [3]][0][1]", 2),
+        ("upper('x')", "X"),
+        ("range(5)", (0, 1, 2, 3, 4)),
+        ("sum(range(5)) // 0", "#ERR:division by zero"),
+        ("range()", "#ERR:Invalid call to range()"),
+        ("0 and a", 0),
+        ("'' or 'x' or a", "x"),
+        ("1 if 'yes' else a", 1),
+    ],
+)
+def test_fold(src, expect):
+    node = folded(src)
+    assert node.emit == "const"
+    assert node.match.value == expect
+
+
+@pytest.mark.parametrize(
+    "src,expect",
+    [
+        ("1 and a", "load"),
+        ("0 or a * 2", "mul"),
+        ("a if 0 else 1", "const"),
+        ("[1, 2]", "list"),
+        ("split('a,b')", "call"),
+        ("range(1, 2, 0)", "call"),
+        ("vars()", "call"),
+        ("[x for x in 1]", "comprehension"),
+        ("a + 1 + 2", "add"),
+        ("2 ** 100 + 1", "add"),  # too large to be folded, left to the limit at run time
+    ],
+)
+def test_partial_fold(src, expect):
+    node = folded(src)
+    assert node.emit == expect
+    assert not {"Number", "String", "True", "False", "None", "strings"} & set(emits(node))
+
+
+def test_fold_identical():
+    # Folded results are shared, but bit-identical to the unoptimized ones
+    for src in ("0.1 + 0.2", "'x' * 40000", "2 ** 0.5", "1 / 3", "str(1.0)", "round(2.675, 2)"):
+        assert repr(Logics(src).run()) == repr(Logics(src, backend="vm", optimize=False).run())
+
+    with pytest.raises(ValueError):
+        Logics("range(1, 2, 0)").run()
+
+
+def test_fold_pure_functions():
+    assert folded("upper('x')", {}).emit == "call"
+
+    logics = Logics("upper('x')")
+    logics.functions["upper"] = lambda value: "custom"
+    assert logics.run() == "custom"
+
+    class CustomLogics(Logics):
+        FUNCTIONS = dict(Logics.FUNCTIONS, double=lambda value: int(value) * 2)
+        PURE_FUNCTIONS = Logics.PURE_FUNCTIONS | {"double"}
+
+    assert CustomLogics("double(21)").run() == 42
+    assert folded("double(21)", CustomLogics.FUNCTIONS).emit == "const"
+
+
+def cse_logics(calls):
+    def slow(value):
+        calls.append(value)
+        return int(value) * 2
+
+    class CountingLogics(Logics):
+        FUNCTIONS = dict(Logics.FUNCTIONS, slow=slow, impure=slow)
+        PURE_FUNCTIONS = Logics.PURE_FUNCTIONS | {"slow"}
+
+    return CountingLogics
+
+
+@pytest.mark.parametrize("backend", Logics.BACKENDS)
+def test_cse(backend):
+    calls = []
+    CountingLogics = cse_logics(calls)
+
+    src = "sum([slow(x.price) for x in items]) > 10 and sum([slow(x.price) for x in items]) < 50"
+    values = {"items": [{"price": 1}, {"price": 2}, {"price": 3}]}
+    assert CountingLogics(src, backend=backend).run(values) is not None
+    assert calls == [1, 2, 3]
+    assert values["x"] == {"price": 3}
+
+    # Once per run, also when the first occurrence is skipped
+    calls.clear()
+    logics = CountingLogics("(a and slow(b)) + slow(b) + impure(b) + impure(b)", backend=backend)
+    assert logics.run({"a": 0, "b": 2}) == 12
+    assert logics.run({"a": 1, "b": 3}) == 24
+    assert calls == [2, 2, 2, 3, 3, 3]
+
+
+@pytest.mark.parametrize(
+    "src",
+    [
+        "len(l) + [len(l) for x in l][0] + len(l)",
+        "len(x) + len([x for x in l]) + len(x)",
+        "join([x for x in l]) + join([x for x in m]) + join([x for x in l]) + x",
+        "join([join([len(x) for x in l]) for y in m]) + join([len(x) for x in l]) + x + y",
+        "len(vars()) + len([x for x in l]) + len(vars())",
+    ],
+)
+def test_cse_scoping(src):
+    optimized = {"l": ["a", "bb"], "m": ["ccc"], "x": "xxxx"}
+    plain = dict(optimized)
+
+    assert repr(Logics(src).run(optimized)) == repr(Logics(src, backend="vm", optimize=False).run(plain))
+    assert optimized == plain
+
+
+def test_cse_nodes():
+    ast = folded("len(a) * len(a) + [len(x) for x in a] + [len(x) for x in a] + [len(x) for x in b] + vars() + vars()")
+    assert ast.emit == "frame"
+
+    common = {}
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        stack.extend(node.children)
+        if node.emit == "cse":
+            common[node.match] = node.children[0].emit
+
+    # Neither len(x) nor the comprehensions, because another one assigns x, nor vars()
+    assert sorted(common.values()) == ["call"]
+    assert ast.match == 1
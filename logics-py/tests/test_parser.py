@@ -0,0 +1,142 @@
+import glob
+import os
+import random
+import subprocess
+import sys
+import pytest
+from logics.parser import LogicsParser, LogicsParseException
+from logics.fastparser import LogicsFastParser
+
+
+def corpus():
+    """
+    Yields all expressions from the shared lgx test cases.
+    """
+    for filename in sorted(glob.glob("../tests/**/*.lgx", recursive=True)):
+        for line in open(filename, "r").read().splitlines():
+            line = line.strip()
+
+            if not line:
+                continue
+            elif line[0] == "#":
+                cmd = line[1:].split(":", 2)
+                if cmd[0].lower() == "set" and len(cmd) == 3:
+                    yield cmd[2]
+            else:
+                yield line
+
+
+def tree(node):
+    """
+    Turns an AST into comparable tuples.
+    """
+    if isinstance(node, list):
+        return [tree(child) for child in node]
+
+    return node.emit, node.match, [tree(child) for child in node.children]
+
+
+def parse(parser, src):
+    try:
+        return tree(parser.parse(src))
+    except LogicsParseException as e:
+        return "error", e.row, e.col, str(e)
+
+
+_reference = LogicsParser()
+
+
+@pytest.mark.parametrize("src", list(corpus()))
+@pytest.mark.parametrize("lexer", ["regex", "dfa"])
+def test_fastparser_corpus(src, lexer):
+    assert parse(LogicsFastParser(lexer), src) == parse(_reference, src)
+
+
+@pytest.mark.parametrize(
+    "src",
+    [
+        "",
+        "1 +",
+        "(1, 2",
+        "a.\n  b .",
+        "x if y",
+        "[1, 2 3]",
+        "1 ! 2",
+        "# comment only\n",
+        "1 # trailing comment",
+        "'unterminated",
+        "[\n  1,\n  2,\n  3 4\n]",
+        "a +\n\n\t* b",
+        "x # comment\n\n  y",
+    ],
+)
+@pytest.mark.parametrize("lexer", ["regex", "dfa"])
+def test_fastparser_errors(src, lexer):
+    assert parse(LogicsFastParser(lexer), src) == parse(_reference, src)
+
+
+def test_regex_lexer_fuzz():
+    """
+    The regex lexer must produce the same results as the DFA lexer on arbitrary input.
+    """
+    rnd = random.Random(1337)
+    atoms = [
+        *"abcxyz_019.,:()[]+-*/%~<>=!#\"'\\ \t\n",
+        "**",
+        "//",
+        "<>",
+        "!=",
+        "not",
+        "in",
+        "and",
+        "or",
+        "if",
+        "else",
+        "for",
+        "True",
+        "None",
+        "format",
+        "1.5",
+    ]
+    dfa = LogicsFastParser("dfa")
+    regex = LogicsFastParser("regex")
+
+    for _ in range(3000):
+        src = "".join(rnd.choice(atoms) for _ in range(rnd.randint(1, 12)))
+        assert parse(regex, src) == parse(dfa, src), src
+
+
+def test_fastparser_large_input():
+    src = "[" + ", ".join(str(i) for i in range(100_000)) + "]"
+    node = LogicsFastParser().parse(src)
+    assert node.emit == "list"
+    assert len(node.children) == 100_000
+
+    with pytest.raises(LogicsParseException) as e:
+        LogicsFastParser().parse(src[:-1] + "\n+\n  ]")
+
+    assert (e.value.row, e.value.col) == (3, 2)
+
+
+def test_tables_uptodate():
+    """
+    _tables.py must be regenerated with `python -m logics.tables` whenever parser.py changes.
+    """
+    from logics import _tables, tables
+
+    assert _tables.SYMBOLS == LogicsParser._symbols
+    assert _tables.PRODUCTIONS == tuple(prod[1:] for prod in LogicsParser._productions)
+    assert tables.unpack_states(_tables.ACT) == LogicsParser._act
+    assert tables.unpack_states(_tables.GO) == LogicsParser._go
+    assert tuple(tables.unpack(_tables.DEF_PROD)) == LogicsParser._def_prod
+
+
+def test_lazy_import():
+    code = "import sys, logics; assert logics.Logics('1 + 2').run() == 3; print('logics.parser' in sys.modules)"
+    assert subprocess.check_output([sys.executable, "-c", code], text=True).strip() == "False"
+
+
+def test_node_compact():
+    node = LogicsFastParser().parse("1 + 2")
+    assert not hasattr(node, "__dict__")
+    assert node.children[0].children is node.children[1].children == ()
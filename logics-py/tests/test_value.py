@@ -1,4 +1,8 @@
+import copy, pickle, sys, threading
+import pytest
 from logics import Value
+from logics.value import attribute, concat, parse_float, parse_int
+from logics import value as value_module
 
 
 def test_conversion():
@@ -9,6 +13,40 @@ def test_conversion():
     assert repr(Value("4112", optimize=True)) == "4112"
 
 
+@pytest.mark.parametrize(
+    "value,expect_int,expect_float",
+    [
+        ("42", 42, 42.0),
+        ("  -7.5kg", -7, -7.5),
+        ("+3", 3, 3.0),
+        (".5", 0, 0.5),
+        ("1.2.3", 1, 1.2),
+        ("1e5", 1, 1.0),
+        ("5-3", 0, 0.0),
+        ("--1", 0, 0.0),
+        ("abc", 0, 0.0),
+        ("", 0, 0.0),
+        (None, 0, 0.0),
+        (12.9, 12, 12.9),
+        ("9" * 100, int("9" * 100), float("9" * 100)),
+    ],
+)
+def test_parse(value, expect_int, expect_float):
+    for _ in range(2):  # memoized
+        assert parse_int(value) == expect_int and type(parse_int(value)) is int
+        assert parse_float(value) == expect_float and type(parse_float(value)) is float
+
+    assert parse_int("x", None) is None and parse_float("x", None) is None
+
+
+def test_align_str():
+    assert Value("42").type() == "int" and Value("-4.5").type() == "float" and Value("3.0") == 3
+    assert Value("042").type() == "str" and Value("+4").type() == "str" and Value(" 4").type() == "str"
+    assert Value("4e2").type() == "str" and Value("4.50").type() == "str"
+    assert Value("42", optimize=False).type() == "str"
+    assert Value("abc") + 1 == "abc1" and Value("5x") * 2 == "5x5x" and Value("5x") - 2 == 3
+
+
 def test_none():
     none = Value(None)
     assert none == None
@@ -50,3 +88,233 @@ def test_float():
     assert float(Value(" -123.4 xfx")) == -123.4
     assert repr(_1234) == "123.4"
     assert repr(-_1234) == "-123.4"
+
+
+def test_singletons():
+    assert Value(None) is Value() is Value(Value(None))
+    assert Value(True) is Value(True) and Value(False) is Value("False" == "x")
+    assert Value("") is Value("")
+    assert Value(1) is Value("1") is Value(1.0) is Value(Value(1))
+    assert Value(1000) is not Value(1000)
+    assert Value(True) is not Value(1) and Value(True).type() == "bool"
+
+    # Values are slotted, and copies are never singletons
+    assert not hasattr(Value(1), "__dict__")
+    assert copy.copy(Value(1)) is not Value(1)
+    assert pickle.loads(pickle.dumps(Value(None))) == None
+    assert Value(None).value is None
+
+
+@pytest.mark.parametrize(
+    "value,name",
+    [
+        (None, "NoneType"),
+        (True, "bool"),
+        (1, "int"),
+        (1.5, "float"),
+        ("x", "str"),
+        ([1], "list"),
+        ((1,), "list"),
+        ({"a": 1}, "dict"),
+        (range(2), "str"),
+    ],
+)
+def test_type(value, name):
+    assert Value(value).type() == name
+
+
+def test_containers_lazy():
+    rows = [{"id": i, "tags": ["a", str(i)]} for i in range(1000)]
+    value = Value(rows)
+
+    # The host list is not copied, and its items are wrapped on access
+    assert value.value.host is rows
+    assert len(value) == 1000
+    assert value[10].value.host is rows[10]
+    assert value[10]["tags"][1] == 10 and value[-1]["id"] == 999
+    assert value[10] is not value[10]
+    assert value[1:3] == [{"id": 1, "tags": ["a", 1]}, {"id": 2, "tags": ["a", 2]}]
+
+    # Comparisons and representation are those of wrapped containers
+    assert Value([1, "2", [3.0]]) == Value([1, 2, [3]])
+    assert Value([1, 2]) != Value((1, 2))
+    assert Value([1, 2]) < Value([1, 3])
+    assert repr(Value([None, "x", {"a": 1.5}])) == '[None, "x", {"a": 1.5}]'
+    assert 2 in Value([1, "2"]) and "3" not in Value([1, "2"])
+    assert list(Value(["1", 2.0])) == [1, 2] and all(isinstance(item, Value) for item in Value([1, 2]))
+
+    # Keys are aligned, and colliding keys keep the last value
+    value = Value({"a": 1, "1": "x", 2.0: "y"})
+    assert value["a"] == 1 and value[1] == "x" and value[2] == "y" and value["2"] is None
+    assert value.value.get("b") is None and "a" in value and 2 in value
+    assert list(value) == ["a", 1, 2] and len(value) == 3
+    assert repr(Value({1: "a", "1": "b"})) == '{1: "b"}'
+
+
+def test_containers_cached(monkeypatch):
+    monkeypatch.setattr(value_module, "CACHE_WRAPPERS", True)
+
+    value = Value([{"a": [1]}, 2])
+    assert value[0] is value[0] is value[-2]
+    assert value[0]["a"] is value[0]["a"]
+    assert list(value)[0] is value[0]
+    assert value == [{"a": [1]}, 2]
+
+
+def shared(test, threads=4, rounds=5):
+    """
+    Returns the results of test() run concurrently by threads, with frequent thread switches.
+    """
+    results = []
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+
+    try:
+        for _ in range(rounds):
+            barrier = threading.Barrier(threads)
+
+            def run():
+                barrier.wait()
+                results.append(test())
+
+            workers = [threading.Thread(target=run) for _ in range(threads)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    return results
+
+
+def test_attribute():
+    value = Value({"name": "x", "1": "y", "nested": {"a": [1]}})
+    assert attribute(value, "name") == "x"
+    assert attribute(attribute(value, "nested"), "a") == [1]
+    assert attribute(value, "missing") is Value(None)
+    assert attribute(Value("abc"), "x") is Value(None)
+    assert attribute(Value([1]), "x") is Value(None)
+    assert value.value.index is None  # attributes need no index
+
+    # Other keys are looked up in an index of native keys
+    assert value[1] == "y" and value[Value(1.0)] == "y"
+    assert value.value.index == {"name": "name", 1: "1", "nested": "nested"}
+
+
+def test_attribute_index_threads():
+    items = {i: i for i in range(100_000)}
+
+    def test():
+        return value[99999] == 99999
+
+    for _ in range(2):
+        value = Value(items)
+        assert all(shared(test, rounds=1))
+
+
+@pytest.mark.parametrize(
+    "a,b,expect",
+    [
+        # a + b, a - b, a * b, a / b, a // b, a % b, a < b
+        (7, 2, (9, 5, 14, 3.5, 3, 1, False)),
+        (-7, 2, (-5, -9, -14, -3.5, -4, 1, True)),
+        (6, 3, (9, 3, 18, 2, 2, 0, False)),
+        (7.5, 2.5, (10, 5, 18.75, 3, 3, 0, False)),
+        (7.5, 2, (9.5, 5.5, 15, 3.75, 3, 1.5, False)),
+        (1.5, 0.5, (2, 1, 0.75, 3, "#ERR:division by zero", 0, False)),  # // truncates floats to ints
+        (7, 0, (7, 7, 0, "#ERR:division by zero", "#ERR:division by zero", "#ERR:modulo by zero", False)),
+        (7.5, 0.0, (7.5, 7.5, 0, "#ERR:division by zero", "#ERR:division by zero", "#ERR:modulo by zero", False)),
+        (2**70, 2**69, (3 * 2**69, 2**69, 2**139, 2, 2, 0, False)),
+    ],
+)
+def test_arithmetic(a, b, expect):
+    a, b = Value(a), Value(b)
+    ret = (a + b, a - b, a * b, a / b, a // b, a % b, a < b)
+
+    for value, expect in zip(ret, expect):
+        if isinstance(value, Value):
+            assert value.value == expect and value.type() == Value(expect).type()
+        else:
+            assert value is expect
+
+    assert (a <= b, a > b, a >= b) == (not a > b, not a <= b, not a < b)
+
+
+def test_contains_index():
+    zips = Value([f"{i:05}" for i in range(1000)] + [12345, "abc", [1, 2], {"a": 1}, None])
+
+    assert "00042" in zips and Value("00999") in zips and "01000" not in zips
+    members = zips.value.members
+    assert members is not None  # built once
+    assert 12345 in zips and "12345" in zips and 12345.0 in zips and "abc" in zips and None in zips
+    assert [1, 2] in zips and Value([1, "2"]) in zips and [2, 1] not in zips and {"a": 1} in zips
+    assert zips.value.members is members
+
+    # Short lists are scanned
+    short = Value([1, "2", [3]])
+    assert 2 in short and [3] in short and 4 not in short
+    assert short.value.members is None
+
+
+def test_contains_index_threads():
+    values = [str(i) for i in range(100_000)]
+
+    def test():
+        return "99999" in zips
+
+    for _ in range(2):
+        zips = Value(values)
+        assert all(shared(test, rounds=1))
+
+
+def test_concat(monkeypatch):
+    monkeypatch.setattr(value_module, "MAX_STRING_LENGTH", 10)
+    monkeypatch.setattr(value_module, "_ERR_MAX_STRING_LENGTH", "#ERR")
+    values = [Value(value) for value in (1, 2, "3", 4.5, "x", None, [1])]
+
+    assert concat(*values[:6]) == "10.5xNone"  # numbers are added first
+    assert concat(*values) == "#ERR"
+    assert concat(*values, Value("!")) == "#ERR!"
+    assert concat(Value("1."), Value("5"), Value(1)) == 2.5  # "1.5" became a number
+    assert concat(Value(1), Value(2)) == 3
+
+    assert Value("x" * 6) + Value("y" * 5) == "#ERR"
+    assert value_module.join(["ab", "cd", "ef"], " - ") == "#ERR"
+    assert value_module.join(["ab", "cd", "ef"], ",") == "ab,cd,ef"
+    assert value_module.join([], ",") == ""
+
+
+def test_int_bits(monkeypatch):
+    error = "#ERR:integer too large"
+    assert Value(2).power(Value(99), 100) == 2**99
+    assert Value(2).power(Value(100), 100) == error
+    assert Value(-3).power(Value(10**400), 100) == error
+    assert Value(1).power(Value(10**400), 100) == 1
+    assert Value(-1).power(Value(10**400 + 1), 100) == -1
+    assert Value(2).power(Value(-200), 100) == 2**-200
+    assert Value(2.5).power(Value(200), 100) == 2.5**200
+
+    big = Value(2**60)
+    assert big.multiply(big, 121) == 2**120
+    assert big.multiply(big, 120) == error
+    assert big.multiply(Value("3"), 62) == 3 * 2**60
+    assert big.multiply(Value("3"), 61) == error
+    assert big.multiply(Value(True), 61) == 2**60
+    assert big.multiply(Value(0.5), 10) == 2.0**59
+
+    # Both allow results of exactly limit bits
+    for limit in (64, 100, 257):
+        for a in (2, 3, -3, 7, 10, 255, 256, 2**40 - 1, 2**40, -(2**33) + 5):
+            for b in range(2, limit + 2):
+                expect = a ** b if (a**b).bit_length() <= limit else error
+                assert Value(a).power(Value(b), limit) == expect, (a, b, limit)
+
+            for b in (1, 3, 2**20 - 1, 2**20, 2 ** (limit // 2), 2 ** (limit - 40) - 1, -(2 ** (limit - 30))):
+                expect = a * b if (a * b).bit_length() <= limit else error
+                assert Value(a).multiply(Value(b), limit) == expect, (a, b, limit)
+                assert Value(b).multiply(Value(a), limit) == expect, (a, b, limit)
+
+    monkeypatch.setattr(value_module, "MAX_INT_BITS", 100)
+    assert Value(2) ** 101 == "#ERR:integer too large"
+    assert big * big == "#ERR:integer too large"